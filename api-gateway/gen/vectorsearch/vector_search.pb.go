@@ -25,6 +25,7 @@ type SearchRequest struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
 	Query         string                 `protobuf:"bytes,1,opt,name=query,proto3" json:"query,omitempty"`
 	K             uint32                 `protobuf:"varint,2,opt,name=k,proto3" json:"k,omitempty"`
+	Filter        *SearchFilter          `protobuf:"bytes,3,opt,name=filter,proto3" json:"filter,omitempty"`
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
@@ -73,6 +74,92 @@ func (x *SearchRequest) GetK() uint32 {
 	return 0
 }
 
+func (x *SearchRequest) GetFilter() *SearchFilter {
+	if x != nil {
+		return x.Filter
+	}
+	return nil
+}
+
+// Restricts results to claims matching every set field. Values within a
+// repeated field are alternatives. Dates are inclusive ISO-8601
+// (YYYY-MM-DD) bounds on the statement date.
+type SearchFilter struct {
+	state             protoimpl.MessageState `protogen:"open.v1"`
+	Verdicts          []string               `protobuf:"bytes,1,rep,name=verdicts,proto3" json:"verdicts,omitempty"`
+	Factcheckers      []string               `protobuf:"bytes,2,rep,name=factcheckers,proto3" json:"factcheckers,omitempty"`
+	StatementSources  []string               `protobuf:"bytes,3,rep,name=statement_sources,json=statementSources,proto3" json:"statement_sources,omitempty"`
+	StatementDateFrom string                 `protobuf:"bytes,4,opt,name=statement_date_from,json=statementDateFrom,proto3" json:"statement_date_from,omitempty"`
+	StatementDateTo   string                 `protobuf:"bytes,5,opt,name=statement_date_to,json=statementDateTo,proto3" json:"statement_date_to,omitempty"`
+	unknownFields     protoimpl.UnknownFields
+	sizeCache         protoimpl.SizeCache
+}
+
+func (x *SearchFilter) Reset() {
+	*x = SearchFilter{}
+	mi := &file_vector_search_proto_msgTypes[1]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *SearchFilter) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SearchFilter) ProtoMessage() {}
+
+func (x *SearchFilter) ProtoReflect() protoreflect.Message {
+	mi := &file_vector_search_proto_msgTypes[1]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SearchFilter.ProtoReflect.Descriptor instead.
+func (*SearchFilter) Descriptor() ([]byte, []int) {
+	return file_vector_search_proto_rawDescGZIP(), []int{1}
+}
+
+func (x *SearchFilter) GetVerdicts() []string {
+	if x != nil {
+		return x.Verdicts
+	}
+	return nil
+}
+
+func (x *SearchFilter) GetFactcheckers() []string {
+	if x != nil {
+		return x.Factcheckers
+	}
+	return nil
+}
+
+func (x *SearchFilter) GetStatementSources() []string {
+	if x != nil {
+		return x.StatementSources
+	}
+	return nil
+}
+
+func (x *SearchFilter) GetStatementDateFrom() string {
+	if x != nil {
+		return x.StatementDateFrom
+	}
+	return ""
+}
+
+func (x *SearchFilter) GetStatementDateTo() string {
+	if x != nil {
+		return x.StatementDateTo
+	}
+	return ""
+}
+
 type SearchResult struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
 	Uid           string                 `protobuf:"bytes,1,opt,name=uid,proto3" json:"uid,omitempty"`
@@ -83,7 +170,7 @@ type SearchResult struct {
 
 func (x *SearchResult) Reset() {
 	*x = SearchResult{}
-	mi := &file_vector_search_proto_msgTypes[1]
+	mi := &file_vector_search_proto_msgTypes[2]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -95,7 +182,7 @@ func (x *SearchResult) String() string {
 func (*SearchResult) ProtoMessage() {}
 
 func (x *SearchResult) ProtoReflect() protoreflect.Message {
-	mi := &file_vector_search_proto_msgTypes[1]
+	mi := &file_vector_search_proto_msgTypes[2]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -108,7 +195,7 @@ func (x *SearchResult) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use SearchResult.ProtoReflect.Descriptor instead.
 func (*SearchResult) Descriptor() ([]byte, []int) {
-	return file_vector_search_proto_rawDescGZIP(), []int{1}
+	return file_vector_search_proto_rawDescGZIP(), []int{2}
 }
 
 func (x *SearchResult) GetUid() string {
@@ -134,7 +221,7 @@ type SearchResponse struct {
 
 func (x *SearchResponse) Reset() {
 	*x = SearchResponse{}
-	mi := &file_vector_search_proto_msgTypes[2]
+	mi := &file_vector_search_proto_msgTypes[3]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -146,7 +233,7 @@ func (x *SearchResponse) String() string {
 func (*SearchResponse) ProtoMessage() {}
 
 func (x *SearchResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_vector_search_proto_msgTypes[2]
+	mi := &file_vector_search_proto_msgTypes[3]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -159,7 +246,7 @@ func (x *SearchResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use SearchResponse.ProtoReflect.Descriptor instead.
 func (*SearchResponse) Descriptor() ([]byte, []int) {
-	return file_vector_search_proto_rawDescGZIP(), []int{2}
+	return file_vector_search_proto_rawDescGZIP(), []int{3}
 }
 
 func (x *SearchResponse) GetResults() []*SearchResult {
@@ -169,21 +256,369 @@ func (x *SearchResponse) GetResults() []*SearchResult {
 	return nil
 }
 
+type BatchSearchRequest struct {
+	state   protoimpl.MessageState `protogen:"open.v1"`
+	Queries []string               `protobuf:"bytes,1,rep,name=queries,proto3" json:"queries,omitempty"`
+	K       uint32                 `protobuf:"varint,2,opt,name=k,proto3" json:"k,omitempty"`
+	// Applied to every query.
+	Filter        *SearchFilter `protobuf:"bytes,3,opt,name=filter,proto3" json:"filter,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *BatchSearchRequest) Reset() {
+	*x = BatchSearchRequest{}
+	mi := &file_vector_search_proto_msgTypes[4]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *BatchSearchRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*BatchSearchRequest) ProtoMessage() {}
+
+func (x *BatchSearchRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_vector_search_proto_msgTypes[4]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use BatchSearchRequest.ProtoReflect.Descriptor instead.
+func (*BatchSearchRequest) Descriptor() ([]byte, []int) {
+	return file_vector_search_proto_rawDescGZIP(), []int{4}
+}
+
+func (x *BatchSearchRequest) GetQueries() []string {
+	if x != nil {
+		return x.Queries
+	}
+	return nil
+}
+
+func (x *BatchSearchRequest) GetK() uint32 {
+	if x != nil {
+		return x.K
+	}
+	return 0
+}
+
+func (x *BatchSearchRequest) GetFilter() *SearchFilter {
+	if x != nil {
+		return x.Filter
+	}
+	return nil
+}
+
+// responses[i] holds the results for queries[i].
+type BatchSearchResponse struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Responses     []*SearchResponse      `protobuf:"bytes,1,rep,name=responses,proto3" json:"responses,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *BatchSearchResponse) Reset() {
+	*x = BatchSearchResponse{}
+	mi := &file_vector_search_proto_msgTypes[5]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *BatchSearchResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*BatchSearchResponse) ProtoMessage() {}
+
+func (x *BatchSearchResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_vector_search_proto_msgTypes[5]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use BatchSearchResponse.ProtoReflect.Descriptor instead.
+func (*BatchSearchResponse) Descriptor() ([]byte, []int) {
+	return file_vector_search_proto_rawDescGZIP(), []int{5}
+}
+
+func (x *BatchSearchResponse) GetResponses() []*SearchResponse {
+	if x != nil {
+		return x.Responses
+	}
+	return nil
+}
+
+type BatchSearchResult struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	QueryIndex    uint32                 `protobuf:"varint,1,opt,name=query_index,json=queryIndex,proto3" json:"query_index,omitempty"`
+	Results       []*SearchResult        `protobuf:"bytes,2,rep,name=results,proto3" json:"results,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *BatchSearchResult) Reset() {
+	*x = BatchSearchResult{}
+	mi := &file_vector_search_proto_msgTypes[6]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *BatchSearchResult) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*BatchSearchResult) ProtoMessage() {}
+
+func (x *BatchSearchResult) ProtoReflect() protoreflect.Message {
+	mi := &file_vector_search_proto_msgTypes[6]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use BatchSearchResult.ProtoReflect.Descriptor instead.
+func (*BatchSearchResult) Descriptor() ([]byte, []int) {
+	return file_vector_search_proto_rawDescGZIP(), []int{6}
+}
+
+func (x *BatchSearchResult) GetQueryIndex() uint32 {
+	if x != nil {
+		return x.QueryIndex
+	}
+	return 0
+}
+
+func (x *BatchSearchResult) GetResults() []*SearchResult {
+	if x != nil {
+		return x.Results
+	}
+	return nil
+}
+
+// `vectors` holds the query vectors row by row, `dim` floats each.
+type VectorSearchRequest struct {
+	state   protoimpl.MessageState `protogen:"open.v1"`
+	Vectors []float32              `protobuf:"fixed32,1,rep,packed,name=vectors,proto3" json:"vectors,omitempty"`
+	Dim     uint32                 `protobuf:"varint,2,opt,name=dim,proto3" json:"dim,omitempty"`
+	K       uint32                 `protobuf:"varint,3,opt,name=k,proto3" json:"k,omitempty"`
+	// Optional filter in the vector store's JSON filter syntax, e.g.
+	// {"verdict": {"$in": ["false"]}}.
+	FilterJson    string `protobuf:"bytes,4,opt,name=filter_json,json=filterJson,proto3" json:"filter_json,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *VectorSearchRequest) Reset() {
+	*x = VectorSearchRequest{}
+	mi := &file_vector_search_proto_msgTypes[7]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *VectorSearchRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*VectorSearchRequest) ProtoMessage() {}
+
+func (x *VectorSearchRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_vector_search_proto_msgTypes[7]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use VectorSearchRequest.ProtoReflect.Descriptor instead.
+func (*VectorSearchRequest) Descriptor() ([]byte, []int) {
+	return file_vector_search_proto_rawDescGZIP(), []int{7}
+}
+
+func (x *VectorSearchRequest) GetVectors() []float32 {
+	if x != nil {
+		return x.Vectors
+	}
+	return nil
+}
+
+func (x *VectorSearchRequest) GetDim() uint32 {
+	if x != nil {
+		return x.Dim
+	}
+	return 0
+}
+
+func (x *VectorSearchRequest) GetK() uint32 {
+	if x != nil {
+		return x.K
+	}
+	return 0
+}
+
+func (x *VectorSearchRequest) GetFilterJson() string {
+	if x != nil {
+		return x.FilterJson
+	}
+	return ""
+}
+
+type IndexInfoRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *IndexInfoRequest) Reset() {
+	*x = IndexInfoRequest{}
+	mi := &file_vector_search_proto_msgTypes[8]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *IndexInfoRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*IndexInfoRequest) ProtoMessage() {}
+
+func (x *IndexInfoRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_vector_search_proto_msgTypes[8]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use IndexInfoRequest.ProtoReflect.Descriptor instead.
+func (*IndexInfoRequest) Descriptor() ([]byte, []int) {
+	return file_vector_search_proto_rawDescGZIP(), []int{8}
+}
+
+type IndexInfoResponse struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Count         uint64                 `protobuf:"varint,1,opt,name=count,proto3" json:"count,omitempty"`
+	Dim           uint32                 `protobuf:"varint,2,opt,name=dim,proto3" json:"dim,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *IndexInfoResponse) Reset() {
+	*x = IndexInfoResponse{}
+	mi := &file_vector_search_proto_msgTypes[9]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *IndexInfoResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*IndexInfoResponse) ProtoMessage() {}
+
+func (x *IndexInfoResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_vector_search_proto_msgTypes[9]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use IndexInfoResponse.ProtoReflect.Descriptor instead.
+func (*IndexInfoResponse) Descriptor() ([]byte, []int) {
+	return file_vector_search_proto_rawDescGZIP(), []int{9}
+}
+
+func (x *IndexInfoResponse) GetCount() uint64 {
+	if x != nil {
+		return x.Count
+	}
+	return 0
+}
+
+func (x *IndexInfoResponse) GetDim() uint32 {
+	if x != nil {
+		return x.Dim
+	}
+	return 0
+}
+
 var File_vector_search_proto protoreflect.FileDescriptor
 
 const file_vector_search_proto_rawDesc = "" +
 	"\n" +
-	"\x13vector_search.proto\x12\fvectorsearch\"3\n" +
+	"\x13vector_search.proto\x12\fvectorsearch\"g\n" +
 	"\rSearchRequest\x12\x14\n" +
 	"\x05query\x18\x01 \x01(\tR\x05query\x12\f\n" +
-	"\x01k\x18\x02 \x01(\rR\x01k\"6\n" +
+	"\x01k\x18\x02 \x01(\rR\x01k\x122\n" +
+	"\x06filter\x18\x03 \x01(\v2\x1a.vectorsearch.SearchFilterR\x06filter\"\xd7\x01\n" +
+	"\fSearchFilter\x12\x1a\n" +
+	"\bverdicts\x18\x01 \x03(\tR\bverdicts\x12\"\n" +
+	"\ffactcheckers\x18\x02 \x03(\tR\ffactcheckers\x12+\n" +
+	"\x11statement_sources\x18\x03 \x03(\tR\x10statementSources\x12.\n" +
+	"\x13statement_date_from\x18\x04 \x01(\tR\x11statementDateFrom\x12*\n" +
+	"\x11statement_date_to\x18\x05 \x01(\tR\x0fstatementDateTo\"6\n" +
 	"\fSearchResult\x12\x10\n" +
 	"\x03uid\x18\x01 \x01(\tR\x03uid\x12\x14\n" +
 	"\x05score\x18\x02 \x01(\x02R\x05score\"F\n" +
 	"\x0eSearchResponse\x124\n" +
-	"\aresults\x18\x01 \x03(\v2\x1a.vectorsearch.SearchResultR\aresults2Z\n" +
+	"\aresults\x18\x01 \x03(\v2\x1a.vectorsearch.SearchResultR\aresults\"p\n" +
+	"\x12BatchSearchRequest\x12\x18\n" +
+	"\aqueries\x18\x01 \x03(\tR\aqueries\x12\f\n" +
+	"\x01k\x18\x02 \x01(\rR\x01k\x122\n" +
+	"\x06filter\x18\x03 \x01(\v2\x1a.vectorsearch.SearchFilterR\x06filter\"Q\n" +
+	"\x13BatchSearchResponse\x12:\n" +
+	"\tresponses\x18\x01 \x03(\v2\x1c.vectorsearch.SearchResponseR\tresponses\"j\n" +
+	"\x11BatchSearchResult\x12\x1f\n" +
+	"\vquery_index\x18\x01 \x01(\rR\n" +
+	"queryIndex\x124\n" +
+	"\aresults\x18\x02 \x03(\v2\x1a.vectorsearch.SearchResultR\aresults\"p\n" +
+	"\x13VectorSearchRequest\x12\x18\n" +
+	"\avectors\x18\x01 \x03(\x02R\avectors\x12\x10\n" +
+	"\x03dim\x18\x02 \x01(\rR\x03dim\x12\f\n" +
+	"\x01k\x18\x03 \x01(\rR\x01k\x12\x1f\n" +
+	"\vfilter_json\x18\x04 \x01(\tR\n" +
+	"filterJson\"\x12\n" +
+	"\x10IndexInfoRequest\";\n" +
+	"\x11IndexInfoResponse\x12\x14\n" +
+	"\x05count\x18\x01 \x01(\x04R\x05count\x12\x10\n" +
+	"\x03dim\x18\x02 \x01(\rR\x03dim2\xad\x03\n" +
 	"\x13VectorSearchService\x12C\n" +
-	"\x06Search\x12\x1b.vectorsearch.SearchRequest\x1a\x1c.vectorsearch.SearchResponseBEZCgithub.com/daniel13112001/api-gateway/gen/vectorsearch;vectorsearchb\x06proto3"
+	"\x06Search\x12\x1b.vectorsearch.SearchRequest\x1a\x1c.vectorsearch.SearchResponse\x12R\n" +
+	"\vBatchSearch\x12 .vectorsearch.BatchSearchRequest\x1a!.vectorsearch.BatchSearchResponse\x12X\n" +
+	"\x11BatchSearchStream\x12 .vectorsearch.BatchSearchRequest\x1a\x1f.vectorsearch.BatchSearchResult0\x01\x12U\n" +
+	"\rSearchVectors\x12!.vectorsearch.VectorSearchRequest\x1a!.vectorsearch.BatchSearchResponse\x12L\n" +
+	"\tIndexInfo\x12\x1e.vectorsearch.IndexInfoRequest\x1a\x1f.vectorsearch.IndexInfoResponseBEZCgithub.com/daniel13112001/api-gateway/gen/vectorsearch;vectorsearchb\x06proto3"
 
 var (
 	file_vector_search_proto_rawDescOnce sync.Once
@@ -197,21 +632,40 @@ func file_vector_search_proto_rawDescGZIP() []byte {
 	return file_vector_search_proto_rawDescData
 }
 
-var file_vector_search_proto_msgTypes = make([]protoimpl.MessageInfo, 3)
+var file_vector_search_proto_msgTypes = make([]protoimpl.MessageInfo, 10)
 var file_vector_search_proto_goTypes = []any{
-	(*SearchRequest)(nil),  // 0: vectorsearch.SearchRequest
-	(*SearchResult)(nil),   // 1: vectorsearch.SearchResult
-	(*SearchResponse)(nil), // 2: vectorsearch.SearchResponse
+	(*SearchRequest)(nil),       // 0: vectorsearch.SearchRequest
+	(*SearchFilter)(nil),        // 1: vectorsearch.SearchFilter
+	(*SearchResult)(nil),        // 2: vectorsearch.SearchResult
+	(*SearchResponse)(nil),      // 3: vectorsearch.SearchResponse
+	(*BatchSearchRequest)(nil),  // 4: vectorsearch.BatchSearchRequest
+	(*BatchSearchResponse)(nil), // 5: vectorsearch.BatchSearchResponse
+	(*BatchSearchResult)(nil),   // 6: vectorsearch.BatchSearchResult
+	(*VectorSearchRequest)(nil), // 7: vectorsearch.VectorSearchRequest
+	(*IndexInfoRequest)(nil),    // 8: vectorsearch.IndexInfoRequest
+	(*IndexInfoResponse)(nil),   // 9: vectorsearch.IndexInfoResponse
 }
 var file_vector_search_proto_depIdxs = []int32{
-	1, // 0: vectorsearch.SearchResponse.results:type_name -> vectorsearch.SearchResult
-	0, // 1: vectorsearch.VectorSearchService.Search:input_type -> vectorsearch.SearchRequest
-	2, // 2: vectorsearch.VectorSearchService.Search:output_type -> vectorsearch.SearchResponse
-	2, // [2:3] is the sub-list for method output_type
-	1, // [1:2] is the sub-list for method input_type
-	1, // [1:1] is the sub-list for extension type_name
-	1, // [1:1] is the sub-list for extension extendee
-	0, // [0:1] is the sub-list for field type_name
+	1,  // 0: vectorsearch.SearchRequest.filter:type_name -> vectorsearch.SearchFilter
+	2,  // 1: vectorsearch.SearchResponse.results:type_name -> vectorsearch.SearchResult
+	1,  // 2: vectorsearch.BatchSearchRequest.filter:type_name -> vectorsearch.SearchFilter
+	3,  // 3: vectorsearch.BatchSearchResponse.responses:type_name -> vectorsearch.SearchResponse
+	2,  // 4: vectorsearch.BatchSearchResult.results:type_name -> vectorsearch.SearchResult
+	0,  // 5: vectorsearch.VectorSearchService.Search:input_type -> vectorsearch.SearchRequest
+	4,  // 6: vectorsearch.VectorSearchService.BatchSearch:input_type -> vectorsearch.BatchSearchRequest
+	4,  // 7: vectorsearch.VectorSearchService.BatchSearchStream:input_type -> vectorsearch.BatchSearchRequest
+	7,  // 8: vectorsearch.VectorSearchService.SearchVectors:input_type -> vectorsearch.VectorSearchRequest
+	8,  // 9: vectorsearch.VectorSearchService.IndexInfo:input_type -> vectorsearch.IndexInfoRequest
+	3,  // 10: vectorsearch.VectorSearchService.Search:output_type -> vectorsearch.SearchResponse
+	5,  // 11: vectorsearch.VectorSearchService.BatchSearch:output_type -> vectorsearch.BatchSearchResponse
+	6,  // 12: vectorsearch.VectorSearchService.BatchSearchStream:output_type -> vectorsearch.BatchSearchResult
+	5,  // 13: vectorsearch.VectorSearchService.SearchVectors:output_type -> vectorsearch.BatchSearchResponse
+	9,  // 14: vectorsearch.VectorSearchService.IndexInfo:output_type -> vectorsearch.IndexInfoResponse
+	10, // [10:15] is the sub-list for method output_type
+	5,  // [5:10] is the sub-list for method input_type
+	5,  // [5:5] is the sub-list for extension type_name
+	5,  // [5:5] is the sub-list for extension extendee
+	0,  // [0:5] is the sub-list for field type_name
 }
 
 func init() { file_vector_search_proto_init() }
@@ -225,7 +679,7 @@ func file_vector_search_proto_init() {
 			GoPackagePath: reflect.TypeOf(x{}).PkgPath(),
 			RawDescriptor: unsafe.Slice(unsafe.StringData(file_vector_search_proto_rawDesc), len(file_vector_search_proto_rawDesc)),
 			NumEnums:      0,
-			NumMessages:   3,
+			NumMessages:   10,
 			NumExtensions: 0,
 			NumServices:   1,
 		},
@@ -19,7 +19,11 @@ import (
 const _ = grpc.SupportPackageIsVersion9
 
 const (
-	VectorSearchService_Search_FullMethodName = "/vectorsearch.VectorSearchService/Search"
+	VectorSearchService_Search_FullMethodName            = "/vectorsearch.VectorSearchService/Search"
+	VectorSearchService_BatchSearch_FullMethodName       = "/vectorsearch.VectorSearchService/BatchSearch"
+	VectorSearchService_BatchSearchStream_FullMethodName = "/vectorsearch.VectorSearchService/BatchSearchStream"
+	VectorSearchService_SearchVectors_FullMethodName     = "/vectorsearch.VectorSearchService/SearchVectors"
+	VectorSearchService_IndexInfo_FullMethodName         = "/vectorsearch.VectorSearchService/IndexInfo"
 )
 
 // VectorSearchServiceClient is the client API for VectorSearchService service.
@@ -27,6 +31,15 @@ const (
 // For semantics around ctx use and closing/ending streaming RPCs, please refer to https://pkg.go.dev/google.golang.org/grpc/?tab=doc#ClientConn.NewStream.
 type VectorSearchServiceClient interface {
 	Search(ctx context.Context, in *SearchRequest, opts ...grpc.CallOption) (*SearchResponse, error)
+	// Embeds all queries in one request and searches them as one matrix.
+	BatchSearch(ctx context.Context, in *BatchSearchRequest, opts ...grpc.CallOption) (*BatchSearchResponse, error)
+	// Same as BatchSearch, but streams results back chunk by chunk.
+	BatchSearchStream(ctx context.Context, in *BatchSearchRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[BatchSearchResult], error)
+	// Searches pre-computed query vectors. Used between a sharded front
+	// end and the retrieval processes serving its shards.
+	SearchVectors(ctx context.Context, in *VectorSearchRequest, opts ...grpc.CallOption) (*BatchSearchResponse, error)
+	// Size and dimension of the index being served.
+	IndexInfo(ctx context.Context, in *IndexInfoRequest, opts ...grpc.CallOption) (*IndexInfoResponse, error)
 }
 
 type vectorSearchServiceClient struct {
@@ -47,11 +60,69 @@ func (c *vectorSearchServiceClient) Search(ctx context.Context, in *SearchReques
 	return out, nil
 }
 
+func (c *vectorSearchServiceClient) BatchSearch(ctx context.Context, in *BatchSearchRequest, opts ...grpc.CallOption) (*BatchSearchResponse, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(BatchSearchResponse)
+	err := c.cc.Invoke(ctx, VectorSearchService_BatchSearch_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
+func (c *vectorSearchServiceClient) BatchSearchStream(ctx context.Context, in *BatchSearchRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[BatchSearchResult], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &VectorSearchService_ServiceDesc.Streams[0], VectorSearchService_BatchSearchStream_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[BatchSearchRequest, BatchSearchResult]{ClientStream: stream}
+	if err := x.ClientStream.SendMsg(in); err != nil {
+		return nil, err
+	}
+	if err := x.ClientStream.CloseSend(); err != nil {
+		return nil, err
+	}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type VectorSearchService_BatchSearchStreamClient = grpc.ServerStreamingClient[BatchSearchResult]
+
+func (c *vectorSearchServiceClient) SearchVectors(ctx context.Context, in *VectorSearchRequest, opts ...grpc.CallOption) (*BatchSearchResponse, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(BatchSearchResponse)
+	err := c.cc.Invoke(ctx, VectorSearchService_SearchVectors_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
+func (c *vectorSearchServiceClient) IndexInfo(ctx context.Context, in *IndexInfoRequest, opts ...grpc.CallOption) (*IndexInfoResponse, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(IndexInfoResponse)
+	err := c.cc.Invoke(ctx, VectorSearchService_IndexInfo_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
 // VectorSearchServiceServer is the server API for VectorSearchService service.
 // All implementations must embed UnimplementedVectorSearchServiceServer
 // for forward compatibility.
 type VectorSearchServiceServer interface {
 	Search(context.Context, *SearchRequest) (*SearchResponse, error)
+	// Embeds all queries in one request and searches them as one matrix.
+	BatchSearch(context.Context, *BatchSearchRequest) (*BatchSearchResponse, error)
+	// Same as BatchSearch, but streams results back chunk by chunk.
+	BatchSearchStream(*BatchSearchRequest, grpc.ServerStreamingServer[BatchSearchResult]) error
+	// Searches pre-computed query vectors. Used between a sharded front
+	// end and the retrieval processes serving its shards.
+	SearchVectors(context.Context, *VectorSearchRequest) (*BatchSearchResponse, error)
+	// Size and dimension of the index being served.
+	IndexInfo(context.Context, *IndexInfoRequest) (*IndexInfoResponse, error)
 	mustEmbedUnimplementedVectorSearchServiceServer()
 }
 
@@ -65,6 +136,18 @@ type UnimplementedVectorSearchServiceServer struct{}
 func (UnimplementedVectorSearchServiceServer) Search(context.Context, *SearchRequest) (*SearchResponse, error) {
 	return nil, status.Error(codes.Unimplemented, "method Search not implemented")
 }
+func (UnimplementedVectorSearchServiceServer) BatchSearch(context.Context, *BatchSearchRequest) (*BatchSearchResponse, error) {
+	return nil, status.Error(codes.Unimplemented, "method BatchSearch not implemented")
+}
+func (UnimplementedVectorSearchServiceServer) BatchSearchStream(*BatchSearchRequest, grpc.ServerStreamingServer[BatchSearchResult]) error {
+	return status.Error(codes.Unimplemented, "method BatchSearchStream not implemented")
+}
+func (UnimplementedVectorSearchServiceServer) SearchVectors(context.Context, *VectorSearchRequest) (*BatchSearchResponse, error) {
+	return nil, status.Error(codes.Unimplemented, "method SearchVectors not implemented")
+}
+func (UnimplementedVectorSearchServiceServer) IndexInfo(context.Context, *IndexInfoRequest) (*IndexInfoResponse, error) {
+	return nil, status.Error(codes.Unimplemented, "method IndexInfo not implemented")
+}
 func (UnimplementedVectorSearchServiceServer) mustEmbedUnimplementedVectorSearchServiceServer() {}
 func (UnimplementedVectorSearchServiceServer) testEmbeddedByValue()                             {}
 
@@ -104,6 +187,71 @@ func _VectorSearchService_Search_Handler(srv interface{}, ctx context.Context, d
 	return interceptor(ctx, in, info, handler)
 }
 
+func _VectorSearchService_BatchSearch_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(BatchSearchRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(VectorSearchServiceServer).BatchSearch(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: VectorSearchService_BatchSearch_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(VectorSearchServiceServer).BatchSearch(ctx, req.(*BatchSearchRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
+func _VectorSearchService_BatchSearchStream_Handler(srv interface{}, stream grpc.ServerStream) error {
+	m := new(BatchSearchRequest)
+	if err := stream.RecvMsg(m); err != nil {
+		return err
+	}
+	return srv.(VectorSearchServiceServer).BatchSearchStream(m, &grpc.GenericServerStream[BatchSearchRequest, BatchSearchResult]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type VectorSearchService_BatchSearchStreamServer = grpc.ServerStreamingServer[BatchSearchResult]
+
+func _VectorSearchService_SearchVectors_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(VectorSearchRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(VectorSearchServiceServer).SearchVectors(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: VectorSearchService_SearchVectors_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(VectorSearchServiceServer).SearchVectors(ctx, req.(*VectorSearchRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
+func _VectorSearchService_IndexInfo_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(IndexInfoRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(VectorSearchServiceServer).IndexInfo(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: VectorSearchService_IndexInfo_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(VectorSearchServiceServer).IndexInfo(ctx, req.(*IndexInfoRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
 // VectorSearchService_ServiceDesc is the grpc.ServiceDesc for VectorSearchService service.
 // It's only intended for direct use with grpc.RegisterService,
 // and not to be introspected or modified (even as a copy)
@@ -115,7 +263,25 @@ var VectorSearchService_ServiceDesc = grpc.ServiceDesc{
 			MethodName: "Search",
 			Handler:    _VectorSearchService_Search_Handler,
 		},
+		{
+			MethodName: "BatchSearch",
+			Handler:    _VectorSearchService_BatchSearch_Handler,
+		},
+		{
+			MethodName: "SearchVectors",
+			Handler:    _VectorSearchService_SearchVectors_Handler,
+		},
+		{
+			MethodName: "IndexInfo",
+			Handler:    _VectorSearchService_IndexInfo_Handler,
+		},
+	},
+	Streams: []grpc.StreamDesc{
+		{
+			StreamName:    "BatchSearchStream",
+			Handler:       _VectorSearchService_BatchSearchStream_Handler,
+			ServerStreams: true,
+		},
 	},
-	Streams:  []grpc.StreamDesc{},
 	Metadata: "vector_search.proto",
 }
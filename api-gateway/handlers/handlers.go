@@ -67,8 +67,9 @@ func (h *Handler) GetSimilarClaims(w http.ResponseWriter, r *http.Request) {
 
 	// 1️⃣ Vector search
 	resp, err := h.VectorClient.Search(ctx, &vectorsearch.SearchRequest{
-		Query: query,
-		K:     1,
+		Query:  query,
+		K:      1,
+		Filter: searchFilter(r),
 	})
 	if err != nil {
 		http.Error(w, "vector search failed", http.StatusBadGateway)
@@ -100,6 +101,25 @@ func (h *Handler) GetSimilarClaims(w http.ResponseWriter, r *http.Request) {
 	_ = json.NewEncoder(w).Encode(claims)
 }
 
+// searchFilter builds the optional result filter from the query string,
+// or returns nil if no filter parameter is set.
+func searchFilter(r *http.Request) *vectorsearch.SearchFilter {
+	params := r.URL.Query()
+	filter := &vectorsearch.SearchFilter{
+		Verdicts:          params["verdict"],
+		Factcheckers:      params["factchecker"],
+		StatementSources:  params["statement_source"],
+		StatementDateFrom: params.Get("date_from"),
+		StatementDateTo:   params.Get("date_to"),
+	}
+	if len(filter.Verdicts) == 0 && len(filter.Factcheckers) == 0 &&
+		len(filter.StatementSources) == 0 &&
+		filter.StatementDateFrom == "" && filter.StatementDateTo == "" {
+		return nil
+	}
+	return filter
+}
+
 func (h *Handler) CreateCommunityClaim(w http.ResponseWriter, r *http.Request) {
 	w.WriteHeader(http.StatusNotImplemented)
 	fmt.Fprintln(w, "CreateCommunityClaim: not implemented")
@@ -1,4 +1,13 @@
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Tuple
+
+# (file name, byte offset): where the next unread row starts.
+Position = Tuple[str, int]
+
+# A contiguous, line-aligned slice of one file: (file path, begin, end).
+ByteRange = Tuple[str, int, int]
 
 class ClaimIngestionDataset(ABC):
     """
@@ -7,14 +16,30 @@ class ClaimIngestionDataset(ABC):
     into (id, text, metadata), and yielding batches.
     """
 
-    def __init__(self, path: str):
+    def __init__(
+        self,
+        path: str,
+        workers: int = 0,
+        ordered: bool = True,
+        chunk_bytes: int = 8 * 1024 * 1024,
+    ):
+        """
+        With workers > 0, files are split into line-aligned byte ranges
+        of about `chunk_bytes` that a process pool parses and transforms.
+        With ordered=False, ranges are yielded as they finish; positions
+        then no longer describe a resumable prefix.
+        """
         self.path = path
+        self.workers = workers
+        self.ordered = ordered
+        self.chunk_bytes = chunk_bytes
 
     @abstractmethod
-    def _row_iterator(self):
+    def _row_iterator(self, start: Position | None = None):
         """
-        Yield raw rows (dicts) from the dataset.
-        Must be streaming.
+        Yield (position, row) pairs from the dataset, where `position` is
+        where reading resumes after `row`. Must be streaming, and must seek
+        straight to `start` without re-reading earlier rows.
         """
         pass
 
@@ -26,19 +51,80 @@ class ClaimIngestionDataset(ABC):
         """
         pass
 
-    def batches(self, batch_size: int):
+    def _byte_ranges(self, start: Position | None = None) -> Iterator[ByteRange]:
+        """
+        Yield the line-aligned byte ranges to parse in parallel, starting
+        at `start`. Only needed for workers > 0.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support parallel reading"
+        )
+
+    def _read_range(self, byte_range: ByteRange) -> List[Tuple[Position, Dict[str, Any]]]:
+        """
+        Parse and transform every row of a byte range, in a worker
+        process. Returns (position, record) pairs.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support parallel reading"
+        )
+
+    def batches(self, batch_size: int, start: Position | None = None):
         """
         Yield batches of flattened records.
         """
+        for _, batch in self.positioned_batches(batch_size, start):
+            yield batch
+
+    def positioned_batches(self, batch_size: int, start: Position | None = None):
+        """
+        Yield (position, batch) pairs, where `position` is where reading
+        resumes after the batch.
+        """
         batch = []
+        position = start
 
-        for row in self._row_iterator():
-            record = self._transform_row(row)
+        for position, record in self._records(start):
             batch.append(record)
 
             if len(batch) == batch_size:
-                yield batch
+                yield position, batch
                 batch = []
 
         if batch:
-            yield batch
+            yield position, batch
+
+    # ---------- Helpers ----------
+
+    def _records(self, start: Position | None):
+        if not self.workers:
+            for position, row in self._row_iterator(start):
+                yield position, self._transform_row(row)
+            return
+
+        # Keep a couple of ranges per worker in flight, which bounds
+        # memory regardless of the dataset size.
+        max_in_flight = 2 * self.workers
+        ranges = self._byte_ranges(start)
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            in_flight = deque()
+
+            def fill():
+                while len(in_flight) < max_in_flight:
+                    byte_range = next(ranges, None)
+                    if byte_range is None:
+                        return
+                    in_flight.append(pool.submit(self._read_range, byte_range))
+
+            fill()
+            while in_flight:
+                if self.ordered:
+                    done = in_flight.popleft()
+                else:
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    done = finished.pop()
+                    in_flight.remove(done)
+
+                fill()
+                yield from done.result()
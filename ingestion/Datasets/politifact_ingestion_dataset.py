@@ -1,12 +1,77 @@
 import json
 import hashlib
+import os
 from datetime import datetime
-from .claim_ingestion_dataset import ClaimIngestionDataset
+from .claim_ingestion_dataset import ByteRange, ClaimIngestionDataset, Position
 from pathlib import Path
 
+try:
+    import orjson
+
+    loads = orjson.loads
+except ImportError:  # optional speedup
+    loads = json.loads
+
+
 class PolitifactIngestionDataset(ClaimIngestionDataset):
 
-    def _row_iterator(self):
+    def _row_iterator(self, start: Position | None = None):
+        files, offset = self._files(start)
+
+        for file_path in files:
+            # Binary mode so offsets are exact byte positions to seek to.
+            with open(file_path, "rb") as f:
+                f.seek(offset)
+                for line in f:
+                    offset += len(line)
+                    if line.strip():
+                        yield (file_path.name, offset), loads(line)
+            offset = 0
+
+    def _byte_ranges(self, start: Position | None = None):
+        files, offset = self._files(start)
+
+        for file_path in files:
+            size = os.path.getsize(file_path)
+
+            with open(file_path, "rb") as f:
+                while offset < size:
+                    # Move the cut to the start of the next line. Reading
+                    # from one byte back keeps a cut that already falls on
+                    # a line start where it is.
+                    end = offset + self.chunk_bytes
+                    if end < size:
+                        f.seek(end - 1)
+                        f.readline()
+                        end = f.tell()
+                    end = min(end, size)
+
+                    yield str(file_path), offset, end
+                    offset = end
+            offset = 0
+
+    def _read_range(self, byte_range: ByteRange):
+        file_path, offset, end = byte_range
+        name = Path(file_path).name
+        records = []
+
+        with open(file_path, "rb") as f:
+            f.seek(offset)
+            while offset < end:
+                line = f.readline()
+                if not line:
+                    break
+                offset += len(line)
+                if line.strip():
+                    records.append(((name, offset), self._transform_row(loads(line))))
+
+        return records
+
+    def _files(self, start: Position | None):
+        """
+        Dataset files from `start` onwards, and the offset to begin at in
+        the first one.
+        """
         path = Path(self.path)
 
         if path.is_file():
@@ -14,10 +79,14 @@ class PolitifactIngestionDataset(ClaimIngestionDataset):
         else:
             files = sorted(path.glob("*.json*"))  # json or jsonl
 
-        for file_path in files:
-            with open(file_path) as f:
-                for line in f:
-                    yield json.loads(line)
+        if start is None:
+            return files, 0
+
+        start_file, offset = start
+        names = [file_path.name for file_path in files]
+        if start_file not in names:
+            raise ValueError(f"{start_file} is not part of dataset {self.path}")
+        return files[names.index(start_file):], offset
 
     def _transform_row(self, row):
         claim = row["statement"].strip()
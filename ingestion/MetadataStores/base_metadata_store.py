@@ -7,6 +7,14 @@ class BaseMetadataStore(ABC):
     def upsert(self, uid: str, metadata: Dict[str, Any]) -> None:
         ...
 
+    def bulk_upsert(self, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Upsert many records (each carrying its own "uid") at once.
+        Backends with a faster bulk path should override this.
+        """
+        for record in records:
+            self.upsert(record["uid"], record)
+
     @abstractmethod
     def get(self, uid: str) -> Dict[str, Any] | None:
         ...
@@ -25,3 +33,9 @@ class BaseMetadataStore(ABC):
         
     def save(self, path: str) -> None:
         pass
+
+    def close(self) -> None:
+        """
+        Release connections or other resources held by the store.
+        """
+        pass
@@ -0,0 +1,151 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, Tuple
+
+from .base_metadata_store import BaseMetadataStore
+
+
+class CachedMetadataStore(BaseMetadataStore):
+    """
+    Read-through LRU cache in front of any metadata store.
+
+    `get` and `bulk_get` are served from memory where possible and only
+    the misses go to the backend, in one `bulk_get`. Entries expire after
+    `ttl` seconds and the least recently used are evicted past `max_size`.
+    Writes go straight to the backend and invalidate the cached entries.
+
+    Thread-safe, so one instance can be shared by all gRPC workers.
+    """
+
+    def __init__(
+        self,
+        backend: BaseMetadataStore,
+        max_size: int = 100_000,
+        ttl: float = 300.0,
+    ):
+        self.backend = backend
+        self.max_size = max_size
+        self.ttl = ttl
+
+        # uid → (cached_at, record), least recently used first
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Bumped on every invalidation. A fill that started before an
+        # invalidation is dropped, so a concurrent read can't put a record
+        # back that a write has just replaced.
+        self._generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.backend_calls = 0
+        self.backend_time = 0.0
+
+    # ---------- Core operations ----------
+
+    def upsert(self, uid: str, metadata: Dict[str, Any]) -> None:
+        self.backend.upsert(uid, metadata)
+        self.invalidate([uid])
+
+    def bulk_upsert(self, records: Iterable[Dict[str, Any]]) -> None:
+        records = list(records)
+        self.backend.bulk_upsert(records)
+        self.invalidate(record["uid"] for record in records)
+
+    def get(self, uid: str) -> Dict[str, Any] | None:
+        return self.bulk_get([uid]).get(uid)
+
+    def bulk_get(self, uids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        found: Dict[str, Dict[str, Any]] = {}
+        missing = []
+        now = time.time()
+
+        with self._lock:
+            for uid in uids:
+                entry = self._entries.get(uid)
+                if entry is not None:
+                    cached_at, record = entry
+                    if now - cached_at <= self.ttl:
+                        self._entries.move_to_end(uid)
+                        found[uid] = record
+                        self.hits += 1
+                        continue
+                    del self._entries[uid]
+
+                missing.append(uid)
+                self.misses += 1
+
+            generation = self._generation
+
+        if not missing:
+            return found
+
+        started = time.perf_counter()
+        fetched = self.backend.bulk_get(missing)
+        elapsed = time.perf_counter() - started
+
+        with self._lock:
+            self.backend_calls += 1
+            self.backend_time += elapsed
+
+            if generation == self._generation:
+                now = time.time()
+                for uid, record in fetched.items():
+                    self._insert(uid, record, now)
+
+        found.update(fetched)
+        return found
+
+    def exists(self, uid: str) -> bool:
+        return self.get(uid) is not None
+
+    def count(self) -> int:
+        return self.backend.count()
+
+    def save(self, path: str) -> None:
+        self.backend.save(path)
+
+    def close(self) -> None:
+        self.clear()
+        self.backend.close()
+
+    # ---------- Cache management ----------
+
+    def invalidate(self, uids: Iterable[str]) -> None:
+        with self._lock:
+            self._generation += 1
+            for uid in uids:
+                self._entries.pop(uid, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "backend_calls": self.backend_calls,
+                "mean_backend_latency_ms": (
+                    1000 * self.backend_time / self.backend_calls
+                    if self.backend_calls else 0.0
+                ),
+            }
+
+    # ---------- Helpers ----------
+
+    def _insert(self, uid: str, record: Dict[str, Any], cached_at: float) -> None:
+        self._entries[uid] = (cached_at, record)
+        self._entries.move_to_end(uid)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
@@ -0,0 +1,280 @@
+import json
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+# Per-row state of a string column, stored only if some row isn't a string.
+PRESENT, NULL, ABSENT = 0, 1, 2
+
+# Dictionary codes for the same states.
+NULL_CODE, ABSENT_CODE = -1, -2
+
+
+class ColumnarSnapshot:
+    """
+    Read-only, column-oriented snapshot of metadata records in a single
+    file, designed to be memory-mapped.
+
+    Columns with few distinct values (verdict, factchecker, originator,
+    ...) are dictionary-encoded as int32 codes. Other columns are one
+    UTF-8 buffer plus int64 offsets. A permutation of rows sorted by UID
+    supports binary-search lookups without building a dict at load, and
+    records are only turned into dicts when they are asked for.
+
+    Values must be strings or None; keys missing from a record stay
+    missing when it is materialized.
+
+    File layout (little-endian):
+        magic      8 bytes  b"ALTHMETA"
+        version    uint32
+        header_len uint32
+        header     JSON: row count, column encodings, array locations
+        arrays     each aligned to 64 bytes
+    """
+
+    MAGIC = b"ALTHMETA"
+    VERSION = 1
+    PREAMBLE = struct.Struct("<8sII")
+    ALIGN = 64
+
+    def __init__(self, buffer: np.ndarray, header: Dict[str, Any]):
+        self._buffer = buffer
+        self.count: int = header["count"]
+        self.columns: List[str] = [column["name"] for column in header["columns"]]
+
+        self._columns: Dict[str, Dict[str, Any]] = {}
+        for column in header["columns"]:
+            decoded = {"encoding": column["encoding"]}
+            for name, location in column["arrays"].items():
+                decoded[name] = self._array(location)
+            if column["encoding"] == "dict":
+                decoded["values"] = column["values"]
+            self._columns[column["name"]] = decoded
+
+        self._order = self._array(header["order"])
+
+        # Equal-length UIDs (the usual SHA-256 hex) can be searched as a
+        # fixed-width byte-string array, entirely inside NumPy.
+        self._fixed_uids: np.ndarray | None = None
+        offsets = self._columns["uid"]["offsets"]
+        if self.count:
+            widths = np.diff(offsets)
+            if widths[0] > 0 and (widths == widths[0]).all():
+                self._fixed_uids = self._columns["uid"]["data"].view(f"S{widths[0]}")
+
+    def __len__(self) -> int:
+        return self.count
+
+    # ---------- Lookups ----------
+
+    def position(self, uid: str) -> int | None:
+        """
+        Row of `uid`, or None if it isn't in the snapshot.
+        """
+        target = uid.encode()
+
+        if self._fixed_uids is not None:
+            if len(target) != self._fixed_uids.itemsize:
+                return None
+            i = int(np.searchsorted(self._fixed_uids, target, sorter=self._order))
+            if i < self.count and self._fixed_uids[self._order[i]] == target:
+                return int(self._order[i])
+            return None
+
+        lo, hi = 0, self.count
+
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._uid_bytes(int(self._order[mid])) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        if lo < self.count:
+            row = int(self._order[lo])
+            if self._uid_bytes(row) == target:
+                return row
+        return None
+
+    def record(self, row: int) -> Dict[str, Any]:
+        record = {}
+        for name in self.columns:
+            present, value = self._value(name, row)
+            if present:
+                record[name] = value
+        return record
+
+    def uids(self) -> Iterator[str]:
+        for row in range(self.count):
+            yield self._uid_bytes(row).decode()
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        for row in range(self.count):
+            yield self.record(row)
+
+    # ---------- Persistence ----------
+
+    @classmethod
+    def write(cls, path: str | Path, records: Iterable[Dict[str, Any]]) -> None:
+        records = list(records)
+        names: List[str] = ["uid"]
+        for record in records:
+            for name in record:
+                if name not in names:
+                    names.append(name)
+
+        arrays: List[np.ndarray] = []
+
+        def place(array: np.ndarray) -> Dict[str, Any]:
+            arrays.append(np.ascontiguousarray(array))
+            return {
+                "index": len(arrays) - 1,
+                "dtype": array.dtype.str,
+                "length": len(array),
+            }
+
+        columns = []
+        for name in names:
+            values = [record.get(name) for record in records]
+            states = np.array(
+                [
+                    PRESENT if isinstance(value, str) else NULL if name in record else ABSENT
+                    for record, value in zip(records, values)
+                ],
+                dtype=np.uint8,
+            )
+            for value in values:
+                if value is not None and not isinstance(value, str):
+                    raise TypeError(f"{name}: snapshot values must be str or None")
+
+            if name == "uid" and (states != PRESENT).any():
+                raise ValueError("every record needs a string uid")
+
+            distinct = sorted({value for value in values if value is not None})
+
+            if name != "uid" and len(distinct) <= max(1, len(records) // 4):
+                lookup = {value: code for code, value in enumerate(distinct)}
+                codes = np.array(
+                    [
+                        lookup[value] if state == PRESENT
+                        else NULL_CODE if state == NULL else ABSENT_CODE
+                        for value, state in zip(values, states)
+                    ],
+                    dtype=np.int32,
+                )
+                columns.append({
+                    "name": name,
+                    "encoding": "dict",
+                    "values": distinct,
+                    "arrays": {"codes": place(codes)},
+                })
+                continue
+
+            encoded = [value.encode() if value is not None else b"" for value in values]
+            offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+            np.cumsum([len(value) for value in encoded], out=offsets[1:])
+
+            column_arrays = {
+                "offsets": place(offsets),
+                "data": place(np.frombuffer(b"".join(encoded), dtype=np.uint8)),
+            }
+            if (states != PRESENT).any():
+                column_arrays["states"] = place(states)
+
+            columns.append({"name": name, "encoding": "string", "arrays": column_arrays})
+
+        uids = [record["uid"].encode() for record in records]
+        order = np.array(sorted(range(len(uids)), key=uids.__getitem__), dtype=np.int64)
+        order_location = place(order)
+
+        # Array offsets are relative to the start of the data section.
+        offset = 0
+        locations = []
+        for array in arrays:
+            locations.append(offset)
+            offset += cls._padded(array.nbytes)
+
+        def resolve(location):
+            location["offset"] = locations[location.pop("index")]
+            return location
+
+        for column in columns:
+            for location in column["arrays"].values():
+                resolve(location)
+
+        header = json.dumps({
+            "count": len(records),
+            "columns": columns,
+            "order": resolve(order_location),
+        }).encode()
+
+        data_start = cls._padded(cls.PREAMBLE.size + len(header))
+
+        with open(path, "wb") as f:
+            f.write(cls.PREAMBLE.pack(cls.MAGIC, cls.VERSION, len(header)))
+            f.write(header)
+            f.write(b"\0" * (data_start - cls.PREAMBLE.size - len(header)))
+            for array in arrays:
+                f.write(array.tobytes())
+                f.write(b"\0" * (cls._padded(array.nbytes) - array.nbytes))
+
+    @classmethod
+    def load(cls, path: str | Path, mmap: bool = True) -> "ColumnarSnapshot":
+        """
+        Open a snapshot in one pass. With mmap=True nothing but the
+        header is read up front; pages are faulted in on access and shared
+        through the page cache.
+        """
+        with open(path, "rb") as f:
+            magic, version, header_len = cls.PREAMBLE.unpack(f.read(cls.PREAMBLE.size))
+            if magic != cls.MAGIC:
+                raise ValueError(f"{path} is not a metadata snapshot")
+            if version != cls.VERSION:
+                raise ValueError(f"unsupported snapshot version {version}")
+            header = json.loads(f.read(header_len))
+
+        if mmap:
+            buffer = np.memmap(path, dtype=np.uint8, mode="r")
+        else:
+            buffer = np.fromfile(path, dtype=np.uint8)
+
+        data_start = cls._padded(cls.PREAMBLE.size + header_len)
+        return cls(buffer[data_start:], header)
+
+    # ---------- Helpers ----------
+
+    @classmethod
+    def _padded(cls, size: int) -> int:
+        return -(-size // cls.ALIGN) * cls.ALIGN
+
+    def _array(self, location: Dict[str, Any]) -> np.ndarray:
+        dtype = np.dtype(location["dtype"])
+        start = location["offset"]
+        end = start + location["length"] * dtype.itemsize
+        return self._buffer[start:end].view(dtype)
+
+    def _uid_bytes(self, row: int) -> bytes:
+        column = self._columns["uid"]
+        start, end = column["offsets"][row], column["offsets"][row + 1]
+        return column["data"][start:end].tobytes()
+
+    def _value(self, name: str, row: int) -> Tuple[bool, Any]:
+        column = self._columns[name]
+
+        if column["encoding"] == "dict":
+            code = int(column["codes"][row])
+            if code == ABSENT_CODE:
+                return False, None
+            return True, None if code == NULL_CODE else column["values"][code]
+
+        if "states" in column:
+            state = column["states"][row]
+            if state == ABSENT:
+                return False, None
+            if state == NULL:
+                return True, None
+
+        start, end = column["offsets"][row], column["offsets"][row + 1]
+        return True, column["data"][start:end].tobytes().decode()
@@ -1,43 +1,84 @@
 from .base_metadata_store import BaseMetadataStore
-from typing import Dict, Any, Iterable
+from .columnar_snapshot import ColumnarSnapshot
+from typing import Dict, Any, Iterable, Iterator
 from pathlib import Path
 import json
+import os
 
 class InMemoryMetadataStore(BaseMetadataStore):
 
     def __init__(self):
         self.data: Dict[str, Dict[str, Any]] = {}
 
+        # Read-only base loaded with `load_snapshot`; `data` holds records
+        # upserted since, which shadow the snapshot.
+        self.snapshot: ColumnarSnapshot | None = None
+        self._shadowed = 0
+
     def upsert(self, uid: str, metadata: Dict[str, Any]) -> None:
+        self._shadow([uid])
         self.data[uid] = metadata
 
+    def bulk_upsert(self, records: Iterable[Dict[str, Any]]) -> None:
+        records = list(records)
+        self._shadow(record["uid"] for record in records)
+        self.data.update((record["uid"], record) for record in records)
+
     def get(self, uid: str) -> Dict[str, Any] | None:
-        return self.data.get(uid)
+        if uid in self.data:
+            return self.data[uid]
+        if self.snapshot is not None:
+            row = self.snapshot.position(uid)
+            if row is not None:
+                return self.snapshot.record(row)
+        return None
 
     def bulk_get(self, uids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
-        return {uid: self.data[uid] for uid in uids if uid in self.data}
+        found = {}
+        for uid in uids:
+            record = self.get(uid)
+            if record is not None:
+                found[uid] = record
+        return found
 
     def exists(self, uid: str) -> bool:
-        return uid in self.data
-    
+        if uid in self.data:
+            return True
+        return self.snapshot is not None and self.snapshot.position(uid) is not None
+
     def count(self) -> int:
-        return len(self.data)
-        
-    
+        base = len(self.snapshot) if self.snapshot is not None else 0
+        return base + len(self.data) - self._shadowed
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        if self.snapshot is not None:
+            for record in self.snapshot.records():
+                if record["uid"] not in self.data:
+                    yield record
+        yield from self.data.values()
+
+
   # ---------- Persistence ----------
 
     def save(self, path: str) -> None:
         """
         Persist metadata to disk as JSONL.
         Each line is a single flattened record.
+
+        Written atomically: a crash leaves either the previous file or
+        this one, never a truncated file.
         """
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with path.open("w", encoding="utf-8") as f:
-            for record in self.data.values():
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            for record in self.records():
                 f.write(json.dumps(record, ensure_ascii=False))
                 f.write("\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
 
 
     @classmethod
@@ -51,6 +92,34 @@ class InMemoryMetadataStore(BaseMetadataStore):
         with path.open("r", encoding="utf-8") as f:
             for line in f:
                 record = json.loads(line)
-                store.data[record["uid"]] = record["metadata"]
+                store.data[record["uid"]] = record
+
+        return store
+
+    def save_snapshot(self, path: str) -> None:
+        """
+        Persist metadata as a columnar snapshot (see ColumnarSnapshot).
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        ColumnarSnapshot.write(path, self.records())
 
+    @classmethod
+    def load_snapshot(cls, path: str, mmap: bool = True) -> "InMemoryMetadataStore":
+        """
+        Open a columnar snapshot without materializing its records; dicts
+        are only built for records returned by `get`/`bulk_get`.
+        """
+        store = cls()
+        store.snapshot = ColumnarSnapshot.load(path, mmap=mmap)
         return store
+
+    # ---------- Helpers ----------
+
+    def _shadow(self, uids: Iterable[str]) -> None:
+        # Count snapshot records being overridden for the first time.
+        if self.snapshot is None:
+            return
+        for uid in set(uids) - self.data.keys():
+            if self.snapshot.position(uid) is not None:
+                self._shadowed += 1
@@ -1,19 +1,94 @@
 from typing import Dict, Any, Iterable
 from .base_metadata_store import BaseMetadataStore
-import psycopg
 from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool, ConnectionPool
 import socket
 from urllib.parse import urlparse
 
 
+COLUMNS = (
+    "uid",
+    "statement",
+    "verdict",
+    "statement_originator",
+    "statement_date",
+    "statement_source",
+    "factchecker",
+    "factcheck_date",
+    "factcheck_analysis_link",
+)
+
+
+SELECT_BY_UID = """
+    SELECT *
+    FROM claim_metadata
+    WHERE uid = %s;
+"""
+
+SELECT_BY_UIDS = """
+    SELECT *
+    FROM claim_metadata
+    WHERE uid = ANY(%s);
+"""
+
+EXISTS_BY_UID = """
+    SELECT 1
+    FROM claim_metadata
+    WHERE uid = %s
+    LIMIT 1;
+"""
+
+
+def connection_kwargs(statement_timeout_ms: int | None) -> Dict[str, Any]:
+    kwargs: Dict[str, Any] = {"row_factory": dict_row}
+    if statement_timeout_ms:
+        # Applied server-side for the whole session, so a slow query
+        # can't hold a pooled connection indefinitely.
+        kwargs["options"] = f"-c statement_timeout={statement_timeout_ms}"
+    return kwargs
+
 
 class PostgresMetadataStore(BaseMetadataStore):
-    def __init__(self, db_url):
-        self.conn = psycopg.connect(db_url, row_factory=dict_row)
+    """
+    PostgreSQL-backed metadata store on a thread-safe connection pool.
+
+    Each call borrows a connection for its duration, so the store can be
+    shared by many threads. Connections are checked before being handed
+    out and replaced if broken; if the server goes away the pool keeps
+    reconnecting in the background for up to `reconnect_timeout` seconds.
+    """
+
+    def __init__(
+        self,
+        db_url: str,
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 30.0,
+        statement_timeout_ms: int | None = None,
+        reconnect_timeout: float = 300.0,
+    ):
+        self.pool = ConnectionPool(
+            db_url,
+            min_size=min_size,
+            max_size=max_size,
+            timeout=timeout,
+            reconnect_timeout=reconnect_timeout,
+            kwargs=connection_kwargs(statement_timeout_ms),
+            check=ConnectionPool.check_connection,
+            open=True,
+            name="claim-metadata",
+        )
+
+    def close(self) -> None:
+        self.pool.close()
+
+    def stats(self) -> Dict[str, int]:
+        return self.pool.get_stats()
 
     # ---------- Helpers ----------
 
-    def _row_to_record(self, row: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _row_to_record(row: Dict[str, Any]) -> Dict[str, Any]:
 
         if not row:
             return None
@@ -34,7 +109,8 @@ class PostgresMetadataStore(BaseMetadataStore):
 
 
     def upsert(self, uid: str, metadata: Dict[str, Any]) -> None:
-        with self.conn.cursor() as cur:
+        # The pool commits when the connection is returned.
+        with self.pool.connection() as conn, conn.cursor() as cur:
             cur.execute(
                 """
                 INSERT INTO claim_metadata (
@@ -81,18 +157,54 @@ class PostgresMetadataStore(BaseMetadataStore):
                     "factcheck_analysis_link": metadata.get("factcheck_analysis_link"),
                 },
             )
-            self.conn.commit()
+
+    def bulk_upsert(self, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Stream a batch into a session-local staging table with COPY and
+        merge it with a single INSERT ... SELECT ... ON CONFLICT, all in
+        one transaction: one round trip and one fsync per batch instead
+        of per record.
+        """
+        # ON CONFLICT can't touch the same row twice in one statement;
+        # the last occurrence of a UID wins, as with repeated upserts.
+        latest = {record["uid"]: record for record in records}
+        if not latest:
+            return
+
+        columns = ", ".join(COLUMNS)
+        updates = ",\n".join(
+            f"{column} = EXCLUDED.{column}" for column in COLUMNS[1:]
+        )
+
+        with self.pool.connection() as conn, conn.transaction():
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    CREATE TEMP TABLE IF NOT EXISTS claim_metadata_staging
+                    (LIKE claim_metadata INCLUDING DEFAULTS)
+                    ON COMMIT DELETE ROWS;
+                    """
+                )
+
+                with cur.copy(
+                    f"COPY claim_metadata_staging ({columns}) FROM STDIN"
+                ) as copy:
+                    for record in latest.values():
+                        copy.write_row([record.get(column) for column in COLUMNS])
+
+                cur.execute(
+                    f"""
+                    INSERT INTO claim_metadata ({columns})
+                    SELECT {columns}
+                    FROM claim_metadata_staging
+                    ON CONFLICT (uid) DO UPDATE SET
+                    {updates};
+                    """
+                )
 
     def get(self, uid: str) -> Dict[str, Any] | None:
-        with self.conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT *
-                FROM claim_metadata
-                WHERE uid = %s;
-                """,
-                (uid,),
-            )
+        with self.pool.connection() as conn, conn.cursor() as cur:
+            cur.execute(SELECT_BY_UID, (uid,))
             row = cur.fetchone()
             return self._row_to_record(row)
 
@@ -101,15 +213,8 @@ class PostgresMetadataStore(BaseMetadataStore):
         if not uids:
             return {}
 
-        with self.conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT *
-                FROM claim_metadata
-                WHERE uid = ANY(%s);
-                """,
-                (uids,),
-            )
+        with self.pool.connection() as conn, conn.cursor() as cur:
+            cur.execute(SELECT_BY_UIDS, (uids,))
             rows = cur.fetchall()
 
         return {
@@ -118,21 +223,87 @@ class PostgresMetadataStore(BaseMetadataStore):
         }
 
     def exists(self, uid: str) -> bool:
-        with self.conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT 1
-                FROM claim_metadata
-                WHERE uid = %s
-                LIMIT 1;
-                """,
-                (uid,),
-            )
+        with self.pool.connection() as conn, conn.cursor() as cur:
+            cur.execute(EXISTS_BY_UID, (uid,))
             return cur.fetchone() is not None
         
     def count(self) -> int:
-        with self.conn.cursor() as cur:
+        with self.pool.connection() as conn, conn.cursor() as cur:
             cur.execute("SELECT COUNT(*) AS count FROM claim_metadata;")
             return cur.fetchone()["count"]
+
+
+class AsyncPostgresMetadataStore:
+    """
+    Read-only asyncio counterpart of PostgresMetadataStore for serving
+    lookups from an event loop, backed by an AsyncConnectionPool.
+
+    The pool must be opened inside the running loop:
+
+        async with AsyncPostgresMetadataStore(db_url) as store:
+            records = await store.bulk_get(uids)
+    """
+
+    def __init__(
+        self,
+        db_url: str,
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 30.0,
+        statement_timeout_ms: int | None = None,
+        reconnect_timeout: float = 300.0,
+    ):
+        self.pool = AsyncConnectionPool(
+            db_url,
+            min_size=min_size,
+            max_size=max_size,
+            timeout=timeout,
+            reconnect_timeout=reconnect_timeout,
+            kwargs=connection_kwargs(statement_timeout_ms),
+            check=AsyncConnectionPool.check_connection,
+            open=False,
+            name="claim-metadata-async",
+        )
+
+    async def open(self) -> None:
+        await self.pool.open()
+
+    async def close(self) -> None:
+        await self.pool.close()
+
+    async def __aenter__(self) -> "AsyncPostgresMetadataStore":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def stats(self) -> Dict[str, int]:
+        return self.pool.get_stats()
+
+    async def get(self, uid: str) -> Dict[str, Any] | None:
+        async with self.pool.connection() as conn, conn.cursor() as cur:
+            await cur.execute(SELECT_BY_UID, (uid,))
+            row = await cur.fetchone()
+            return PostgresMetadataStore._row_to_record(row)
+
+    async def bulk_get(self, uids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        uids = list(uids)
+        if not uids:
+            return {}
+
+        async with self.pool.connection() as conn, conn.cursor() as cur:
+            await cur.execute(SELECT_BY_UIDS, (uids,))
+            rows = await cur.fetchall()
+
+        return {
+            row["uid"]: PostgresMetadataStore._row_to_record(row)
+            for row in rows
+        }
+
+    async def exists(self, uid: str) -> bool:
+        async with self.pool.connection() as conn, conn.cursor() as cur:
+            await cur.execute(EXISTS_BY_UID, (uid,))
+            return await cur.fetchone() is not None
             
 
@@ -0,0 +1,275 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+from dateutil import parser as date_parser
+
+from ..typing_defs import Metadata
+
+# Attributes that can be filtered on, by kind. Categorical attributes are
+# matched exactly; numeric ones also support ranges. Dates are stored as
+# YYYYMMDD integers, which order correctly and are valid Pinecone numbers.
+CATEGORICAL_FIELDS = ("verdict", "factchecker", "statement_source", "source")
+NUMERIC_FIELDS = ("statement_date",)
+
+MISSING_CODE = -1
+MISSING_NUMBER = np.iinfo(np.int64).min
+
+RANGE_OPERATORS = ("$gt", "$gte", "$lt", "$lte")
+
+
+def date_number(value: Any) -> int | None:
+    """
+    YYYYMMDD integer for a date string ("1/9/2016", "2016-01-09") or an
+    integer that already is one.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+
+    date = date_parser.parse(str(value)).date()
+    return date.year * 10_000 + date.month * 100 + date.day
+
+
+def filter_attributes(record: Dict[str, Any]) -> Metadata:
+    """
+    The filterable attributes of a claim record, as stored alongside its
+    vector.
+    """
+    attributes: Metadata = {}
+
+    for name in CATEGORICAL_FIELDS:
+        if record.get(name):
+            attributes[name] = record[name]
+
+    for name in NUMERIC_FIELDS:
+        try:
+            number = date_number(record.get(name))
+        except (ValueError, OverflowError):
+            number = None
+        if number is not None:
+            attributes[name] = number
+
+    return attributes
+
+
+class AttributeIndex:
+    """
+    Per-vector filter attributes for FaissVectorStore, aligned with index
+    positions, turned into FAISS ID selectors at query time.
+
+    Categorical attributes are dictionary-encoded; a packed bitmap per
+    (attribute, value) is computed once and cached, so a filter is a few
+    byte-wise ORs and ANDs over N/8 bytes. Numeric ranges use a cached
+    sort order. The resulting bitmap is applied inside the FAISS search
+    (IDSelectorBitmap), so no results are over-fetched or post-filtered.
+
+    Filters use the Pinecone subset this repo needs:
+        {"verdict": "false"}
+        {"verdict": {"$in": ["false", "pants-fire"]}}
+        {"statement_date": {"$gte": 20200101, "$lt": 20210101}}
+    Conditions on different attributes are ANDed.
+    """
+
+    def __init__(self):
+        self._values: Dict[str, List[str]] = {name: [] for name in CATEGORICAL_FIELDS}
+        self._lookup: Dict[str, Dict[str, int]] = {name: {} for name in CATEGORICAL_FIELDS}
+
+        # Columns as lists of chunks, concatenated on first query.
+        self._chunks: Dict[str, List[np.ndarray]] = {
+            name: [] for name in (*CATEGORICAL_FIELDS, *NUMERIC_FIELDS)
+        }
+        self._count = 0
+
+        self._bitmaps: Dict[Tuple[str, int], np.ndarray] = {}
+        # field → (argsort of the column, column in that order)
+        self._orders: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        return self._count
+
+    def extend(self, metadatas: Iterable[Metadata | None]) -> None:
+        metadatas = [metadata or {} for metadata in metadatas]
+
+        for name in CATEGORICAL_FIELDS:
+            lookup = self._lookup[name]
+            codes = np.empty(len(metadatas), dtype=np.int32)
+            for i, metadata in enumerate(metadatas):
+                value = metadata.get(name)
+                if value is None:
+                    codes[i] = MISSING_CODE
+                    continue
+                if value not in lookup:
+                    lookup[value] = len(self._values[name])
+                    self._values[name].append(value)
+                codes[i] = lookup[value]
+            self._chunks[name].append(codes)
+
+        for name in NUMERIC_FIELDS:
+            numbers = np.array(
+                [self._number(metadata.get(name)) for metadata in metadatas],
+                dtype=np.int64,
+            )
+            self._chunks[name].append(numbers)
+
+        self._count += len(metadatas)
+        self._bitmaps.clear()
+        self._orders.clear()
+
+    def bitmap(self, filters: Metadata) -> np.ndarray:
+        """
+        Packed bitmap of the positions matching `filters`, in the layout
+        of faiss.IDSelectorBitmap.
+        """
+        bitmap = None
+        for name, condition in filters.items():
+            matches = self._matches(name, condition)
+            bitmap = matches if bitmap is None else np.bitwise_and(bitmap, matches)
+
+        if bitmap is None:
+            bitmap = np.full(self._bitmap_size(), 0xFF, dtype=np.uint8)
+        return bitmap
+
+    def take(self, positions: np.ndarray) -> "AttributeIndex":
+        """
+        A new index holding only the rows at `positions`, in that order.
+        """
+        index = AttributeIndex()
+        for name in self._chunks:
+            index._chunks[name] = [self._column(name)[positions]]
+        for name in CATEGORICAL_FIELDS:
+            index._values[name] = list(self._values[name])
+            index._lookup[name] = dict(self._lookup[name])
+        index._count = len(positions)
+        return index
+
+    # ---------- Persistence ----------
+
+    def save(self, path: str | Path) -> None:
+        arrays = {name: self._column(name) for name in self._chunks}
+        arrays["__values__"] = np.frombuffer(json.dumps(self._values).encode(), dtype=np.uint8)
+
+        # np.savez appends ".npz" to bare paths; a file object keeps `path`.
+        with open(path, "wb") as f:
+            np.savez(f, **arrays)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "AttributeIndex":
+        index = cls()
+
+        with np.load(path) as data:
+            values = json.loads(data["__values__"].tobytes())
+            columns = {name: np.array(data[name]) for name in index._chunks if name in data}
+
+        # Attributes added since the file was written are missing.
+        count = len(next(iter(columns.values())))
+        for name in CATEGORICAL_FIELDS:
+            columns.setdefault(name, np.full(count, MISSING_CODE, dtype=np.int32))
+        for name in NUMERIC_FIELDS:
+            columns.setdefault(name, np.full(count, MISSING_NUMBER, dtype=np.int64))
+
+        for name, column in columns.items():
+            index._chunks[name] = [column]
+        for name in CATEGORICAL_FIELDS:
+            index._values[name] = values.get(name, [])
+            index._lookup[name] = {value: code for code, value in enumerate(index._values[name])}
+
+        index._count = count
+        return index
+
+    # ---------- Helpers ----------
+
+    @staticmethod
+    def _number(value: Any) -> int:
+        try:
+            number = date_number(value)
+        except (ValueError, OverflowError):
+            number = None
+        return MISSING_NUMBER if number is None else number
+
+    def _column(self, name: str) -> np.ndarray:
+        chunks = self._chunks[name]
+        if len(chunks) != 1:
+            dtype = np.int32 if name in CATEGORICAL_FIELDS else np.int64
+            chunks[:] = [np.concatenate(chunks) if chunks else np.empty(0, dtype=dtype)]
+        return chunks[0]
+
+    def _bitmap_size(self) -> int:
+        return (self._count + 7) // 8
+
+    def _pack(self, mask: np.ndarray) -> np.ndarray:
+        # IDSelectorBitmap tests bit (i & 7) of byte (i >> 3).
+        return np.packbits(mask, bitorder="little")
+
+    def _matches(self, name: str, condition: Any) -> np.ndarray:
+        if not isinstance(condition, dict):
+            condition = {"$eq": condition}
+
+        if name in CATEGORICAL_FIELDS:
+            return self._categorical_matches(name, condition)
+        if name in NUMERIC_FIELDS:
+            return self._numeric_matches(name, condition)
+        raise ValueError(
+            f"cannot filter on {name!r}; filterable attributes are "
+            f"{CATEGORICAL_FIELDS + NUMERIC_FIELDS}"
+        )
+
+    def _categorical_matches(self, name: str, condition: Dict[str, Any]) -> np.ndarray:
+        values = []
+        for operator, operand in condition.items():
+            if operator == "$eq":
+                values.append(operand)
+            elif operator == "$in":
+                values.extend(operand)
+            else:
+                raise ValueError(f"{name} supports $eq and $in, not {operator}")
+
+        bitmap = np.zeros(self._bitmap_size(), dtype=np.uint8)
+        for value in values:
+            code = self._lookup[name].get(value)
+            if code is not None:
+                np.bitwise_or(bitmap, self._value_bitmap(name, code), out=bitmap)
+        return bitmap
+
+    def _value_bitmap(self, name: str, code: int) -> np.ndarray:
+        key = (name, code)
+        if key not in self._bitmaps:
+            self._bitmaps[key] = self._pack(self._column(name) == code)
+        return self._bitmaps[key]
+
+    def _numeric_matches(self, name: str, condition: Dict[str, Any]) -> np.ndarray:
+        column = self._column(name)
+
+        if "$eq" in condition or "$in" in condition:
+            if set(condition) - {"$eq", "$in"}:
+                raise ValueError(f"{name}: combine $eq/$in or ranges, not both")
+            wanted = [condition["$eq"]] if "$eq" in condition else condition["$in"]
+            return self._pack(np.isin(column, [date_number(v) for v in wanted]))
+
+        unknown = set(condition) - set(RANGE_OPERATORS)
+        if unknown:
+            raise ValueError(f"{name} supports $eq, $in, {', '.join(RANGE_OPERATORS)}")
+
+        if name not in self._orders:
+            order = np.argsort(column, kind="stable")
+            self._orders[name] = (order, column[order])
+        order, ordered = self._orders[name]
+
+        # Missing values sort first and never match a range.
+        lo = int(np.searchsorted(ordered, MISSING_NUMBER, side="right"))
+        hi = len(ordered)
+        if "$gte" in condition:
+            lo = max(lo, int(np.searchsorted(ordered, date_number(condition["$gte"]), side="left")))
+        if "$gt" in condition:
+            lo = max(lo, int(np.searchsorted(ordered, date_number(condition["$gt"]), side="right")))
+        if "$lte" in condition:
+            hi = min(hi, int(np.searchsorted(ordered, date_number(condition["$lte"]), side="right")))
+        if "$lt" in condition:
+            hi = min(hi, int(np.searchsorted(ordered, date_number(condition["$lt"]), side="left")))
+
+        mask = np.zeros(self._count, dtype=bool)
+        if lo < hi:
+            mask[order[lo:hi]] = True
+        return self._pack(mask)
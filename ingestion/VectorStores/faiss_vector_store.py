@@ -1,18 +1,199 @@
 import faiss
 import json
+import os
+import time
+import uuid
 import numpy as np
+from dataclasses import asdict, dataclass, replace
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+from .attribute_index import AttributeIndex
+from .uid_map import UidMap
 from .vector_store import VectorStore
 from ..typing_defs import Vector, Metadata
 
 
+# Zero-copy mmap of flat/SQ/PQ codes (and IVF lists) where the installed
+# FAISS supports it; older releases only mmap IVF inverted lists.
+MMAP_IO_FLAG = getattr(faiss, "IO_FLAG_MMAP_IFC", faiss.IO_FLAG_MMAP)
+
+INDEX_TYPES = (
+    "flat",
+    "sq8",
+    "fp16",
+    "pq",
+    "opq_pq",
+    "ivf_flat",
+    "ivf_pq",
+    "hnsw_flat",
+    "factory",
+)
+
+# Full-precision copy of the vectors kept for re-ranking, memory-mapped.
+RAW_VECTORS = "vectors.npy"
+
+# Rows reconstructed and re-added per step while compacting.
+COMPACT_CHUNK = 65_536
+
+# Index classes whose search takes an ID selector, which filters and
+# tombstones rely on. Refine and pre-transform wrappers pass it on to
+# the index they wrap.
+SELECTOR_INDEXES = (
+    faiss.IndexFlat,
+    faiss.IndexScalarQuantizer,
+    faiss.IndexIVF,
+    faiss.IndexHNSW,
+)
+
+
+def supports_selectors(index: faiss.Index) -> bool:
+    index = faiss.downcast_index(index)
+    if isinstance(index, faiss.IndexRefine):
+        return supports_selectors(index.base_index)
+    if isinstance(index, faiss.IndexPreTransform):
+        return supports_selectors(index.index)
+    return isinstance(index, SELECTOR_INDEXES)
+
+
+@dataclass(frozen=True)
+class FaissIndexConfig:
+    """
+    How a FaissVectorStore index is built and searched.
+
+    - flat: exact inner-product scan (IndexFlatIP), 4 bytes per dimension
+    - sq8 / fp16: scan over scalar-quantized codes, 1 / 2 bytes per
+      dimension
+    - pq / opq_pq: scan over product-quantized codes of `pq_m` bytes
+      (with nbits=8), optionally after an OPQ rotation
+    - ivf_flat / ivf_pq: inverted file with `nlist` lists, raw or
+      product-quantized codes; searched with `nprobe`
+    - hnsw_flat: HNSW graph with `hnsw_m` links per node; searched with
+      `ef_search`
+    - factory: any `faiss.index_factory` string in `factory_string`
+
+    With `rerank_k` > 0 the full-precision vectors are also written to
+    vectors.npy and memory-mapped; each query then re-scores its
+    `rerank_k` best candidates exactly and returns the top k of those.
+    A compressed index stays in RAM and the raw vectors are paged in
+    only for the candidates.
+
+    Deleted and replaced vectors are tombstoned; once they make up more
+    than `max_deleted_fraction` of the index, it is compacted on save.
+
+    Persisted next to index.faiss so search settings survive reloads.
+    """
+
+    index_type: str = "flat"
+    nlist: int = 1024
+    pq_m: int = 64
+    pq_nbits: int = 8
+    hnsw_m: int = 32
+    ef_construction: int = 200
+    factory_string: str | None = None
+    train_size: int = 100_000
+    max_deleted_fraction: float = 0.2
+
+    # query-time parameters
+    nprobe: int = 16
+    ef_search: int = 64
+    rerank_k: int = 0
+
+    def __post_init__(self):
+        if self.index_type not in INDEX_TYPES:
+            raise ValueError(
+                f"index_type must be one of {INDEX_TYPES}, got {self.index_type!r}"
+            )
+        if self.index_type == "factory" and not self.factory_string:
+            raise ValueError("index_type 'factory' requires factory_string")
+
+    def factory(self) -> str:
+        return {
+            "flat": "Flat",
+            "sq8": "SQ8",
+            "fp16": "SQfp16",
+            # A single-list IVF scans like IndexPQ but, unlike it, accepts
+            # the ID selectors that filters and tombstones rely on.
+            "pq": f"IVF1,PQ{self.pq_m}x{self.pq_nbits}",
+            "opq_pq": f"OPQ{self.pq_m},IVF1,PQ{self.pq_m}x{self.pq_nbits}",
+            "ivf_flat": f"IVF{self.nlist},Flat",
+            "ivf_pq": f"IVF{self.nlist},PQ{self.pq_m}x{self.pq_nbits}",
+            "hnsw_flat": f"HNSW{self.hnsw_m},Flat",
+            "factory": self.factory_string,
+        }[self.index_type]
+
+    def build(self, dim: int) -> faiss.Index:
+        if self.index_type == "flat":
+            return faiss.IndexFlatIP(dim)
+
+        index = faiss.index_factory(dim, self.factory(), faiss.METRIC_INNER_PRODUCT)
+        if not supports_selectors(index):
+            raise ValueError(
+                f"{self.factory()!r} can't be searched with ID selectors, "
+                "which filters and deletes need"
+            )
+
+        hnsw_index = faiss.downcast_index(index)
+        if hasattr(hnsw_index, "hnsw"):
+            hnsw_index.hnsw.efConstruction = self.ef_construction
+
+        return index
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FaissIndexConfig":
+        return cls(**data)
+
+
 class FaissVectorStore(VectorStore):
-    def __init__(self, dim: int):
+    """
+    Local FAISS index with upsert and delete semantics.
+
+    Vectors are addressed by position (row in the index, the UID map and
+    the attribute index). Deleting a UID, or upserting it again, adds its
+    old position to a set of tombstones instead of touching the index;
+    tombstoned rows are excluded inside the FAISS search by the same
+    IDSelectorBitmap that applies filters. `compact` rebuilds the index
+    without them, which `save` does automatically once they exceed
+    `config.max_deleted_fraction`, so search cost stays proportional to
+    live vectors.
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        config: FaissIndexConfig | None = None,
+        index: faiss.Index | None = None,  # an existing index, e.g. loaded
+    ):
         self.dim = dim
-        self.index = faiss.IndexFlatIP(dim)
-        self.id_map: List[str] = []  # position → UID
+        self.config = config or FaissIndexConfig()
+        self.index = index if index is not None else self.config.build(dim)
+        self.id_map = UidMap()  # position ↔ UID
+        self.attributes = AttributeIndex()  # position → filter attributes
+        self.tombstones: set[int] = set()  # positions of deleted rows
+        self.read_only = False
+
+        # Normalized float32 vectors by position, for re-ranking: chunks
+        # (the first one memory-mapped after load), or None if not kept.
+        self._raw_chunks: List[np.ndarray] | None = [] if self.config.rerank_k > 0 else None
+
+        # Packed bitmap of live rows and the row count it was built for;
+        # rebuilt after deletes and whenever rows are added.
+        self._live_bitmap: np.ndarray | None = None
+        self._live_ntotal = 0
+
+        self._compactions = 0
+        self._reclaimed = 0
+        self._last_compaction_s: float | None = None
+
+        # Vectors received before a trainable index has been trained.
+        self._pending_ids: List[str] = []
+        self._pending_vecs: List[np.ndarray] = []
+        self._pending_metadatas: List[Metadata | None] = []
+
+        self._apply_search_params()
 
     # ---------- Core operations ----------
 
@@ -20,16 +201,108 @@ class FaissVectorStore(VectorStore):
         self,
         ids: List[str],
         vectors: List[Vector],
-        metadatas: Optional[List[Metadata]] = None,  # intentionally ignored
+        metadatas: Optional[List[Metadata]] = None,  # filter attributes only
     ) -> None:
         if len(ids) != len(vectors):
             raise ValueError("ids and vectors must have same length")
+        if metadatas is not None and len(metadatas) != len(ids):
+            raise ValueError("metadatas must align with ids")
+        if self.read_only:
+            raise RuntimeError("index was loaded memory-mapped and is read-only")
+
+        vecs = np.array(vectors, dtype="float32", ndmin=2)
+        faiss.normalize_L2(vecs)
+
+        metadatas = metadatas or [None] * len(ids)
+
+        # Last write wins, within the batch as across batches.
+        latest = {uid: i for i, uid in enumerate(ids)}
+        if len(latest) != len(ids):
+            rows = sorted(latest.values())
+            ids = [ids[i] for i in rows]
+            vecs = vecs[rows]
+            metadatas = [metadatas[i] for i in rows]
+        self._remove(ids)
+
+        if self.index.is_trained:
+            self.index.add(vecs)
+            self.id_map.extend(ids)
+            self.attributes.extend(metadatas)
+            self._extend_raw(vecs)
+            return
+
+        # IVF / PQ indexes need a training sample before anything can be
+        # added; buffer until we have `train_size` vectors.
+        self._pending_ids.extend(ids)
+        self._pending_vecs.append(vecs)
+        self._pending_metadatas.extend(metadatas)
 
-        vecs = np.asarray(vectors, dtype="float32")
+        if len(self._pending_ids) >= self.config.train_size:
+            self.flush()
+
+    def train(self, vectors: List[Vector]) -> None:
+        """
+        Train the index on a representative sample of vectors.
+        """
+        vecs = np.array(vectors, dtype="float32", ndmin=2)
         faiss.normalize_L2(vecs)
+        self.index.train(vecs)
+
+    def flush(self) -> None:
+        """
+        Train on the buffered vectors (if the index still needs it) and
+        add them to the index.
+        """
+        if not self._pending_ids:
+            return
+
+        vecs = np.concatenate(self._pending_vecs)
+
+        if not self.index.is_trained:
+            if len(vecs) < self.config.nlist and self.config.index_type.startswith("ivf"):
+                raise ValueError(
+                    f"need at least nlist={self.config.nlist} vectors to train, "
+                    f"got {len(vecs)}"
+                )
+            # already normalized in upsert
+            self.index.train(vecs[: self.config.train_size])
 
         self.index.add(vecs)
-        self.id_map.extend(ids)
+        self.id_map.extend(self._pending_ids)
+        self.attributes.extend(self._pending_metadatas)
+        self._extend_raw(vecs)
+
+        self._pending_ids = []
+        self._pending_vecs = []
+        self._pending_metadatas = []
+
+    def is_trained(self) -> bool:
+        return self.index.is_trained
+
+    def keeps_raw_vectors(self) -> bool:
+        return self._raw_chunks is not None
+
+    def set_search_params(
+        self,
+        nprobe: int | None = None,
+        ef_search: int | None = None,
+        rerank_k: int | None = None,
+    ) -> None:
+        """
+        Change query-time parameters. Parameters that don't apply to the
+        index type are ignored, as is `rerank_k` for an index stored
+        without raw vectors.
+        """
+        changes = {}
+        if nprobe is not None:
+            changes["nprobe"] = nprobe
+        if ef_search is not None:
+            changes["ef_search"] = ef_search
+        if rerank_k is not None:
+            changes["rerank_k"] = rerank_k
+
+        self.config = replace(self.config, **changes)
+        self._apply_search_params()
 
     def query(
         self,
@@ -37,62 +310,439 @@ class FaissVectorStore(VectorStore):
         k: int,
         filters: Optional[Metadata] = None,
     ) -> Tuple[List[str], List[float]]:
-        vec = np.asarray([vector], dtype="float32")
-        faiss.normalize_L2(vec)
+        return self.query_batch([vector], k, filters)[0]
 
-        scores, indices = self.index.search(vec, k)
+    def query_batch(
+        self,
+        vectors: List[Vector],
+        k: int,
+        filters: Optional[Metadata] = None,
+    ) -> List[Tuple[List[str], List[float]]]:
+        """
+        Search many vectors at once. `filters` (see AttributeIndex) is
+        applied inside the FAISS search, so a filtered query still returns
+        up to k matches without over-fetching. With re-ranking, the
+        top `rerank_k` candidates are re-scored against the raw vectors.
+        """
+        self.flush()
 
-        results: List[str] = []
-        score_list: List[float] = []
+        vecs = np.array(vectors, dtype="float32", ndmin=2)
+        faiss.normalize_L2(vecs)
 
-        for score, i in zip(scores[0], indices[0]):
-            if i == -1:
-                continue
-            results.append(self.id_map[i])
-            score_list.append(float(score))
+        bitmap = None
+        if filters:
+            if len(self.attributes) != self.index.ntotal:
+                raise ValueError("this index was built without filter attributes")
+            bitmap = self.attributes.bitmap(filters)
+        if self.tombstones:
+            live = self._live()
+            bitmap = live if bitmap is None else np.bitwise_and(bitmap, live)
+
+        rerank = self._raw_chunks is not None and self.config.rerank_k > 0
+        candidates = max(k, self.config.rerank_k) if rerank else k
+
+        # One matrix search lets FAISS use its batched BLAS path.
+        if bitmap is not None:
+            # `bitmap` backs the selector and must outlive the search.
+            selector = faiss.IDSelectorBitmap(self.index.ntotal, faiss.swig_ptr(bitmap))
+            scores, indices = self.index.search(
+                vecs, candidates, params=self._search_parameters(selector)
+            )
+        else:
+            scores, indices = self.index.search(vecs, candidates)
+
+        if rerank:
+            scores, indices = self._rerank(vecs, indices, k)
+
+        batch: List[Tuple[List[str], List[float]]] = []
 
-        return results, score_list
+        for row_scores, row_indices in zip(scores, indices):
+            found = row_indices != -1
+            batch.append((
+                self.id_map.lookup(row_indices[found]),
+                row_scores[found].tolist(),
+            ))
+
+        return batch
 
     def delete(self, ids: List[str]) -> None:
-        raise NotImplementedError(
-            "FAISS IndexFlat does not support deletes without rebuilding"
-        )
+        """
+        Tombstone the vectors of `ids`. UIDs that aren't stored are
+        ignored.
+        """
+        if self.read_only:
+            raise RuntimeError("index was loaded memory-mapped and is read-only")
+        self._remove(ids)
 
     def count(self) -> int:
-        return self.index.ntotal
+        return self.index.ntotal - len(self.tombstones) + len(self._pending_ids)
+
+    def deleted_fraction(self) -> float:
+        return len(self.tombstones) / self.index.ntotal if self.index.ntotal else 0.0
+
+    def compact(self) -> int:
+        """
+        Rebuild the index from its live rows, dropping tombstones. Returns
+        the number of rows reclaimed.
+
+        Vectors are read in chunks, from the raw vectors if they are
+        kept and otherwise reconstructed from the index, and added to an
+        empty copy of the index, so trained quantizers are reused and the
+        peak extra memory is the new index plus one chunk. Without raw
+        vectors, SQ/PQ codes are re-encoded from their decoded values,
+        which (nearly always) gives the same codes.
+        """
+        if self.read_only:
+            raise RuntimeError("index was loaded memory-mapped and is read-only")
+
+        self.flush()
+        if not self.tombstones:
+            return 0
+
+        started = time.perf_counter()
+        ntotal = self.index.ntotal
+
+        live = np.ones(ntotal, dtype=bool)
+        live[np.fromiter(self.tombstones, dtype=np.int64, count=len(self.tombstones))] = False
+
+        index = self.config.build(self.dim)
+        if not index.is_trained:
+            index = faiss.clone_index(self.index)
+            index.reset()
+
+        ivf = faiss.try_extract_index_ivf(self.index)
+        if ivf is not None and self._raw_chunks is None:
+            ivf.make_direct_map()
+
+        raw_chunks = None if self._raw_chunks is None else []
+        for start in range(0, ntotal, COMPACT_CHUNK):
+            n = min(COMPACT_CHUNK, ntotal - start)
+            keep = live[start:start + n]
+            if not keep.any():
+                continue
+            if self._raw_chunks is not None:
+                vecs = self._raw_rows(np.arange(start, start + n))[keep]
+                raw_chunks.append(vecs)
+            else:
+                vecs = self.index.reconstruct_n(start, n)[keep]
+            index.add(vecs)
+
+        positions = np.flatnonzero(live)
+        self.index = index
+        self._raw_chunks = raw_chunks
+        self.id_map = self.id_map.take(positions)
+        if len(self.attributes) == ntotal:
+            self.attributes = self.attributes.take(positions)
+
+        reclaimed = len(self.tombstones)
+        self.tombstones = set()
+        self._live_bitmap = None
+        self._apply_search_params()
+
+        self._compactions += 1
+        self._reclaimed += reclaimed
+        self._last_compaction_s = time.perf_counter() - started
+        return reclaimed
+
+    def maybe_compact(self) -> int:
+        """
+        Compact if tombstones exceed `config.max_deleted_fraction`.
+        """
+        if self.read_only or self.deleted_fraction() <= self.config.max_deleted_fraction:
+            return 0
+        return self.compact()
+
+    def compaction_stats(self) -> Dict[str, Any]:
+        return {
+            "rows": self.index.ntotal,
+            "live": self.index.ntotal - len(self.tombstones),
+            "deleted": len(self.tombstones),
+            "deleted_fraction": round(self.deleted_fraction(), 4),
+            "compactions": self._compactions,
+            "reclaimed": self._reclaimed,
+            "last_compaction_s": self._last_compaction_s,
+        }
 
     # ---------- Persistence ----------
 
-    def save(self, path: str | Path) -> None:
+    def save(self, path: str | Path, publish: bool = True) -> None:
         """
         Persist FAISS index + ID map to disk.
 
         Layout:
             path/
               ├─ index.faiss
-              └─ ids.json
+              ├─ ids.bin
+              ├─ index_config.json
+              ├─ attributes.npz
+              ├─ tombstones.npy
+              ├─ vectors.npy  (with rerank_k > 0)
+              └─ VERSION
+
+        VERSION is removed before and rewritten after the index + ID map,
+        and every file is written to a temporary name and atomically
+        renamed into place. A reader that sees the same VERSION before and
+        after loading is therefore guaranteed a consistent pair. Renaming
+        also means processes that memory-mapped the previous files keep
+        reading the old inodes safely.
+
+        With publish=False VERSION is left absent, so callers can add
+        more files to the directory and `publish` it afterwards.
         """
+        self.flush()
+        self.maybe_compact()
+
         path = Path(path)
         path.mkdir(parents=True, exist_ok=True)
 
-        faiss.write_index(self.index, str(path / "index.faiss"))
+        (path / "VERSION").unlink(missing_ok=True)
 
-        with open(path / "ids.json", "w") as f:
-            json.dump(self.id_map, f)
+        tmp_index = path / "index.faiss.tmp"
+        faiss.write_index(self.index, str(tmp_index))
+        os.replace(tmp_index, path / "index.faiss")
+
+        tmp_ids = path / "ids.bin.tmp"
+        self.id_map.save(tmp_ids)
+        os.replace(tmp_ids, path / "ids.bin")
+
+        tmp_attributes = path / "attributes.npz.tmp"
+        self.attributes.save(tmp_attributes)
+        os.replace(tmp_attributes, path / "attributes.npz")
+
+        tmp_tombstones = path / "tombstones.npy.tmp"
+        with open(tmp_tombstones, "wb") as f:
+            np.save(f, np.array(sorted(self.tombstones), dtype=np.int64))
+        os.replace(tmp_tombstones, path / "tombstones.npy")
+
+        if self._raw_chunks is not None:
+            self._save_raw(path / f"{RAW_VECTORS}.tmp")
+            os.replace(path / f"{RAW_VECTORS}.tmp", path / RAW_VECTORS)
+        else:
+            # A stale copy would no longer line up with the index.
+            (path / RAW_VECTORS).unlink(missing_ok=True)
+
+        tmp_config = path / "index_config.json.tmp"
+        with open(tmp_config, "w") as f:
+            json.dump(self.config.to_dict(), f, indent=2)
+        os.replace(tmp_config, path / "index_config.json")
+
+        if publish:
+            self.publish(path)
+
+    @staticmethod
+    def publish(path: str | Path) -> str:
+        """
+        Write a fresh VERSION token, making the artifacts at `path`
+        visible to readers. Returns the token.
+        """
+        version = uuid.uuid4().hex
+        tmp_version = Path(path) / "VERSION.tmp"
+        tmp_version.write_text(version)
+        os.replace(tmp_version, Path(path) / "VERSION")
+        return version
+
+    @staticmethod
+    def read_version(path: str | Path) -> str | None:
+        """
+        Return the opaque version token of the artifacts at `path`, or
+        None if there is no complete, published index there.
+        """
+        try:
+            return (Path(path) / "VERSION").read_text().strip()
+        except FileNotFoundError:
+            return None
 
     @classmethod
-    def load(cls, path: str | Path) -> "FaissVectorStore":
+    def load(cls, path: str | Path, mmap: bool = False) -> "FaissVectorStore":
         """
         Load FAISS index + ID map from disk.
+
+        With mmap=True the index codes and the ID map are memory-mapped
+        instead of read into the heap: load is near-instant, replicas on
+        the same host share the page cache, and the store is read-only.
+        Artifacts with the legacy ids.json are still readable.
         """
         path = Path(path)
 
-        index = faiss.read_index(str(path / "index.faiss"))
+        io_flags = 0
+        if mmap:
+            io_flags = MMAP_IO_FLAG | faiss.IO_FLAG_READ_ONLY
+        index = faiss.read_index(str(path / "index.faiss"), io_flags)
 
-        with open(path / "ids.json") as f:
-            id_map = json.load(f)
+        if (path / "ids.bin").exists():
+            id_map = UidMap.load(path / "ids.bin", mmap=mmap)
+        else:
+            with open(path / "ids.json") as f:
+                id_map = UidMap.from_list(json.load(f))
 
-        store = cls(index.d)
-        store.index = index
+        if len(id_map) != index.ntotal:
+            raise ValueError(
+                f"ID map has {len(id_map)} entries but index has {index.ntotal}"
+            )
+
+        config = FaissIndexConfig()
+        if (path / "index_config.json").exists():
+            with open(path / "index_config.json") as f:
+                config = FaissIndexConfig.from_dict(json.load(f))
+
+        store = cls(index.d, config, index=index)
         store.id_map = id_map
+        if (path / "attributes.npz").exists():
+            store.attributes = AttributeIndex.load(path / "attributes.npz")
+        if (path / "tombstones.npy").exists():
+            store.tombstones = set(np.load(path / "tombstones.npy").tolist())
+
+        # Raw vectors are always memory-mapped: they are only read for
+        # the candidates being re-ranked.
+        store._raw_chunks = None
+        if (path / RAW_VECTORS).exists():
+            # (an empty array can't be mapped)
+            raw = np.load(path / RAW_VECTORS, mmap_mode="r" if index.ntotal else None)
+            if raw.shape != (index.ntotal, index.d):
+                raise ValueError(
+                    f"{RAW_VECTORS} has shape {raw.shape} but index has "
+                    f"{index.ntotal} vectors of dim {index.d}"
+                )
+            store._raw_chunks = [raw]
+        store.read_only = mmap
+        store._apply_search_params()
         return store
+
+    # ---------- Helpers ----------
+
+    def _remove(self, ids: List[str]) -> None:
+        """
+        Tombstone the stored rows of `ids` and drop any still buffered.
+        """
+        for uid in ids:
+            for position in self.id_map.positions(uid):
+                if position not in self.tombstones:
+                    self.tombstones.add(position)
+                    self._live_bitmap = None
+
+        if self._pending_ids:
+            removed = set(ids)
+            keep = [i for i, uid in enumerate(self._pending_ids) if uid not in removed]
+            if len(keep) != len(self._pending_ids):
+                self._pending_vecs = [np.concatenate(self._pending_vecs)[keep]]
+                self._pending_ids = [self._pending_ids[i] for i in keep]
+                self._pending_metadatas = [self._pending_metadatas[i] for i in keep]
+
+    def _extend_raw(self, vecs: np.ndarray) -> None:
+        if self._raw_chunks is not None:
+            self._raw_chunks.append(vecs)
+
+    def _raw_rows(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Raw vectors at `positions`. Chunks appended since load are merged
+        into one, so rows come from the mapped file or a single array.
+        """
+        chunks = self._raw_chunks
+        # Nothing stored yet, or every candidate was filtered out.
+        if not chunks or not len(positions):
+            return np.empty((0, self.dim), dtype="float32")
+        if len(chunks) > 2:
+            chunks[1:] = [np.concatenate(chunks[1:])]
+        if len(chunks) == 1:
+            return np.asarray(chunks[0][positions])
+
+        split = len(chunks[0])
+        rows = np.empty((len(positions), self.dim), dtype="float32")
+        head = positions < split
+        rows[head] = chunks[0][positions[head]]
+        rows[~head] = chunks[1][positions[~head] - split]
+        return rows
+
+    def _rerank(
+        self,
+        queries: np.ndarray,
+        indices: np.ndarray,
+        k: int,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Exact scores of each query's candidates; the best k of them, in
+        the layout of `index.search`.
+        """
+        scores = np.full((len(queries), k), -np.inf, dtype="float32")
+        top_indices = np.full((len(queries), k), -1, dtype=np.int64)
+
+        for i, (query, candidates) in enumerate(zip(queries, indices)):
+            candidates = candidates[candidates != -1]
+            exact = self._raw_rows(candidates) @ query
+            top = np.argsort(-exact, kind="stable")[:k]
+            scores[i, :len(top)] = exact[top]
+            top_indices[i, :len(top)] = candidates[top]
+
+        return scores, top_indices
+
+    def _save_raw(self, path: Path) -> None:
+        # Written chunk by chunk, so a mapped file is never read whole.
+        ntotal = sum(len(chunk) for chunk in self._raw_chunks)
+        # open_memmap can't create an empty file.
+        if not ntotal:
+            with open(path, "wb") as f:
+                np.save(f, np.empty((0, self.dim), dtype="float32"))
+            return
+
+        out = np.lib.format.open_memmap(
+            path, mode="w+", dtype="float32", shape=(ntotal, self.dim)
+        )
+        offset = 0
+        for chunk in self._raw_chunks:
+            out[offset:offset + len(chunk)] = chunk
+            offset += len(chunk)
+        out.flush()
+        del out
+
+    def _live(self) -> np.ndarray:
+        # Keyed on ntotal, not the bitmap's length: packbits zero-pads the
+        # last byte, so rows added within it would read as deleted.
+        if self._live_bitmap is None or self._live_ntotal != self.index.ntotal:
+            live = np.ones(self.index.ntotal, dtype=bool)
+            live[np.fromiter(self.tombstones, dtype=np.int64, count=len(self.tombstones))] = False
+            # IDSelectorBitmap tests bit (i & 7) of byte (i >> 3).
+            self._live_bitmap = np.packbits(live, bitorder="little")
+            self._live_ntotal = self.index.ntotal
+        return self._live_bitmap
+
+    def _search_parameters(
+        self,
+        selector: faiss.IDSelector,
+        index: faiss.Index | None = None,
+    ) -> faiss.SearchParameters:
+        # Per-call parameters replace the index-level ones, so nprobe /
+        # efSearch have to be carried over explicitly.
+        index = faiss.downcast_index(index or self.index)
+        if isinstance(index, faiss.IndexPreTransform):
+            # e.g. OPQ: the selector applies to the wrapped index
+            return faiss.SearchParametersPreTransform(
+                index_params=self._search_parameters(selector, index.index)
+            )
+        if isinstance(index, faiss.IndexRefine):
+            # the base index picks the candidates that get refined
+            return faiss.IndexRefineSearchParameters(
+                base_index_params=self._search_parameters(selector, index.base_index),
+                k_factor=index.k_factor,
+            )
+        if isinstance(index, faiss.IndexIVF):
+            return faiss.SearchParametersIVF(sel=selector, nprobe=self.config.nprobe)
+        if isinstance(index, faiss.IndexHNSW):
+            return faiss.SearchParametersHNSW(sel=selector, efSearch=self.config.ef_search)
+        if isinstance(index, SELECTOR_INDEXES):
+            return faiss.SearchParameters(sel=selector)
+        # e.g. an index saved before build() rejected such factory strings
+        raise ValueError(
+            f"{type(index).__name__} can't be searched with ID selectors, "
+            "which filters and deletes need"
+        )
+
+    def _apply_search_params(self) -> None:
+        params = faiss.ParameterSpace()
+        for name, value in (
+            ("nprobe", self.config.nprobe),
+            ("efSearch", self.config.ef_search),
+        ):
+            try:
+                params.set_index_parameter(self.index, name, value)
+            except RuntimeError:
+                pass  # not applicable to this index type
@@ -0,0 +1,288 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .faiss_vector_store import FaissVectorStore
+from .vector_store import VectorStore
+from ..typing_defs import Vector, Metadata
+
+PARTITIONS = ("uid", "source")
+
+SHARDING_FILE = "sharding.json"
+
+
+def uid_shard(uid: str, shards: int) -> int:
+    # UIDs are SHA-256 hex digests, so any prefix is uniformly distributed.
+    return int(uid[:16], 16) % shards
+
+
+def shard_dir(shard: int) -> str:
+    return f"shard-{shard:03d}"
+
+
+class ShardedVectorStore(VectorStore):
+    """
+    Vector store partitioned across several shards, each a VectorStore
+    of its own (a FaissVectorStore, or a RemoteShard served by another
+    retrieval process).
+
+    Partitioning:
+    - uid: fixed number of shards, chosen by UID hash
+    - source: one shard per dataset (metadata "source"); shards for new
+      sources are created with `shard_factory`
+
+    Queries are scattered to every shard in parallel (FAISS releases the
+    GIL; remote shards wait on the network) and each shard's top-k are
+    merged. All shards use the same metric over L2-normalized vectors, so
+    scores are comparable and the merged top-k is exactly the top-k of
+    the union. Ties are broken by UID for a stable order.
+    """
+
+    def __init__(
+        self,
+        shards: List[VectorStore],
+        partition: str = "uid",
+        sources: List[str] | None = None,
+        shard_factory: Callable[[], VectorStore] | None = None,
+        search_workers: int | None = None,
+    ):
+        if partition not in PARTITIONS:
+            raise ValueError(f"partition must be one of {PARTITIONS}, got {partition!r}")
+        if partition == "uid" and not shards:
+            raise ValueError("uid partitioning needs at least one shard")
+        if not shards and shard_factory is None:
+            raise ValueError("source partitioning needs a shard or a shard_factory")
+        if partition == "source" and len(sources or []) != len(shards):
+            raise ValueError("source partitioning needs one source per shard")
+
+        self.shards = list(shards)
+        self.partition = partition
+        self.sources = list(sources or [])
+        self.shard_factory = shard_factory
+        self._executor = ThreadPoolExecutor(
+            max_workers=search_workers,
+            thread_name_prefix="shard-search",
+        )
+
+    @property
+    def dim(self) -> int:
+        return self._first_shard().dim
+
+    @property
+    def config(self):
+        # Shards are built alike; the first one speaks for all of them.
+        return self._first_shard().config
+
+    # ---------- Core operations ----------
+
+    def upsert(
+        self,
+        ids: List[str],
+        vectors: List[Vector],
+        metadatas: Optional[List[Metadata]] = None,
+    ) -> None:
+        if len(ids) != len(vectors):
+            raise ValueError("ids and vectors must have same length")
+        if metadatas is not None and len(metadatas) != len(ids):
+            raise ValueError("metadatas must align with ids")
+
+        groups: Dict[int, List[int]] = {}
+        for i, uid in enumerate(ids):
+            metadata = metadatas[i] if metadatas is not None else None
+            groups.setdefault(self.shard_for(uid, metadata), []).append(i)
+
+        for shard, rows in groups.items():
+            self.shards[shard].upsert(
+                [ids[i] for i in rows],
+                [vectors[i] for i in rows],
+                [metadatas[i] for i in rows] if metadatas is not None else None,
+            )
+
+    def shard_for(self, uid: str, metadata: Metadata | None = None) -> int:
+        if self.partition == "uid":
+            return uid_shard(uid, len(self.shards))
+
+        source = (metadata or {}).get("source")
+        if source is None:
+            raise ValueError(f"{uid}: source partitioning needs a 'source' attribute")
+        if source not in self.sources:
+            if self.shard_factory is None:
+                raise ValueError(f"no shard for source {source!r}")
+            self.shards.append(self.shard_factory())
+            self.sources.append(source)
+        return self.sources.index(source)
+
+    def flush(self) -> None:
+        for shard in self.shards:
+            if hasattr(shard, "flush"):
+                shard.flush()
+
+    def is_trained(self) -> bool:
+        return all(shard.is_trained() for shard in self.shards if hasattr(shard, "is_trained"))
+
+    def set_search_params(
+        self,
+        nprobe: int | None = None,
+        ef_search: int | None = None,
+        rerank_k: int | None = None,
+    ) -> None:
+        for shard in self.shards:
+            if hasattr(shard, "set_search_params"):
+                shard.set_search_params(nprobe=nprobe, ef_search=ef_search, rerank_k=rerank_k)
+
+    def query(
+        self,
+        vector: Vector,
+        k: int,
+        filters: Optional[Metadata] = None,
+    ) -> Tuple[List[str], List[float]]:
+        return self.query_batch([vector], k, filters)[0]
+
+    def query_batch(
+        self,
+        vectors: List[Vector],
+        k: int,
+        filters: Optional[Metadata] = None,
+    ) -> List[Tuple[List[str], List[float]]]:
+        """
+        Search every shard for the top-k of each vector and merge.
+        """
+        vecs = np.array(vectors, dtype="float32", ndmin=2)
+
+        # Any shard failing fails the query: partial results would be
+        # silently wrong rather than just slower.
+        per_shard = list(
+            self._executor.map(
+                lambda shard: shard.query_batch(vecs, k, filters),
+                self.shards,
+            )
+        )
+
+        batch: List[Tuple[List[str], List[float]]] = []
+        for results in zip(*per_shard):
+            candidates = [
+                (score, uid)
+                for ids, scores in results
+                for uid, score in zip(ids, scores)
+            ]
+            candidates.sort(key=lambda candidate: (-candidate[0], candidate[1]))
+            top = candidates[:k]
+            batch.append(([uid for _, uid in top], [score for score, _ in top]))
+
+        return batch
+
+    def delete(self, ids: List[str]) -> None:
+        if self.partition == "uid":
+            groups: Dict[int, List[str]] = {}
+            for uid in ids:
+                groups.setdefault(uid_shard(uid, len(self.shards)), []).append(uid)
+            for shard, uids in groups.items():
+                self.shards[shard].delete(uids)
+            return
+
+        # The source of a UID isn't known here; every shard ignores UIDs
+        # it doesn't have.
+        for shard in self.shards:
+            shard.delete(ids)
+
+    def count(self) -> int:
+        return sum(shard.count() for shard in self.shards)
+
+    def compact(self) -> int:
+        return sum(shard.compact() for shard in self.shards if hasattr(shard, "compact"))
+
+    def compaction_stats(self) -> Dict[str, Any]:
+        """
+        Compaction stats summed over the local shards.
+        """
+        totals: Dict[str, Any] = dict.fromkeys(
+            ("rows", "live", "deleted", "compactions", "reclaimed"), 0
+        )
+        for shard in self.shards:
+            if hasattr(shard, "compaction_stats"):
+                stats = shard.compaction_stats()
+                for name in totals:
+                    totals[name] += stats[name]
+        totals["deleted_fraction"] = (
+            round(totals["deleted"] / totals["rows"], 4) if totals["rows"] else 0.0
+        )
+        return totals
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        for shard in self.shards:
+            if hasattr(shard, "close"):
+                shard.close()
+
+    # ---------- Persistence ----------
+
+    def save(self, path: str | Path, publish: bool = True) -> None:
+        """
+        Persist every shard to its own subdirectory, each a complete
+        FaissVectorStore artifact directory:
+
+            path/
+              ├─ shard-000/ ... shard-NNN/
+              ├─ sharding.json
+              └─ VERSION
+
+        As with FaissVectorStore.save, VERSION is written last.
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+
+        (path / "VERSION").unlink(missing_ok=True)
+
+        for i, shard in enumerate(self.shards):
+            shard.save(path / shard_dir(i))
+
+        tmp_layout = path / f"{SHARDING_FILE}.tmp"
+        with open(tmp_layout, "w") as f:
+            json.dump(self.layout(), f, indent=2)
+        os.replace(tmp_layout, path / SHARDING_FILE)
+
+        if publish:
+            FaissVectorStore.publish(path)
+
+    def layout(self) -> Dict[str, Any]:
+        return {
+            "partition": self.partition,
+            "shards": [shard_dir(i) for i in range(len(self.shards))],
+            "sources": self.sources,
+        }
+
+    @staticmethod
+    def is_sharded(path: str | Path) -> bool:
+        return (Path(path) / SHARDING_FILE).exists()
+
+    @classmethod
+    def load(cls, path: str | Path, mmap: bool = False) -> "ShardedVectorStore":
+        path = Path(path)
+        with open(path / SHARDING_FILE) as f:
+            layout = json.load(f)
+
+        shards = [FaissVectorStore.load(path / name, mmap=mmap) for name in layout["shards"]]
+
+        shard_factory = None
+        if layout["partition"] == "source" and shards and not mmap:
+            dim, config = shards[0].dim, shards[0].config
+            shard_factory = lambda: FaissVectorStore(dim, config)
+
+        return cls(
+            shards,
+            partition=layout["partition"],
+            sources=layout["sources"],
+            shard_factory=shard_factory,
+        )
+
+    # ---------- Helpers ----------
+
+    def _first_shard(self) -> VectorStore:
+        # Source partitioning can start empty and create shards on upsert.
+        if not self.shards:
+            raise ValueError("no shards yet: nothing has been upserted")
+        return self.shards[0]
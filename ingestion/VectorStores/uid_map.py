@@ -0,0 +1,201 @@
+import struct
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+
+
+class UidMap:
+    """
+    Position → UID map for FaissVectorStore, with a reverse UID → position
+    lookup.
+
+    UIDs are SHA-256 hex digests. They are held as raw 32-byte digests in
+    one (N, 32) uint8 NumPy array and only converted to hex at the API
+    boundary, so a loaded map is a single compact buffer that can be
+    memory-mapped and shared between processes. UIDs appended after load
+    are kept in a small tail until the map is saved.
+
+    File layout (little-endian):
+        magic   8 bytes  b"ALTHUIDS"
+        version uint32   1: ASCII hex, 2: raw digests
+        width   uint32   bytes per UID
+        count   uint64
+        data    count * width bytes
+    """
+
+    MAGIC = b"ALTHUIDS"
+    VERSION = 2
+    WIDTH = 32
+    HEADER = struct.Struct("<8sIIQ")
+
+    def __init__(self):
+        self._base = np.empty((0, self.WIDTH), dtype=np.uint8)
+        self._tail: List[bytes] = []
+        self._tail_positions: Dict[bytes, int] = {}
+
+        # argsort of _base, built on first reverse lookup
+        self._order: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self._base) + len(self._tail)
+
+    def __getitem__(self, position: int) -> str:
+        if position < len(self._base):
+            return self._base[position].tobytes().hex()
+        return self._tail[position - len(self._base)].hex()
+
+    def lookup(self, positions: Sequence[int]) -> List[str]:
+        """
+        Hex UIDs for many positions with a single conversion.
+        """
+        if self._tail:
+            return [self[p] for p in positions]
+
+        digests = self._base[np.asarray(positions, dtype=np.int64)].tobytes().hex()
+        width = 2 * self.WIDTH
+        return [digests[i:i + width] for i in range(0, len(digests), width)]
+
+    def extend(self, uids: Iterable[str]) -> None:
+        for uid in uids:
+            digest = self.encode(uid)
+            self._tail_positions[digest] = len(self)
+            self._tail.append(digest)
+
+    def position(self, uid: str) -> int | None:
+        """
+        Row of `uid`, or None if it isn't in the map.
+        """
+        digest = self.encode(uid)
+
+        if digest in self._tail_positions:
+            return self._tail_positions[digest]
+
+        if not len(self._base):
+            return None
+
+        keys = self._keys()
+        order = self._sorted_order()
+        i = int(np.searchsorted(keys, np.array(digest, dtype=keys.dtype), sorter=order))
+
+        if i < len(order) and keys[order[i]].tobytes() == digest:
+            return int(order[i])
+        return None
+
+    def positions(self, uid: str) -> List[int]:
+        """
+        Every row holding `uid`, oldest first. A UID that was upserted
+        again appears more than once; FaissVectorStore tombstones all but
+        the newest. Of repeats appended since load, only the newest is
+        returned.
+        """
+        digest = self.encode(uid)
+        found = []
+
+        if len(self._base):
+            keys = self._keys()
+            order = self._sorted_order()
+            key = np.array(digest, dtype=keys.dtype)
+            lo = int(np.searchsorted(keys, key, side="left", sorter=order))
+            hi = int(np.searchsorted(keys, key, side="right", sorter=order))
+            found.extend(sorted(int(p) for p in order[lo:hi]))
+
+        if digest in self._tail_positions:
+            found.append(self._tail_positions[digest])
+        return found
+
+    def take(self, positions: np.ndarray) -> "UidMap":
+        """
+        A new map holding only the UIDs at `positions`, in that order.
+        """
+        uid_map = UidMap()
+        uid_map._base = self._data()[positions]
+        return uid_map
+
+    def __contains__(self, uid: str) -> bool:
+        return self.position(uid) is not None
+
+    def to_list(self) -> List[str]:
+        return [self[i] for i in range(len(self))]
+
+    # ---------- Persistence ----------
+
+    def save(self, path: str | Path) -> None:
+        data = self._data()
+
+        with open(path, "wb") as f:
+            f.write(self.HEADER.pack(self.MAGIC, self.VERSION, self.WIDTH, len(data)))
+            f.write(np.ascontiguousarray(data).tobytes())
+
+    @classmethod
+    def load(cls, path: str | Path, mmap: bool = False) -> "UidMap":
+        """
+        Read a UID map in a single read. With mmap=True the digests are
+        not copied into the process; pages are read on demand and shared
+        via the page cache.
+        """
+        with open(path, "rb") as f:
+            magic, version, width, count = cls.HEADER.unpack(f.read(cls.HEADER.size))
+
+        if magic != cls.MAGIC:
+            raise ValueError(f"{path} is not a UID map")
+
+        uid_map = cls()
+
+        if version == 1:
+            hex_uids = np.fromfile(
+                path, dtype=f"S{width}", count=count, offset=cls.HEADER.size
+            )
+            uid_map._base = np.frombuffer(
+                bytes.fromhex(b"".join(hex_uids).decode("ascii")), dtype=np.uint8
+            ).reshape(-1, cls.WIDTH)
+        elif version == 2:
+            if mmap and count:
+                uid_map._base = np.memmap(
+                    path,
+                    dtype=np.uint8,
+                    mode="r",
+                    offset=cls.HEADER.size,
+                    shape=(count, cls.WIDTH),
+                )
+            else:
+                uid_map._base = np.fromfile(
+                    path, dtype=np.uint8, count=count * cls.WIDTH, offset=cls.HEADER.size
+                ).reshape(count, cls.WIDTH)
+        else:
+            raise ValueError(f"unsupported UID map version {version}")
+
+        return uid_map
+
+    @classmethod
+    def from_list(cls, uids: List[str]) -> "UidMap":
+        uid_map = cls()
+        uid_map.extend(uids)
+        return uid_map
+
+    # ---------- Helpers ----------
+
+    @classmethod
+    def encode(cls, uid: str) -> bytes:
+        try:
+            digest = bytes.fromhex(uid)
+        except ValueError:
+            digest = b""
+        if len(digest) != cls.WIDTH:
+            raise ValueError(f"UIDs must be {2 * cls.WIDTH}-character hex digests: {uid!r}")
+        return digest
+
+    def _data(self) -> np.ndarray:
+        if not self._tail:
+            return self._base
+        tail = np.frombuffer(b"".join(self._tail), dtype=np.uint8)
+        return np.concatenate([self._base, tail.reshape(-1, self.WIDTH)])
+
+    def _keys(self) -> np.ndarray:
+        # Fixed-width void view: compares rows bytewise, like memcmp.
+        return np.ascontiguousarray(self._base).view(f"V{self.WIDTH}").ravel()
+
+    def _sorted_order(self) -> np.ndarray:
+        if self._order is None:
+            self._order = np.argsort(self._keys(), kind="stable")
+        return self._order
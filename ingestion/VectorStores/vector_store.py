@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Iterable, List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any, Tuple
 from ..typing_defs import Vector, Metadata
 
 
@@ -41,6 +41,20 @@ class VectorStore(ABC):
         """
         raise NotImplementedError
 
+    def query_batch(
+        self,
+        vectors: List[Vector],
+        k: int,
+        filters: Optional[Metadata] = None,
+    ) -> List[Tuple[List[str], List[float]]]:
+        """
+        Run `query` for many vectors at once.
+
+        - results align 1:1 with vectors
+        - backends that can search a matrix in one call should override this
+        """
+        return [self.query(vector, k, filters) for vector in vectors]
+
     @abstractmethod
     def delete(self, ids: List[str]) -> None:
         """
@@ -0,0 +1,267 @@
+"""
+Recall / latency benchmark for FaissVectorStore index configurations.
+
+Builds every configured index from the same embedding set, computes exact
+ground truth with IndexFlatIP, and reports recall@k, QPS, latency
+percentiles, build time and memory per index and query batch size.
+Quantized indexes report bytes per vector and, with re-ranking, the size
+of the raw vectors kept on disk.
+Runs fully offline: embeddings are synthetic or loaded from a .npy file.
+
+    python -m ingestion.benchmarks.bench_vector_stores \\
+        --synthetic 100000 --dim 1536 --queries 1000 \\
+        --batch-sizes 1,32 --output bench.json
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import faiss
+import numpy as np
+
+from ..VectorStores.faiss_vector_store import FaissIndexConfig, FaissVectorStore
+
+DEFAULT_CONFIGS: List[Dict[str, Any]] = [
+    {"name": "flat", "index_type": "flat"},
+    {"name": "sq8", "index_type": "sq8"},
+    {"name": "fp16", "index_type": "fp16"},
+    {"name": "pq", "index_type": "pq", "pq_m": 192},
+    {"name": "opq_pq", "index_type": "opq_pq", "pq_m": 192},
+    {"name": "pq+rerank", "index_type": "pq", "pq_m": 192, "rerank_k": 100},
+    {"name": "opq_pq+rerank", "index_type": "opq_pq", "pq_m": 192, "rerank_k": 100},
+    {"name": "ivf_flat", "index_type": "ivf_flat", "nlist": 1024, "nprobe": 16},
+    {"name": "ivf_pq", "index_type": "ivf_pq", "nlist": 1024, "pq_m": 64, "nprobe": 16},
+    {"name": "hnsw_flat", "index_type": "hnsw_flat", "hnsw_m": 32, "ef_search": 64},
+]
+
+
+# ---------- Data ----------
+
+def synthetic_embeddings(n: int, dim: int, n_clusters: int, seed: int) -> np.ndarray:
+    """
+    Clustered Gaussian vectors. Real text embeddings are far from
+    uniform, and uniform data makes every ANN index look bad.
+    """
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((n_clusters, dim)).astype("float32")
+    labels = rng.integers(0, n_clusters, size=n)
+    noise = 0.5 * rng.standard_normal((n, dim)).astype("float32")
+    return centers[labels] + noise
+
+
+def split_queries(vectors: np.ndarray, n_queries: int, seed: int):
+    """
+    Hold out `n_queries` rows as queries and perturb them slightly so
+    they are near, but not identical to, stored vectors.
+    """
+    rng = np.random.default_rng(seed + 1)
+    order = rng.permutation(len(vectors))
+    queries = vectors[order[:n_queries]].copy()
+    base = vectors[order[n_queries:]]
+    queries += 0.05 * rng.standard_normal(queries.shape).astype("float32")
+    return base, queries
+
+
+def exact_ground_truth(base: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    base = base.copy()
+    queries = queries.copy()
+    faiss.normalize_L2(base)
+    faiss.normalize_L2(queries)
+
+    index = faiss.IndexFlatIP(base.shape[1])
+    index.add(base)
+    _, indices = index.search(queries, k)
+    return indices
+
+
+# ---------- Measurement ----------
+
+def rss_bytes() -> int | None:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * 4096
+    except OSError:
+        return None
+
+
+def build_store(base: np.ndarray, config: FaissIndexConfig, add_batch: int):
+    ids = [f"{i:064x}" for i in range(len(base))]
+
+    rss_before = rss_bytes()
+    started = time.perf_counter()
+
+    store = FaissVectorStore(base.shape[1], config)
+    for start in range(0, len(base), add_batch):
+        store.upsert(ids[start:start + add_batch], base[start:start + add_batch])
+    store.flush()
+
+    build_seconds = time.perf_counter() - started
+    rss_after = rss_bytes()
+
+    index_bytes = int(faiss.serialize_index(store.index).size)
+    memory = {
+        "index_bytes": index_bytes,
+        "bytes_per_vector": index_bytes / max(store.index.ntotal, 1),
+        # memory-mapped when served; only candidates are paged in
+        "raw_vector_bytes": (
+            store.index.ntotal * store.dim * 4 if store.keeps_raw_vectors() else 0
+        ),
+        "rss_delta_bytes": (
+            rss_after - rss_before
+            if rss_before is not None and rss_after is not None
+            else None
+        ),
+    }
+    return store, build_seconds, memory
+
+
+def run_queries(
+    store: FaissVectorStore,
+    queries: np.ndarray,
+    ground_truth: np.ndarray,
+    k: int,
+    batch_size: int,
+) -> Dict[str, Any]:
+    latencies: List[float] = []
+    hits = 0
+
+    started = time.perf_counter()
+    for start in range(0, len(queries), batch_size):
+        batch = queries[start:start + batch_size]
+
+        t0 = time.perf_counter()
+        results = store.query_batch(batch, k)
+        latencies.append(time.perf_counter() - t0)
+
+        for offset, (ids, _) in enumerate(results):
+            expected = set(ground_truth[start + offset][:k].tolist())
+            hits += len(expected.intersection(int(uid, 16) for uid in ids))
+    total = time.perf_counter() - started
+
+    latencies_ms = 1000 * np.asarray(latencies)
+    return {
+        "batch_size": batch_size,
+        f"recall@{k}": hits / (len(queries) * k),
+        "qps": len(queries) / total,
+        "batch_latency_ms": {
+            "p50": float(np.percentile(latencies_ms, 50)),
+            "p95": float(np.percentile(latencies_ms, 95)),
+            "p99": float(np.percentile(latencies_ms, 99)),
+        },
+    }
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"],
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# ---------- Entry point ----------
+
+def run(args) -> Dict[str, Any]:
+    if args.threads:
+        faiss.omp_set_num_threads(args.threads)
+
+    if args.embeddings:
+        vectors = np.load(args.embeddings).astype("float32")
+    else:
+        vectors = synthetic_embeddings(args.synthetic, args.dim, args.clusters, args.seed)
+
+    base, queries = split_queries(vectors, args.queries, args.seed)
+    batch_sizes = [int(b) for b in args.batch_sizes.split(",")]
+
+    if args.configs:
+        with open(args.configs) as f:
+            configs = json.load(f)
+    else:
+        configs = DEFAULT_CONFIGS
+
+    ground_truth = exact_ground_truth(base, queries, args.k)
+
+    report: Dict[str, Any] = {
+        "environment": {
+            "git_commit": git_commit(),
+            "faiss": faiss.__version__,
+            "numpy": np.__version__,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "threads": faiss.omp_get_max_threads(),
+        },
+        "dataset": {
+            "source": args.embeddings or "synthetic",
+            "n_base": len(base),
+            "n_queries": len(queries),
+            "dim": int(base.shape[1]),
+            "k": args.k,
+            "seed": args.seed,
+        },
+        "results": [],
+    }
+
+    for entry in configs:
+        entry = dict(entry)
+        name = entry.pop("name", None)
+        config = FaissIndexConfig.from_dict(entry)
+        name = name or config.factory()
+
+        # Progress goes to stderr so the report on stdout stays valid JSON.
+        print(
+            f"[{name}] building {config.factory()} over {len(base)} vectors",
+            file=sys.stderr,
+        )
+        store, build_seconds, memory = build_store(base, config, args.add_batch)
+
+        report["results"].append({
+            "name": name,
+            "config": config.to_dict(),
+            "build_seconds": build_seconds,
+            "memory": memory,
+            "search": [
+                run_queries(store, queries, ground_truth, args.k, batch_size)
+                for batch_size in batch_sizes
+            ],
+        })
+        del store
+
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FAISS vector store benchmark")
+
+    parser.add_argument("--embeddings", type=str, help=".npy file of float32 embeddings")
+    parser.add_argument("--synthetic", type=int, default=50_000, help="synthetic vectors to generate")
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--clusters", type=int, default=256)
+    parser.add_argument("--queries", type=int, default=1_000)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--batch-sizes", type=str, default="1,32")
+    parser.add_argument("--add-batch", type=int, default=10_000)
+    parser.add_argument("--configs", type=str, help="JSON list of FaissIndexConfig dicts (with optional name)")
+    parser.add_argument("--threads", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=str, help="write JSON report here instead of stdout")
+
+    args = parser.parse_args()
+    report = run(args)
+
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import argparse
+
+import kagglehub
+
+from .bundle import write_bundle
+from .ingest import add_index_arguments, index_config_from_args, ingest
+from .VectorStores.faiss_vector_store import FaissIndexConfig
+
+
+def build(
+    *,
+    dataset_path: str,
+    output_dir: str,
+    embedding_model: str,
+    vector_dim: int,
+    batch_size: int,
+    index_config: FaissIndexConfig,
+    shards: int = 1,
+    shard_by: str = "uid",
+    embedding_backend: str = "openai",
+    embedding_cache_path: str | None = None,
+    pipelined: bool = True,
+    embed_concurrency: int = 4,
+    tokens_per_minute: int | None = None,
+    parse_workers: int = 0,
+):
+    """
+    Embed the whole dataset into a fresh FAISS index and write it, with a
+    metadata snapshot and manifest, as a versioned bundle in `output_dir`.
+    """
+    vector_store, metadata_store = ingest(
+        dataset_path=dataset_path,
+        embedding_model=embedding_model,
+        vector_dim=vector_dim,
+        batch_size=batch_size,
+        max_batches=None,
+        run_sanity_check=False,
+        vector_store_backend="faiss",
+        metadata_store_backend="memory",
+        index_config=index_config,
+        shards=shards,
+        shard_by=shard_by,
+        embedding_backend=embedding_backend,
+        pipelined=pipelined,
+        embed_concurrency=embed_concurrency,
+        tokens_per_minute=tokens_per_minute,
+        embedding_cache_path=embedding_cache_path,
+        parse_workers=parse_workers,
+    )
+
+    manifest = write_bundle(
+        output_dir,
+        vector_store,
+        metadata_store,
+        embedding_model=embedding_model,
+        embedding_backend=embedding_backend,
+        source={"dataset": dataset_path},
+    )
+    shard_count = len(manifest.index.get("sharding", {}).get("shards", [None]))
+    print(
+        f"Wrote bundle to {output_dir}: {manifest.count} vectors in "
+        f"{shard_count} shard(s), {manifest.index['index_type']} index, "
+        f"model {manifest.embedding_backend}:{manifest.embedding_model}"
+    )
+    return manifest
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build a FAISS index bundle")
+
+    parser.add_argument("--output", type=str, required=True)
+    parser.add_argument("--dataset-path", type=str)
+    parser.add_argument("--embedding-model", type=str, default="text-embedding-3-small")
+    parser.add_argument("--vector-dim", type=int, default=1536)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--embedding-backend", choices=["openai", "fake"], default="openai")
+    parser.add_argument("--embedding-cache", type=str)
+    parser.add_argument("--no-pipeline", action="store_true")
+    parser.add_argument("--embed-concurrency", type=int, default=4)
+    parser.add_argument("--tokens-per-minute", type=int)
+    parser.add_argument("--parse-workers", type=int, default=0)
+    add_index_arguments(parser)
+
+    args = parser.parse_args()
+
+    build(
+        dataset_path=args.dataset_path
+        or kagglehub.dataset_download("rmisra/politifact-fact-check-dataset"),
+        output_dir=args.output,
+        embedding_model=args.embedding_model,
+        vector_dim=args.vector_dim,
+        batch_size=args.batch_size,
+        index_config=index_config_from_args(args),
+        shards=args.shards,
+        shard_by=args.shard_by,
+        embedding_backend=args.embedding_backend,
+        embedding_cache_path=args.embedding_cache,
+        pipelined=not args.no_pipeline,
+        embed_concurrency=args.embed_concurrency,
+        tokens_per_minute=args.tokens_per_minute,
+        parse_workers=args.parse_workers,
+    )
@@ -0,0 +1,233 @@
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+from .MetadataStores.in_memory_metadata_store import InMemoryMetadataStore
+from .VectorStores.faiss_vector_store import RAW_VECTORS, FaissVectorStore
+from .VectorStores.sharded_vector_store import SHARDING_FILE, ShardedVectorStore, shard_dir
+
+BUNDLE_FORMAT = 1
+
+MANIFEST = "manifest.json"
+METADATA = "metadata.snap"
+
+# Files covered by the manifest checksums, in addition to METADATA.
+INDEX_FILES = (
+    "index.faiss",
+    "ids.bin",
+    "attributes.npz",
+    "tombstones.npy",
+    "index_config.json",
+)
+
+
+class BundleError(ValueError):
+    """
+    A bundle is malformed, corrupted, or doesn't match the consumer.
+    """
+
+
+@dataclass(frozen=True)
+class BundleManifest:
+    """
+    Self-description of an index bundle: what was embedded with what,
+    how the index was built, and checksums of every artifact.
+    """
+
+    format: int
+    created_at: str
+    embedding_model: str
+    dim: int
+    count: int
+    normalization: str
+    metric: str
+    index: Dict[str, Any]
+    files: Dict[str, Dict[str, Any]]
+    source: Dict[str, Any] = field(default_factory=dict)
+    # "fake" bundles hold random vectors that only look like the model's
+    embedding_backend: str = "openai"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BundleManifest":
+        return cls(**data)
+
+
+def sha256_file(path: str | Path, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def index_files(vector_store: FaissVectorStore | ShardedVectorStore) -> List[str]:
+    """
+    Files (relative to the bundle) that `vector_store.save` writes.
+    """
+    if isinstance(vector_store, ShardedVectorStore):
+        return [SHARDING_FILE] + [
+            f"{shard_dir(i)}/{name}"
+            for i, shard in enumerate(vector_store.shards)
+            for name in index_files(shard)
+        ]
+    if vector_store.keeps_raw_vectors():
+        return [*INDEX_FILES, RAW_VECTORS]
+    return list(INDEX_FILES)
+
+
+def write_bundle(
+    path: str | Path,
+    vector_store: FaissVectorStore | ShardedVectorStore,
+    metadata_store: InMemoryMetadataStore,
+    embedding_model: str,
+    embedding_backend: str = "openai",
+    source: Dict[str, Any] | None = None,
+) -> BundleManifest:
+    """
+    Write a versioned bundle that the retrieval service can serve from
+    directly:
+
+        path/
+          ├─ index.faiss, ids.bin, attributes.npz, tombstones.npy,
+          │  index_config.json, vectors.npy (with re-ranking)
+          │  (or sharding.json + shard-NNN/ for a ShardedVectorStore)
+          ├─ metadata.snap      (ColumnarSnapshot)
+          ├─ manifest.json
+          └─ VERSION
+
+    VERSION is written last, so readers never see a bundle whose
+    manifest and artifacts disagree.
+    """
+    path = Path(path)
+
+    vector_store.save(path, publish=False)
+
+    tmp_metadata = path / f"{METADATA}.tmp"
+    metadata_store.save_snapshot(str(tmp_metadata))
+    os.replace(tmp_metadata, path / METADATA)
+
+    files = {
+        name: {
+            "sha256": sha256_file(path / name),
+            "bytes": (path / name).stat().st_size,
+        }
+        for name in (*index_files(vector_store), METADATA)
+    }
+
+    index = vector_store.config.to_dict()
+    if isinstance(vector_store, ShardedVectorStore):
+        index["sharding"] = vector_store.layout()
+
+    manifest = BundleManifest(
+        format=BUNDLE_FORMAT,
+        created_at=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        embedding_model=embedding_model,
+        embedding_backend=embedding_backend,
+        dim=vector_store.dim,
+        count=vector_store.count(),
+        normalization="l2",
+        metric="inner_product",
+        index=index,
+        files=files,
+        source=source or {},
+    )
+
+    tmp_manifest = path / f"{MANIFEST}.tmp"
+    with open(tmp_manifest, "w") as f:
+        json.dump(manifest.to_dict(), f, indent=2)
+    os.replace(tmp_manifest, path / MANIFEST)
+
+    FaissVectorStore.publish(path)
+    return manifest
+
+
+def read_manifest(path: str | Path) -> BundleManifest | None:
+    """
+    The bundle manifest at `path`, or None for plain FaissVectorStore
+    artifacts without one.
+    """
+    try:
+        with open(Path(path) / MANIFEST) as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+
+    if data.get("format") != BUNDLE_FORMAT:
+        raise BundleError(f"unsupported bundle format {data.get('format')!r}")
+    return BundleManifest.from_dict(data)
+
+
+def verify_bundle(
+    path: str | Path,
+    manifest: BundleManifest,
+    embedding_model: str | None = None,
+    checksums: bool = True,
+    embedding_backend: str = "openai",
+) -> None:
+    """
+    Raise BundleError unless the bundle was built with `embedding_model`
+    through `embedding_backend`, and (with checksums=True) every artifact
+    matches its checksum.
+    """
+    path = Path(path)
+
+    if embedding_model is not None and (
+        manifest.embedding_backend, manifest.embedding_model
+    ) != (embedding_backend, embedding_model):
+        raise BundleError(
+            f"bundle was embedded with "
+            f"{manifest.embedding_backend}:{manifest.embedding_model}, "
+            f"but queries use {embedding_backend}:{embedding_model}"
+        )
+
+    for name, expected in manifest.files.items():
+        file_path = path / name
+        if not file_path.exists():
+            raise BundleError(f"bundle is missing {name}")
+        if file_path.stat().st_size != expected["bytes"]:
+            raise BundleError(f"{name} has the wrong size")
+        if checksums and sha256_file(file_path) != expected["sha256"]:
+            raise BundleError(f"{name} failed its checksum")
+
+
+def load_bundle(
+    path: str | Path,
+    mmap: bool = False,
+    embedding_model: str | None = None,
+    checksums: bool = True,
+    embedding_backend: str = "openai",
+) -> FaissVectorStore | ShardedVectorStore:
+    """
+    Load the index of a bundle after validating it. Directories without
+    a manifest are loaded as plain FaissVectorStore (or, with
+    sharding.json, ShardedVectorStore) artifacts.
+    """
+    manifest = read_manifest(path)
+    if manifest is not None:
+        verify_bundle(path, manifest, embedding_model, checksums, embedding_backend)
+
+    if ShardedVectorStore.is_sharded(path):
+        store = ShardedVectorStore.load(path, mmap=mmap)
+    else:
+        store = FaissVectorStore.load(path, mmap=mmap)
+
+    if manifest is not None and (store.dim, store.count()) != (manifest.dim, manifest.count):
+        raise BundleError(
+            f"index has dim={store.dim}, count={store.count()}; manifest says "
+            f"dim={manifest.dim}, count={manifest.count}"
+        )
+    return store
+
+
+def load_bundle_metadata(path: str | Path, mmap: bool = True) -> InMemoryMetadataStore:
+    """
+    Open the metadata snapshot of a bundle.
+    """
+    return InMemoryMetadataStore.load_snapshot(str(Path(path) / METADATA), mmap=mmap)
@@ -0,0 +1,47 @@
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from .Datasets.claim_ingestion_dataset import Position
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """
+    Durable progress of an ingestion run: every record before `offset`
+    in `file` has been written to both stores.
+    """
+
+    dataset: str
+    file: str
+    offset: int
+    batches: int
+    records: int
+
+    @property
+    def position(self) -> Position:
+        return self.file, self.offset
+
+    def save(self, path: str | Path) -> None:
+        """
+        Write atomically: a crash leaves either the previous checkpoint
+        or this one, never a torn file.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(asdict(self), f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Checkpoint | None":
+        try:
+            with open(path) as f:
+                return cls(**json.load(f))
+        except FileNotFoundError:
+            return None
@@ -0,0 +1,202 @@
+import hashlib
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import List
+
+import numpy as np
+import openai
+
+from .embedding_cache import DocumentEmbeddingCache
+from .typing_defs import Vector
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Cheap upper-ish bound on OpenAI tokens (~4 characters per token for
+    English), good enough for rate budgeting without a tokenizer.
+    """
+    return len(text) // 4 + 1
+
+
+class TokenBucket:
+    """
+    Thread-safe tokens-per-minute budget. `acquire` blocks until the
+    requested number of tokens is available.
+    """
+
+    def __init__(self, tokens_per_minute: int):
+        self.capacity = tokens_per_minute
+        self.rate = tokens_per_minute / 60.0
+        self.tokens = float(tokens_per_minute)
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int) -> None:
+        # A single request larger than the whole budget would never fit.
+        tokens = min(tokens, self.capacity)
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.updated_at) * self.rate,
+                )
+                self.updated_at = now
+
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+
+                wait = (tokens - self.tokens) / self.rate
+
+            time.sleep(wait)
+
+
+class Embedder(ABC):
+    """
+    Turns a batch of texts into embeddings, aligned 1:1 with the input.
+    Implementations must be safe to call from several threads.
+    """
+
+    @abstractmethod
+    def embed(self, texts: List[str]) -> List[Vector]:
+        ...
+
+
+class OpenAIEmbedder(Embedder):
+    """
+    OpenAI embeddings with a tokens-per-minute budget and retries with
+    exponential backoff (and jitter) on 429, 5xx and connection errors.
+    """
+
+    def __init__(
+        self,
+        client: openai.OpenAI,
+        model: str,
+        tokens_per_minute: int | None = None,
+        max_retries: int = 6,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+    ):
+        self.client = client
+        self.model = model
+        self.budget = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.max_retries = max_retries
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+
+    def embed(self, texts: List[str]) -> List[Vector]:
+        if self.budget is not None:
+            self.budget.acquire(sum(estimate_tokens(t) for t in texts))
+
+        attempt = 0
+        while True:
+            try:
+                response = self.client.embeddings.create(
+                    model=self.model,
+                    input=texts,
+                    encoding_format="float",
+                )
+                return [item.embedding for item in response.data]
+
+            except (
+                openai.RateLimitError,
+                openai.InternalServerError,
+                openai.APIConnectionError,
+            ) as e:
+                attempt += 1
+                if attempt > self.max_retries:
+                    raise
+
+                time.sleep(self._backoff(attempt, e))
+
+    def _backoff(self, attempt: int, error: Exception) -> float:
+        response = getattr(error, "response", None)
+        if response is not None:
+            retry_after = response.headers.get("retry-after")
+            if retry_after is not None:
+                try:
+                    return float(retry_after)
+                except ValueError:
+                    pass
+
+        delay = min(self.max_backoff, self.initial_backoff * 2 ** (attempt - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+
+class FakeEmbedder(Embedder):
+    """
+    Deterministic, offline embeddings for tests and dry runs. The same
+    text always maps to the same unit vector; `latency` simulates the
+    API round trip.
+    """
+
+    def __init__(self, dim: int, latency: float = 0.0):
+        self.dim = dim
+        self.latency = latency
+
+    def embed(self, texts: List[str]) -> List[Vector]:
+        if self.latency:
+            time.sleep(self.latency)
+
+        embeddings = []
+        for text in texts:
+            seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "little")
+            vec = np.random.default_rng(seed).standard_normal(self.dim)
+            embeddings.append((vec / np.linalg.norm(vec)).tolist())
+
+        return embeddings
+
+
+class CachedEmbedder(Embedder):
+    """
+    Serves embeddings from a persistent DocumentEmbeddingCache and only
+    sends the misses to the wrapped embedder, so re-ingesting a corpus
+    (new vector backend, new index type) costs no API tokens.
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        cache: DocumentEmbeddingCache,
+        namespace: str,
+        dim: int,
+    ):
+        self.embedder = embedder
+        self.cache = cache
+        self.namespace = namespace
+        self.dim = dim
+
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def embed(self, texts: List[str]) -> List[Vector]:
+        keys = [self.cache.key(self.namespace, text) for text in texts]
+        cached = self.cache.get_many(keys)
+
+        # Different dimensions under the same model name are a miss.
+        missing = [
+            i for i, key in enumerate(keys)
+            if key not in cached or len(cached[key]) != self.dim
+        ]
+
+        embeddings: List[Vector] = [cached.get(key) for key in keys]
+
+        if missing:
+            fresh = self.embedder.embed([texts[i] for i in missing])
+            for i, vector in zip(missing, fresh):
+                embeddings[i] = vector
+            self.cache.put_many((keys[i], embeddings[i]) for i in missing)
+
+        with self._lock:
+            self.hits += len(texts) - len(missing)
+            self.misses += len(missing)
+
+        return [
+            vector.tolist() if isinstance(vector, np.ndarray) else vector
+            for vector in embeddings
+        ]
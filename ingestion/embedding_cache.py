@@ -0,0 +1,85 @@
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Sequence
+
+import numpy as np
+
+from .typing_defs import Vector
+
+# SQLite's default limit on bound parameters is 999.
+_MAX_PARAMS = 900
+
+
+class DocumentEmbeddingCache:
+    """
+    Persistent, content-addressed store of document embeddings.
+
+    Entries are keyed by SHA-256 of (namespace, text), where the namespace
+    names the embedding model, so the cache is valid across vector
+    backends and index rebuilds and only the text decides whether a
+    vector can be reused. Vectors are stored as raw float32 blobs in a
+    single SQLite file (WAL mode, so lookups don't block on writes).
+
+    Thread-safe, so one instance can be shared by all embedding workers.
+    """
+
+    def __init__(self, path: str | Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                key BLOB PRIMARY KEY,
+                vector BLOB NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+        self._db.commit()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(namespace: str, text: str) -> bytes:
+        return hashlib.sha256(f"{namespace}\0{text}".encode()).digest()
+
+    # ---------- Core operations ----------
+
+    def get_many(self, keys: Sequence[bytes]) -> Dict[bytes, np.ndarray]:
+        found: Dict[bytes, np.ndarray] = {}
+
+        with self._lock:
+            for i in range(0, len(keys), _MAX_PARAMS):
+                chunk = keys[i:i + _MAX_PARAMS]
+                rows = self._db.execute(
+                    "SELECT key, vector FROM embeddings "
+                    f"WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32)
+
+        return found
+
+    def put_many(self, items: Iterable[tuple[bytes, Vector]]) -> None:
+        rows = [
+            (key, np.asarray(vector, dtype=np.float32).tobytes())
+            for key, vector in items
+        ]
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO embeddings VALUES (?, ?)", rows
+            )
+            self._db.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,137 @@
+import hashlib
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+from dateutil import parser as date_parser
+
+from .MetadataStores.base_metadata_store import BaseMetadataStore
+from .VectorStores.attribute_index import CATEGORICAL_FIELDS, NUMERIC_FIELDS
+
+Record = Dict[str, Any]
+
+# Fields that survive a round trip through every metadata store; "uid" is
+# the key and "source" is not persisted by Postgres.
+HASHED_FIELDS = (
+    "statement",
+    "verdict",
+    "statement_originator",
+    "statement_date",
+    "statement_source",
+    "factchecker",
+    "factcheck_date",
+    "factcheck_analysis_link",
+)
+
+DATE_FIELDS = ("statement_date", "factcheck_date")
+
+# Stored fields the vector store also keeps as filter attributes; a change
+# to one of them has to reach the vector store, not just the metadata.
+ATTRIBUTE_FIELDS = tuple(
+    name for name in CATEGORICAL_FIELDS + NUMERIC_FIELDS if name in HASHED_FIELDS
+)
+
+
+def normalize_field(name: str, value: Any) -> str:
+    if value is None:
+        return ""
+
+    value = str(value).strip()
+
+    # The dataset has "1/9/2016", Postgres returns "2016-01-09".
+    if name in DATE_FIELDS and value:
+        try:
+            return date_parser.parse(value).date().isoformat()
+        except (ValueError, OverflowError):
+            pass
+
+    return value
+
+
+def content_hash(record: Record) -> str:
+    """
+    Hash of a record's stored fields, insensitive to how the backend
+    formats them, so a fetched record and a fresh one compare equal
+    unless something actually changed.
+    """
+    digest = hashlib.sha256()
+    for name in HASHED_FIELDS:
+        digest.update(normalize_field(name, record.get(name)).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def attributes_changed(stored: Record, record: Record) -> bool:
+    return any(
+        normalize_field(name, stored.get(name)) != normalize_field(name, record.get(name))
+        for name in ATTRIBUTE_FIELDS
+    )
+
+
+@dataclass
+class IncrementalStats:
+    new: int = 0
+    changed: int = 0
+    skipped: int = 0
+
+
+class IncrementalFilter:
+    """
+    Splits each batch against what the metadata store already holds,
+    using one `bulk_get` per batch:
+
+    - new: UID not stored yet → needs embedding and both writes
+    - changed: UID stored but fields differ. If a filter attribute
+      changed, the vector store's copy of it is stale too, so the record
+      goes through embedding and both writes like a new one; otherwise
+      it's a metadata rewrite only (the UID hashes the statement, so the
+      embedding is still valid)
+    - skipped: stored and unchanged, or already seen earlier in this run
+
+    Metadata is written after vectors, so a stored record implies its
+    vector is stored too.
+    """
+
+    def __init__(self, metadata_store: BaseMetadataStore):
+        self.metadata_store = metadata_store
+        self.stats = IncrementalStats()
+        self._seen: set[str] = set()
+        self._lock = threading.Lock()
+
+    def split(self, records: List[Record]) -> Tuple[List[Record], List[Record]]:
+        """
+        Return the records of the batch that need embedding and both
+        writes (new ones, and changed ones whose filter attributes
+        differ), and those that only need their metadata rewritten.
+        """
+        fresh = []
+        with self._lock:
+            for record in records:
+                if record["uid"] in self._seen:
+                    self.stats.skipped += 1
+                else:
+                    self._seen.add(record["uid"])
+                    fresh.append(record)
+
+        existing = self.metadata_store.bulk_get(record["uid"] for record in fresh)
+
+        embed, rewrite = [], []
+        new = 0
+        for record in fresh:
+            stored = existing.get(record["uid"])
+            if stored is None:
+                embed.append(record)
+                new += 1
+            elif content_hash(stored) == content_hash(record):
+                continue
+            elif attributes_changed(stored, record):
+                embed.append(record)
+            else:
+                rewrite.append(record)
+
+        with self._lock:
+            self.stats.new += new
+            self.stats.changed += len(embed) + len(rewrite) - new
+            self.stats.skipped += len(fresh) - len(embed) - len(rewrite)
+
+        return embed, rewrite
@@ -1,13 +1,26 @@
 import os
 import argparse
+import itertools
+from collections import deque
 import kagglehub
 from openai import OpenAI
+from pathlib import Path
+from .checkpoint import Checkpoint
+from .incremental import IncrementalFilter
+from .embedders import CachedEmbedder, FakeEmbedder, OpenAIEmbedder
+from .embedding_cache import DocumentEmbeddingCache
+from .pipeline import IngestionPipeline
 from .Datasets.politifact_ingestion_dataset import PolitifactIngestionDataset
 from ingestion.MetadataStores.in_memory_metadata_store import InMemoryMetadataStore
-from .VectorStores.faiss_vector_store import FaissVectorStore
+from .VectorStores.attribute_index import filter_attributes
+from .VectorStores.faiss_vector_store import FaissIndexConfig, FaissVectorStore, INDEX_TYPES
+from .VectorStores.sharded_vector_store import PARTITIONS, ShardedVectorStore
 from ingestion.MetadataStores.postgres_metadata_store import PostgresMetadataStore
 from .VectorStores.pinecone_vector_store import PineconeVectorStore
 
+# Default batches between checkpoints when they save local artifacts.
+LOCAL_CHECKPOINT_EVERY = 100
+
 
 def require_env(name: str) -> str:
     value = os.getenv(name)
@@ -16,6 +29,95 @@ def require_env(name: str) -> str:
     return value
 
 
+def build_metadata_store(backend: str):
+    if backend == "memory":
+        return InMemoryMetadataStore()
+    return PostgresMetadataStore(
+        require_env("DATABASE_URL"),
+        min_size=int(os.getenv("PG_POOL_MIN_SIZE", "1")),
+        max_size=int(os.getenv("PG_POOL_MAX_SIZE", "10")),
+        statement_timeout_ms=int(os.getenv("PG_STATEMENT_TIMEOUT_MS", "0")) or None,
+    )
+
+
+def build_vector_store(
+    backend: str,
+    vector_dim: int,
+    index_config: FaissIndexConfig,
+    shards: int = 1,
+    shard_by: str = "uid",
+):
+    if backend == "faiss" and shard_by == "source":
+        return ShardedVectorStore(
+            [],
+            partition="source",
+            shard_factory=lambda: FaissVectorStore(vector_dim, index_config),
+        )
+    if backend == "faiss" and shards > 1:
+        return ShardedVectorStore(
+            [FaissVectorStore(vector_dim, index_config) for _ in range(shards)]
+        )
+    if backend == "faiss":
+        return FaissVectorStore(vector_dim, index_config)
+    return PineconeVectorStore(
+        index_name=require_env("PINECONE_INDEX"),
+        api_key=require_env("PINECONE_API_KEY"),
+    )
+
+
+def build_embedder(
+    backend: str,
+    embedding_model: str,
+    vector_dim: int,
+    tokens_per_minute: int | None,
+):
+    if backend == "fake":
+        return FakeEmbedder(vector_dim)
+    return OpenAIEmbedder(
+        # Retries are handled by OpenAIEmbedder with our own backoff.
+        client=OpenAI(api_key=require_env("OPENAI_API_KEY"), max_retries=0),
+        model=embedding_model,
+        tokens_per_minute=tokens_per_minute,
+    )
+
+
+def add_index_arguments(parser: argparse.ArgumentParser) -> None:
+    defaults = FaissIndexConfig()
+    parser.add_argument("--index-type", choices=INDEX_TYPES, default=defaults.index_type)
+    parser.add_argument("--index-factory", type=str)
+    parser.add_argument("--nlist", type=int, default=defaults.nlist)
+    parser.add_argument("--pq-m", type=int, default=defaults.pq_m)
+    parser.add_argument("--pq-nbits", type=int, default=defaults.pq_nbits)
+    parser.add_argument("--hnsw-m", type=int, default=defaults.hnsw_m)
+    parser.add_argument("--ef-construction", type=int, default=defaults.ef_construction)
+    parser.add_argument("--train-size", type=int, default=defaults.train_size)
+    parser.add_argument(
+        "--max-deleted-fraction", type=float, default=defaults.max_deleted_fraction
+    )
+    parser.add_argument("--nprobe", type=int, default=defaults.nprobe)
+    parser.add_argument("--ef-search", type=int, default=defaults.ef_search)
+    parser.add_argument("--rerank-k", type=int, default=defaults.rerank_k)
+    parser.add_argument("--shards", type=int, default=1)
+    parser.add_argument("--shard-by", choices=PARTITIONS, default="uid")
+
+
+def index_config_from_args(args: argparse.Namespace) -> FaissIndexConfig:
+    return FaissIndexConfig(
+        index_type=args.index_type,
+        nlist=args.nlist,
+        pq_m=args.pq_m,
+        pq_nbits=args.pq_nbits,
+        hnsw_m=args.hnsw_m,
+        ef_construction=args.ef_construction,
+        factory_string=args.index_factory,
+        train_size=args.train_size,
+        max_deleted_fraction=args.max_deleted_fraction,
+        nprobe=args.nprobe,
+        ef_search=args.ef_search,
+        rerank_k=args.rerank_k,
+    )
+
+
 def ingest(
     *,
     dataset_path: str,
@@ -24,69 +126,225 @@ def ingest(
     batch_size: int,
     max_batches: int | None,
     run_sanity_check: bool,
+    vector_store_backend: str = "pinecone",
+    metadata_store_backend: str = "postgres",
+    index_config: FaissIndexConfig | None = None,
+    shards: int = 1,
+    shard_by: str = "uid",
+    artifacts_dir: str | None = None,
+    embedding_backend: str = "openai",
+    pipelined: bool = False,
+    embed_concurrency: int = 4,
+    tokens_per_minute: int | None = None,
+    checkpoint_path: str | None = None,
+    checkpoint_every: int | None = None,
+    resume: bool = False,
+    incremental: bool = False,
+    embedding_cache_path: str | None = None,
+    parse_workers: int = 0,
+    ordered: bool = True,
 ):
 
+    # Local stores only become durable when saved, so checkpointing them
+    # means saving them alongside every checkpoint, and an incremental run
+    # has to start from the previously saved ones.
+    local_stores = vector_store_backend == "faiss" or metadata_store_backend == "memory"
+    if checkpoint_path is not None and local_stores and artifacts_dir is None:
+        raise ValueError("checkpointing local stores requires artifacts_dir")
+    if checkpoint_every is None:
+        # Each local checkpoint rewrites the whole index and metadata file,
+        # so checkpointing every batch would cost O(N²) disk I/O.
+        checkpoint_every = LOCAL_CHECKPOINT_EVERY if local_stores else 1
+    if incremental and local_stores and artifacts_dir is None:
+        raise ValueError("incremental runs with local stores require artifacts_dir")
+    if resume and checkpoint_path is None:
+        raise ValueError("resume requires checkpoint_path")
+    if checkpoint_path is not None and not ordered:
+        raise ValueError("checkpoints need ordered reading")
+
+    checkpoint = Checkpoint.load(checkpoint_path) if resume else None
+    if checkpoint is not None and checkpoint.dataset != dataset_path:
+        raise ValueError(
+            f"checkpoint is for dataset {checkpoint.dataset}, not {dataset_path}"
+        )
 
-    OPENAI_API_KEY = require_env("OPENAI_API_KEY")
-    database_url = require_env("DATABASE_URL")
-    api_key = require_env("PINECONE_API_KEY")
-    index_name = require_env("PINECONE_INDEX")
-
-
-
-
-    # Open AI Client
-    client = OpenAI(api_key=OPENAI_API_KEY)
+    embedder = build_embedder(
+        embedding_backend,
+        embedding_model,
+        vector_dim,
+        tokens_per_minute,
+    )
 
+    embedding_cache = None
+    if embedding_cache_path is not None:
+        embedding_cache = DocumentEmbeddingCache(embedding_cache_path)
+        embedder = CachedEmbedder(
+            embedder,
+            embedding_cache,
+            namespace=f"{embedding_backend}:{embedding_model}",
+            dim=vector_dim,
+        )
 
     # Data Stores
-    # metadata_store = InMemoryMetadataStore()
-    # vector_store = FaissVectorStore(vector_dim)
+    metadata_store = build_metadata_store(metadata_store_backend)
+    vector_store = build_vector_store(
+        vector_store_backend,
+        vector_dim,
+        index_config or FaissIndexConfig(),
+        shards=shards,
+        shard_by=shard_by,
+    )
+
+    if checkpoint is not None:
+        print(
+            f"Resuming after {checkpoint.records} records "
+            f"({checkpoint.file} @ byte {checkpoint.offset})"
+        )
 
-    metadata_store = PostgresMetadataStore(database_url)
-    vector_store = PineconeVectorStore(index_name=index_name, api_key=api_key)
+    if checkpoint is not None or incremental:
+        faiss_dir = f"{artifacts_dir}/faiss"
+        metadata_path = Path(f"{artifacts_dir}/metadata.jsonl")
+        if vector_store_backend == "faiss" and FaissVectorStore.read_version(faiss_dir):
+            if ShardedVectorStore.is_sharded(faiss_dir):
+                vector_store = ShardedVectorStore.load(faiss_dir)
+            else:
+                vector_store = FaissVectorStore.load(faiss_dir)
+        if metadata_store_backend == "memory" and metadata_path.exists():
+            metadata_store = InMemoryMetadataStore.load(metadata_path)
+
+    incremental_filter = IncrementalFilter(metadata_store) if incremental else None
+
+    dataset = PolitifactIngestionDataset(
+        dataset_path,
+        workers=parse_workers,
+        ordered=ordered,
+    )
 
-    dataset = PolitifactIngestionDataset(dataset_path)
+    # Resume positions of the batches handed out, oldest first. Batches
+    # are written in the order they are read, so the writer pops the
+    # position of the batch it has just written.
+    positions = deque()
+
+    def positioned_batches():
+        start = checkpoint.position if checkpoint is not None else None
+        for position, records in dataset.positioned_batches(batch_size, start):
+            if incremental_filter is not None:
+                # New claims, and changed ones whose filter attributes
+                # moved, go through embedding and both writes; other
+                # changed ones keep their vector and just get their
+                # metadata rewritten.
+                records, changed = incremental_filter.split(records)
+                if changed:
+                    metadata_store.bulk_upsert(changed)
+                if not records:
+                    continue
+
+            positions.append(position)
+            yield records
+
+    batches = positioned_batches()
+    if max_batches is not None:
+        batches = itertools.islice(batches, max_batches)
+
+    done_batches = checkpoint.batches if checkpoint is not None else 0
+    done_records = checkpoint.records if checkpoint is not None else 0
+    uncheckpointed = None
+
+    def save_checkpoint(position):
+        Checkpoint(
+            dataset=dataset_path,
+            file=position[0],
+            offset=position[1],
+            batches=done_batches,
+            records=done_records,
+        ).save(checkpoint_path)
+
+    def commit(position):
+        nonlocal uncheckpointed
+
+        if artifacts_dir is not None and local_stores:
+            # An IVF/PQ index still buffering its training sample has
+            # nothing durable yet; saving now would train it early.
+            if vector_store_backend == "faiss" and not vector_store.is_trained():
+                return
+            vector_store.save(f"{artifacts_dir}/faiss")
+            metadata_store.save(f"{artifacts_dir}/metadata.jsonl")
+
+        save_checkpoint(position)
+        uncheckpointed = None
 
     test_uid = None
     test_text = None
     test_embedding = None
 
-    for i, records in enumerate(dataset.batches(batch_size=batch_size)):
-
-        if max_batches is not None and i >= max_batches:
-            break
-
-        # 1️⃣ Upsert metadata
-        for record in records:
-            metadata_store.upsert(
-                uid=record["uid"],
-                metadata=record,
-            )
+    def write(records, embeddings):
+        nonlocal test_uid, test_text, test_embedding
+        nonlocal done_batches, done_records, uncheckpointed
 
-        # 2️⃣ Embed statements
-        texts = [record["statement"] for record in records]
+        # 1️⃣ Upsert vectors, with the attributes queries can filter on
         ids = [record["uid"] for record in records]
-
-        response = client.embeddings.create(
-            model=embedding_model,
-            input=texts,
-            encoding_format="float",
+        vector_store.upsert(
+            ids,
+            embeddings,
+            metadatas=[filter_attributes(record) for record in records],
         )
 
-        embeddings = [v.embedding for v in response.data]
-        vector_store.upsert(ids, embeddings)
+        # 2️⃣ Upsert metadata (one bulk write per batch). Written last, so
+        # a stored record implies its vector is stored too.
+        metadata_store.bulk_upsert(records)
 
         if test_uid is None:
             test_uid = ids[0]
-            test_text = texts[0]
+            test_text = records[0]["statement"]
             test_embedding = embeddings[0]
 
+        # 3️⃣ Checkpoint once both stores have the batch
+        done_batches += 1
+        done_records += len(records)
+        uncheckpointed = positions.popleft()
+
+        if checkpoint_path is not None and done_batches % checkpoint_every == 0:
+            commit(uncheckpointed)
+
+    if pipelined:
+        # Reading, embedding and writing overlap; throughput is bounded
+        # by the embedding quota rather than round-trip latency.
+        stats = IngestionPipeline(
+            embed=embedder.embed,
+            write=write,
+            concurrency=embed_concurrency,
+        ).run(batches)
+        print(
+            f"Ingested {stats.records} records in {stats.batches} batches "
+            f"({stats.records_per_second:.1f} records/s)"
+        )
+    else:
+        for records in batches:
+            texts = [record["statement"] for record in records]
+            write(records, embedder.embed(texts))
+
+
+    # Persist local stores to disk. Trains any still-buffered FAISS
+    # vectors first. Remote stores (Pinecone, Postgres) ignore this.
+    if artifacts_dir is not None:
+        vector_store.save(f"{artifacts_dir}/faiss")
+        metadata_store.save(f"{artifacts_dir}/metadata.jsonl")
+
+    if checkpoint_path is not None and uncheckpointed is not None:
+        save_checkpoint(uncheckpointed)
+
+    if incremental_filter is not None:
+        stats = incremental_filter.stats
+        print(
+            f"Incremental: {stats.new} new, {stats.changed} changed, "
+            f"{stats.skipped} skipped"
+        )
 
-    # Persist to disk. Comment out for local For Dev Only.
-    # ARTIFACTS_FOLDER = "/Users/danielyakubu/Documents/Projects/project-aletheia/artifacts" #TODO remove hardcoded path
-    # vector_store.save(f"{ARTIFACTS_FOLDER}/faiss")
-    # metadata_store.save(f"{ARTIFACTS_FOLDER}/metadata.jsonl")
+    if embedding_cache is not None:
+        print(
+            f"Embedding cache: {embedder.hits} hits, {embedder.misses} misses "
+            f"({len(embedding_cache)} cached)"
+        )
 
     # Sanity Check.
 # Sanity Check.
@@ -111,6 +369,12 @@ def ingest(
             print("Metadata:", metadata_store.get(uid))
             break 
 
+    metadata_store.close()
+    if embedding_cache is not None:
+        embedding_cache.close()
+
+    return vector_store, metadata_store
+
 
 
 def main(
@@ -120,6 +384,23 @@ def main(
     embedding_model: str,
     vector_dim: int,
     run_sanity_check: bool,
+    vector_store_backend: str,
+    metadata_store_backend: str,
+    index_config: FaissIndexConfig,
+    shards: int,
+    shard_by: str,
+    artifacts_dir: str | None,
+    embedding_backend: str,
+    pipelined: bool,
+    embed_concurrency: int,
+    tokens_per_minute: int | None,
+    checkpoint_path: str | None,
+    checkpoint_every: int | None,
+    resume: bool,
+    incremental: bool,
+    embedding_cache_path: str | None,
+    parse_workers: int,
+    ordered: bool,
 ):
     
     dataset_path = kagglehub.dataset_download(
@@ -134,6 +415,23 @@ def main(
         batch_size=batch_size,
         max_batches=max_batches,
         run_sanity_check=run_sanity_check,
+        vector_store_backend=vector_store_backend,
+        metadata_store_backend=metadata_store_backend,
+        index_config=index_config,
+        shards=shards,
+        shard_by=shard_by,
+        artifacts_dir=artifacts_dir,
+        embedding_backend=embedding_backend,
+        pipelined=pipelined,
+        embed_concurrency=embed_concurrency,
+        tokens_per_minute=tokens_per_minute,
+        checkpoint_path=checkpoint_path,
+        checkpoint_every=checkpoint_every,
+        resume=resume,
+        incremental=incremental,
+        embedding_cache_path=embedding_cache_path,
+        parse_workers=parse_workers,
+        ordered=ordered,
     )
 
 
@@ -152,9 +450,28 @@ if __name__ == "__main__":
     parser.add_argument("--embedding-model", type=str)
     parser.add_argument("--vector-dim", type=int)
     parser.add_argument("--no-sanity-check", action="store_true")
+    parser.add_argument("--vector-store", choices=["pinecone", "faiss"], default="pinecone")
+    parser.add_argument("--metadata-store", choices=["postgres", "memory"], default="postgres")
+    parser.add_argument("--artifacts-dir", type=str)
+    parser.add_argument("--embedding-backend", choices=["openai", "fake"], default="openai")
+    parser.add_argument("--pipeline", action="store_true")
+    parser.add_argument("--embed-concurrency", type=int, default=4)
+    parser.add_argument("--tokens-per-minute", type=int)
+    parser.add_argument("--checkpoint", type=str)
+    parser.add_argument("--checkpoint-every", type=int)
+    parser.add_argument("--resume", action="store_true")
+    parser.add_argument("--incremental", action="store_true")
+    parser.add_argument("--embedding-cache", type=str)
+    parser.add_argument("--parse-workers", type=int, default=0)
+    parser.add_argument("--unordered", action="store_true")
+
+    # FAISS index settings (only used with --vector-store faiss)
+    add_index_arguments(parser)
 
     args = parser.parse_args()
 
+    index_config = index_config_from_args(args)
+
     main(
         batch_size=args.batch_size or DEFAULT_BATCH_SIZE,
         max_batches=args.max_batches if args.max_batches is not None else DEFAULT_MAX_BATCHES,
@@ -163,4 +480,21 @@ if __name__ == "__main__":
         run_sanity_check=not args.no_sanity_check
         if args.no_sanity_check is not None
         else DEFAULT_RUN_SANITY_CHECK,
+        vector_store_backend=args.vector_store,
+        metadata_store_backend=args.metadata_store,
+        index_config=index_config,
+        shards=args.shards,
+        shard_by=args.shard_by,
+        artifacts_dir=args.artifacts_dir,
+        embedding_backend=args.embedding_backend,
+        pipelined=args.pipeline,
+        embed_concurrency=args.embed_concurrency,
+        tokens_per_minute=args.tokens_per_minute,
+        checkpoint_path=args.checkpoint,
+        checkpoint_every=args.checkpoint_every,
+        resume=args.resume,
+        incremental=args.incremental,
+        embedding_cache_path=args.embedding_cache,
+        parse_workers=args.parse_workers,
+        ordered=not args.unordered,
     )
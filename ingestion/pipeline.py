@@ -0,0 +1,127 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List
+
+from .typing_defs import Vector
+
+Record = Dict[str, Any]
+
+_DONE = object()
+
+
+@dataclass
+class PipelineStats:
+    batches: int = 0
+    records: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.elapsed if self.elapsed else 0.0
+
+
+class IngestionPipeline:
+    """
+    Overlaps dataset reading, embedding requests and store writes.
+
+        reader thread ──► embed pool (N requests in flight) ──► writer
+
+    The reader submits each batch to a pool of `concurrency` embedding
+    workers and queues the pending result. At most `max_pending` batches
+    are read ahead of the writer, which bounds memory. The writer runs on
+    the calling thread and commits batches strictly in dataset order, so
+    a callback after `write` always marks a contiguous prefix as done.
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[List[str]], List[Vector]],
+        write: Callable[[List[Record], List[Vector]], None],
+        concurrency: int = 4,
+        max_pending: int | None = None,
+        text_field: str = "statement",
+    ):
+        self.embed = embed
+        self.write = write
+        self.concurrency = concurrency
+        self.max_pending = max_pending or 2 * concurrency
+        self.text_field = text_field
+
+    def run(self, batches: Iterable[List[Record]]) -> PipelineStats:
+        stats = PipelineStats()
+        started = time.perf_counter()
+
+        pending: "queue.Queue[Any]" = queue.Queue(maxsize=self.max_pending)
+        stop = threading.Event()
+
+        with ThreadPoolExecutor(
+            max_workers=self.concurrency,
+            thread_name_prefix="embed",
+        ) as executor:
+            reader = threading.Thread(
+                target=self._read,
+                args=(batches, executor, pending, stop),
+                name="ingest-reader",
+                daemon=True,
+            )
+            reader.start()
+
+            try:
+                while True:
+                    item = pending.get()
+                    if item is _DONE:
+                        break
+                    if isinstance(item, BaseException):
+                        raise item
+
+                    records, future = item
+                    self.write(records, future.result())
+
+                    stats.batches += 1
+                    stats.records += len(records)
+            finally:
+                # On failure, unblock the reader and drop queued work.
+                stop.set()
+                while reader.is_alive():
+                    try:
+                        item = pending.get(timeout=0.1)
+                    except queue.Empty:
+                        continue
+                    if isinstance(item, tuple):
+                        item[1].cancel()
+                reader.join()
+
+        stats.elapsed = time.perf_counter() - started
+        return stats
+
+    def _read(
+        self,
+        batches: Iterable[List[Record]],
+        executor: ThreadPoolExecutor,
+        pending: "queue.Queue[Any]",
+        stop: threading.Event,
+    ) -> None:
+        try:
+            for records in batches:
+                if stop.is_set():
+                    return
+
+                texts = [record[self.text_field] for record in records]
+                future: Future = executor.submit(self.embed, texts)
+                self._put(pending, (records, future), stop)
+
+            self._put(pending, _DONE, stop)
+        except BaseException as e:
+            self._put(pending, e, stop)
+
+    @staticmethod
+    def _put(pending: "queue.Queue[Any]", item: Any, stop: threading.Event) -> None:
+        while not stop.is_set():
+            try:
+                pending.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
@@ -0,0 +1,37 @@
+import pytest
+
+from ingestion.bundle import BundleError, load_bundle, read_manifest, write_bundle
+from ingestion.tests.test_ingest import DIM, claim, run, write_dataset
+
+
+@pytest.fixture
+def fake_bundle(tmp_path):
+    dataset = tmp_path / "politifact.json"
+    write_dataset(dataset, [claim(i) for i in range(4)])
+    vector_store, metadata_store = run(dataset, tmp_path / "artifacts")
+
+    path = tmp_path / "bundle"
+    write_bundle(
+        path,
+        vector_store,
+        metadata_store,
+        embedding_model="text-embedding-3-small",
+        embedding_backend="fake",
+    )
+    return path
+
+
+def test_fake_bundle_is_not_servable_for_the_real_model(fake_bundle):
+    assert read_manifest(fake_bundle).embedding_backend == "fake"
+
+    with pytest.raises(BundleError, match="fake:text-embedding-3-small"):
+        load_bundle(fake_bundle, embedding_model="text-embedding-3-small")
+
+
+def test_fake_bundle_loads_for_fake_queries(fake_bundle):
+    store = load_bundle(
+        fake_bundle,
+        embedding_model="text-embedding-3-small",
+        embedding_backend="fake",
+    )
+    assert (store.dim, store.count()) == (DIM, 4)
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from ingestion.MetadataStores.columnar_snapshot import ColumnarSnapshot
+from ingestion.MetadataStores.in_memory_metadata_store import InMemoryMetadataStore
+
+
+def record(i: int) -> dict:
+    record = {
+        "uid": f"{i:064x}",
+        "statement": f"Claim number {i}",
+        "verdict": ["true", "false", "pants-fire"][i % 3],
+        "factchecker": None if i % 5 == 0 else "Lou Jacobson",
+    }
+    if i % 2:
+        record["source"] = "politifact"
+    return record
+
+
+RECORDS = [record(i) for i in range(20, 0, -1)]
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_round_trip(tmp_path, mmap):
+    path = tmp_path / "metadata.snapshot"
+    ColumnarSnapshot.write(path, RECORDS)
+
+    snapshot = ColumnarSnapshot.load(path, mmap=mmap)
+
+    assert isinstance(snapshot._buffer, np.memmap) == mmap
+    assert len(snapshot) == len(RECORDS)
+    assert list(snapshot.records()) == RECORDS
+    for row, expected in enumerate(RECORDS):
+        assert snapshot.position(expected["uid"]) == row
+    assert snapshot.position(f"{0:064x}") is None
+    assert snapshot.position("abc") is None
+
+
+def test_variable_length_uids(tmp_path):
+    records = [{"uid": uid, "statement": uid * 2} for uid in ["b", "aa", "c", "a"]]
+    path = tmp_path / "metadata.snapshot"
+    ColumnarSnapshot.write(path, records)
+
+    snapshot = ColumnarSnapshot.load(path)
+
+    assert [snapshot.record(snapshot.position(r["uid"])) for r in records] == records
+    assert snapshot.position("ab") is None
+
+
+def test_upserts_shadow_the_snapshot(tmp_path):
+    path = tmp_path / "metadata.snapshot"
+    source = InMemoryMetadataStore()
+    source.bulk_upsert(RECORDS)
+    source.save_snapshot(path)
+
+    store = InMemoryMetadataStore.load_snapshot(path)
+    updated = {**record(3), "verdict": "mostly-true"}
+    store.bulk_upsert([updated, record(21)])
+
+    assert store.count() == len(RECORDS) + 1
+    assert store.get(record(3)["uid"]) == updated
+    assert store.bulk_get([record(4)["uid"], f"{0:064x}"]) == {record(4)["uid"]: record(4)}
+    assert store.exists(record(21)["uid"])
+    assert sorted(r["uid"] for r in store.records()) == sorted(
+        r["uid"] for r in RECORDS + [record(21)]
+    )
@@ -0,0 +1,64 @@
+import faiss
+import numpy as np
+import pytest
+
+from ingestion.VectorStores.faiss_vector_store import FaissIndexConfig, FaissVectorStore
+
+DIM = 8
+
+
+def uid(i: int) -> str:
+    return f"{i:064x}"
+
+
+def vectors(n: int, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).standard_normal((n, DIM)).astype("float32")
+
+
+def test_rows_added_after_a_delete_are_searchable():
+    store = FaissVectorStore(DIM)
+    store.upsert([uid(i) for i in range(10)], list(vectors(10)))
+    store.delete([uid(3)])
+    store.query(vectors(1, seed=1)[0], k=5)  # caches the live bitmap
+
+    # rows 10 and 11 share the bitmap's last byte with rows 8 and 9
+    new = vectors(2, seed=2)
+    store.upsert([uid(10), uid(11)], list(new))
+
+    ids, _ = store.query(new[1], k=1)
+    assert ids == [uid(11)]
+
+
+def test_rerank_on_an_empty_store():
+    store = FaissVectorStore(DIM, FaissIndexConfig(rerank_k=10))
+
+    assert store.query(vectors(1)[0], k=5) == ([], [])
+
+
+def test_rerank_with_every_row_deleted():
+    store = FaissVectorStore(DIM, FaissIndexConfig(rerank_k=10))
+    store.upsert([uid(i) for i in range(4)], list(vectors(4)))
+    store.delete([uid(i) for i in range(4)])
+
+    assert store.query(vectors(1, seed=1)[0], k=5) == ([], [])
+
+
+def test_loaded_index_without_selector_support(tmp_path):
+    # Saved before build() rejected factory strings like this one.
+    config = FaissIndexConfig(index_type="factory", factory_string="PQ4x4fs")
+    index = faiss.index_factory(DIM, config.factory(), faiss.METRIC_INNER_PRODUCT)
+    store = FaissVectorStore(DIM, config, index=index)
+    base = vectors(256)
+    store.train(list(base))
+    store.upsert([uid(i) for i in range(256)], list(base))
+    store.save(tmp_path / "faiss")
+
+    with pytest.raises(ValueError):
+        config.build(DIM)
+
+    loaded = FaissVectorStore.load(tmp_path / "faiss")
+    assert len(loaded.query(base[0], k=3)[0]) == 3
+
+    loaded.delete([uid(0)])
+    with pytest.raises(ValueError, match="ID selectors"):
+        loaded.query(base[0], k=3)
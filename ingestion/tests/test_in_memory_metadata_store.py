@@ -0,0 +1,27 @@
+import pytest
+
+from ingestion.MetadataStores.in_memory_metadata_store import InMemoryMetadataStore
+
+
+def record(i: int) -> dict:
+    return {"uid": f"{i:064x}", "statement": f"Claim number {i}", "verdict": "false"}
+
+
+def test_interrupted_save_keeps_previous_file(tmp_path, monkeypatch):
+    path = tmp_path / "metadata.jsonl"
+    store = InMemoryMetadataStore()
+    store.bulk_upsert([record(i) for i in range(3)])
+    store.save(path)
+
+    store.bulk_upsert([record(i) for i in range(3, 6)])
+
+    def crash():
+        yield record(0)
+        raise OSError("disk full")
+
+    monkeypatch.setattr(store, "records", crash)
+    with pytest.raises(OSError):
+        store.save(path)
+
+    loaded = InMemoryMetadataStore.load(path)
+    assert loaded.count() == 3
@@ -0,0 +1,111 @@
+import json
+
+from ingestion.embedders import FakeEmbedder
+from ingestion.ingest import ingest
+
+DIM = 8
+
+
+def claim(i: int, verdict: str = "false") -> dict:
+    return {
+        "verdict": verdict,
+        "statement_originator": "Ann",
+        "statement": f"Claim number {i}",
+        "statement_date": "1/9/2016",
+        "statement_source": "tweet",
+        "factchecker": "Lou Jacobson",
+        "factcheck_date": "1/1/2020",
+        "factcheck_analysis_link": f"https://www.politifact.com/factchecks/{i}/",
+    }
+
+
+def write_dataset(path, claims) -> None:
+    with open(path, "w") as f:
+        for row in claims:
+            f.write(json.dumps(row) + "\n")
+
+
+def run(dataset, artifacts, **kwargs):
+    return ingest(
+        dataset_path=str(dataset),
+        embedding_model="test",
+        vector_dim=DIM,
+        batch_size=2,
+        max_batches=None,
+        run_sanity_check=False,
+        vector_store_backend="faiss",
+        metadata_store_backend="memory",
+        artifacts_dir=str(artifacts),
+        embedding_backend="fake",
+        **kwargs,
+    )
+
+
+def test_incremental_run_updates_changed_filter_attributes(tmp_path):
+    dataset = tmp_path / "politifact.json"
+    artifacts = tmp_path / "artifacts"
+    claims = [claim(i) for i in range(5)]
+    write_dataset(dataset, claims)
+    run(dataset, artifacts)
+
+    claims[2] = claim(2, verdict="pants-fire")
+    write_dataset(dataset, claims)
+    vector_store, metadata_store = run(dataset, artifacts, incremental=True)
+
+    [uid] = [r["uid"] for r in metadata_store.records() if r["statement"] == "Claim number 2"]
+    vector = FakeEmbedder(DIM).embed(["Claim number 2"])[0]
+
+    ids, _ = vector_store.query(vector, k=5, filters={"verdict": "pants-fire"})
+    assert ids == [uid]
+    ids, _ = vector_store.query(vector, k=5, filters={"verdict": "false"})
+    assert uid not in ids
+    assert vector_store.count() == 5
+    assert metadata_store.get(uid)["verdict"] == "pants-fire"
+
+
+class Interrupted(Exception):
+    pass
+
+
+class FailingEmbedder(FakeEmbedder):
+    """
+    Embeds `batches` batches, then fails like a killed run.
+    """
+
+    def __init__(self, dim: int, batches: int):
+        super().__init__(dim)
+        self.batches = batches
+
+    def embed(self, texts):
+        if self.batches == 0:
+            raise Interrupted
+        self.batches -= 1
+        return super().embed(texts)
+
+
+def test_resume_after_interrupt(tmp_path, monkeypatch):
+    dataset = tmp_path / "politifact.json"
+    artifacts = tmp_path / "artifacts"
+    checkpoint = tmp_path / "checkpoint.json"
+    write_dataset(dataset, [claim(i) for i in range(9)])
+
+    monkeypatch.setattr(
+        "ingestion.ingest.build_embedder",
+        lambda *args: FailingEmbedder(DIM, batches=3),
+    )
+    try:
+        run(dataset, artifacts, checkpoint_path=str(checkpoint), checkpoint_every=2)
+    except Interrupted:
+        pass
+    else:
+        raise AssertionError("run was not interrupted")
+
+    monkeypatch.undo()
+    vector_store, metadata_store = run(
+        dataset, artifacts, checkpoint_path=str(checkpoint), resume=True
+    )
+
+    statements = sorted(r["statement"] for r in metadata_store.records())
+    assert statements == sorted(f"Claim number {i}" for i in range(9))
+    assert vector_store.count() == 9
+    assert len(vector_store.id_map) == 9  # nothing re-added after the checkpoint
@@ -0,0 +1,92 @@
+import os
+import uuid
+
+import psycopg
+import pytest
+from psycopg.conninfo import make_conninfo
+
+from ingestion.MetadataStores.postgres_metadata_store import PostgresMetadataStore
+
+# A throwaway schema is created in this database for each test.
+DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not DATABASE_URL, reason="TEST_DATABASE_URL is not set"
+)
+
+SCHEMA = """
+    CREATE TABLE claim_metadata (
+        uid TEXT PRIMARY KEY,
+        statement TEXT,
+        verdict TEXT,
+        statement_originator TEXT,
+        statement_date DATE,
+        statement_source TEXT,
+        factchecker TEXT,
+        factcheck_date DATE,
+        factcheck_analysis_link TEXT
+    );
+"""
+
+
+def record(i: int, verdict: str = "false") -> dict:
+    return {
+        "uid": f"{i:064x}",
+        "statement": f"Claim number {i}",
+        "verdict": verdict,
+        "statement_originator": "Ann",
+        "statement_date": "2016-01-09",
+        "statement_source": "tweet",
+        "factchecker": "Lou Jacobson",
+        "factcheck_date": "2020-01-01",
+        "factcheck_analysis_link": f"https://www.politifact.com/factchecks/{i}/",
+    }
+
+
+@pytest.fixture
+def store():
+    schema = f"test_{uuid.uuid4().hex}"
+    with psycopg.connect(DATABASE_URL, autocommit=True) as conn:
+        conn.execute(f"CREATE SCHEMA {schema}")
+        conn.execute(f"SET search_path TO {schema}")
+        conn.execute(SCHEMA)
+
+    # One connection, so every batch reuses the same staging table.
+    store = PostgresMetadataStore(
+        make_conninfo(DATABASE_URL, options=f"-c search_path={schema}"),
+        min_size=1,
+        max_size=1,
+    )
+    yield store
+
+    store.close()
+    with psycopg.connect(DATABASE_URL, autocommit=True) as conn:
+        conn.execute(f"DROP SCHEMA {schema} CASCADE")
+
+
+def test_bulk_upsert_inserts_and_merges(store):
+    store.bulk_upsert([record(1), record(2)])
+    store.bulk_upsert([record(2, verdict="pants-fire"), record(3)])
+
+    assert store.count() == 3
+    records = store.bulk_get([record(i)["uid"] for i in (1, 2, 3)])
+    assert records[record(1)["uid"]] == record(1)
+    assert records[record(2)["uid"]]["verdict"] == "pants-fire"
+
+
+def test_last_occurrence_of_a_uid_wins(store):
+    store.bulk_upsert([record(1, verdict="true"), record(1, verdict="false")])
+
+    assert store.count() == 1
+    assert store.get(record(1)["uid"])["verdict"] == "false"
+
+
+def test_staging_rows_do_not_outlive_their_batch(store):
+    store.bulk_upsert([record(1)])
+    with store.pool.connection() as conn:
+        conn.execute("DELETE FROM claim_metadata")
+
+    store.bulk_upsert([record(2)])
+
+    assert store.count() == 1
+    assert not store.exists(record(1)["uid"])
@@ -0,0 +1,78 @@
+import hashlib
+
+import numpy as np
+import pytest
+
+from ingestion.VectorStores.faiss_vector_store import FaissVectorStore
+from ingestion.VectorStores.sharded_vector_store import ShardedVectorStore, uid_shard
+
+DIM = 8
+
+
+def uid(i: int) -> str:
+    # Sharding hashes the UID prefix, so these need to look like real UIDs.
+    return hashlib.sha256(str(i).encode()).hexdigest()
+
+
+def vectors(n: int, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).standard_normal((n, DIM)).astype("float32")
+
+
+def test_merged_results_match_a_single_index():
+    ids = [uid(i) for i in range(40)]
+    data = vectors(40)
+    single = FaissVectorStore(DIM)
+    single.upsert(ids, list(data))
+    sharded = ShardedVectorStore([FaissVectorStore(DIM) for _ in range(3)])
+    sharded.upsert(ids, list(data))
+
+    for shard, store in enumerate(sharded.shards):
+        assert store.count() == sum(uid_shard(i, 3) == shard for i in ids)
+        assert 0 < store.count() < len(ids)
+
+    queries = vectors(5, seed=1)
+    for (merged_ids, merged_scores), expected in zip(
+        sharded.query_batch(queries, k=10), single.query_batch(queries, k=10)
+    ):
+        assert merged_ids == expected[0]
+        assert merged_scores == sorted(merged_scores, reverse=True)
+        np.testing.assert_allclose(merged_scores, expected[1], rtol=1e-5)
+
+
+def test_ties_across_shards_are_ordered_by_uid():
+    # Both shards hold the same vector, under UIDs that hash apart.
+    first, second = sorted(
+        next(uid(i) for i in range(100) if uid_shard(uid(i), 2) == shard) for shard in (0, 1)
+    )
+    vector = vectors(1)[0]
+    sharded = ShardedVectorStore([FaissVectorStore(DIM) for _ in range(2)])
+    sharded.upsert([second, first], [vector, vector])
+
+    ids, scores = sharded.query(vector, k=2)
+
+    assert ids == [first, second]
+    assert scores[0] == scores[1]
+
+
+def test_source_partitioning_creates_shards_on_upsert():
+    sharded = ShardedVectorStore(
+        [], partition="source", shard_factory=lambda: FaissVectorStore(DIM)
+    )
+    with pytest.raises(ValueError, match="no shards yet"):
+        sharded.config
+
+    sharded.upsert(
+        [uid(i) for i in range(4)],
+        list(vectors(4)),
+        [{"source": source} for source in ("a", "b", "a", "b")],
+    )
+
+    assert sharded.sources == ["a", "b"]
+    assert [shard.count() for shard in sharded.shards] == [2, 2]
+    assert sharded.dim == DIM
+
+
+@pytest.mark.parametrize("partition", ["uid", "source"])
+def test_no_shards_and_no_factory(partition):
+    with pytest.raises(ValueError, match="shard"):
+        ShardedVectorStore([], partition=partition)
@@ -0,0 +1,52 @@
+import numpy as np
+
+from ingestion.VectorStores.uid_map import UidMap
+
+
+def uid(i: int) -> str:
+    return f"{i:064x}"
+
+
+def test_loads_version_1_hex_files(tmp_path):
+    uids = [uid(i) for i in (5, 3, 9)]
+    path = tmp_path / "ids.bin"
+    with open(path, "wb") as f:
+        f.write(UidMap.HEADER.pack(UidMap.MAGIC, 1, 64, len(uids)))
+        f.write("".join(uids).encode("ascii"))
+
+    uid_map = UidMap.load(path)
+
+    assert uid_map.to_list() == uids
+    assert uid_map.position(uid(9)) == 2
+    assert uid_map.position(uid(4)) is None
+
+    # Saving upgrades to raw digests.
+    uid_map.save(path)
+    with open(path, "rb") as f:
+        _, version, width, count = UidMap.HEADER.unpack(f.read(UidMap.HEADER.size))
+    assert (version, width, count) == (2, 32, 3)
+    assert UidMap.load(path).to_list() == uids
+
+
+def test_round_trip_memory_mapped(tmp_path):
+    uids = [uid(i) for i in range(100, 0, -1)]
+    UidMap.from_list(uids).save(tmp_path / "ids.bin")
+
+    uid_map = UidMap.load(tmp_path / "ids.bin", mmap=True)
+
+    assert isinstance(uid_map._base, np.memmap)
+    assert uid_map.lookup([0, 99, 50]) == [uids[0], uids[99], uids[50]]
+    assert all(uid_map.position(u) == i for i, u in enumerate(uids))
+
+
+def test_positions_of_a_repeated_uid(tmp_path):
+    UidMap.from_list([uid(1), uid(2), uid(1), uid(3), uid(1)]).save(tmp_path / "ids.bin")
+    uid_map = UidMap.load(tmp_path / "ids.bin")
+
+    assert uid_map.positions(uid(1)) == [0, 2, 4]
+    assert uid_map.positions(uid(2)) == [1]
+    assert uid_map.positions(uid(7)) == []
+
+    # Repeats appended since load: only the newest one is tracked.
+    uid_map.extend([uid(1), uid(1)])
+    assert uid_map.positions(uid(1)) == [0, 2, 4, 6]
@@ -0,0 +1,146 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Generic, List, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+    Coalesces concurrent single-item calls into batches.
+
+    Callers block in `submit` while a background thread collects items
+    until either `max_batch_size` is reached or the oldest item has waited
+    `max_wait` seconds. Each batch is handed to a small worker pool that
+    runs `process` once over it and fans the results back out to the
+    waiting callers, so collection continues while batches are in flight.
+
+    `process` must return one result per input item, in order.
+    """
+
+    def __init__(
+        self,
+        process: Callable[[List[T]], List[R]],
+        max_batch_size: int,
+        max_wait: float,
+        max_concurrent_batches: int = 4,
+    ):
+        self.process = process
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_batches,
+            thread_name_prefix="micro-batch",
+        )
+
+        # (item, future, enqueued_at)
+        self._queue: "queue.Queue[Tuple[T, Future, float]]" = queue.Queue()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._stats_lock = threading.Lock()
+        self._batches = 0
+        self._items = 0
+        self._max_batch = 0
+        self._queue_delay_total = 0.0
+        self._queue_delay_max = 0.0
+        self._batch_sizes: Dict[int, int] = {}
+
+    # ---------- Lifecycle ----------
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run,
+            name="micro-batcher",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._executor.shutdown(wait=True)
+
+    # ---------- Core operations ----------
+
+    def submit(self, item: T) -> R:
+        if self._stop.is_set():
+            raise RuntimeError("batcher is stopped")
+
+        future: Future = Future()
+        self._queue.put((item, future, time.monotonic()))
+        return future.result()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return {
+                "batches": self._batches,
+                "items": self._items,
+                "mean_batch_size": self._items / self._batches if self._batches else 0.0,
+                "max_batch_size": self._max_batch,
+                "mean_queue_delay_ms": (
+                    1000 * self._queue_delay_total / self._items if self._items else 0.0
+                ),
+                "max_queue_delay_ms": 1000 * self._queue_delay_max,
+                "batch_size_histogram": dict(sorted(self._batch_sizes.items())),
+            }
+
+    # ---------- Helpers ----------
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                first = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            batch = [first]
+            deadline = first[2] + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        batch.append(self._queue.get(timeout=remaining))
+                    else:
+                        # Past the deadline: still take whatever is
+                        # already queued, but don't wait for more.
+                        batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            self._executor.submit(self._process, batch)
+
+        # Don't leave callers blocked forever on shutdown.
+        while True:
+            try:
+                _, future, _ = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            future.set_exception(RuntimeError("batcher is stopped"))
+
+    def _process(self, batch: List[Tuple[T, Future, float]]) -> None:
+        started = time.monotonic()
+        delays = [started - enqueued_at for _, _, enqueued_at in batch]
+
+        with self._stats_lock:
+            self._batches += 1
+            self._items += len(batch)
+            self._max_batch = max(self._max_batch, len(batch))
+            self._queue_delay_total += sum(delays)
+            self._queue_delay_max = max(self._queue_delay_max, *delays)
+            self._batch_sizes[len(batch)] = self._batch_sizes.get(len(batch), 0) + 1
+
+        try:
+            results = self.process([item for item, _, _ in batch])
+        except Exception as e:
+            for _, future, _ in batch:
+                future.set_exception(e)
+            return
+
+        for (_, future, _), result in zip(batch, results):
+            future.set_result(result)
@@ -0,0 +1,114 @@
+import os
+from dataclasses import dataclass
+
+
+def require_env(name: str) -> str:
+    value = os.getenv(name)
+    if not value:
+        raise RuntimeError(f"{name} is not set")
+    return value
+
+
+def optional_int(name: str) -> int | None:
+    value = os.getenv(name)
+    return int(value) if value else None
+
+
+@dataclass(frozen=True)
+class RetrievalConfig:
+    openai_api_key: str
+    index_path: str | None
+    embedding_model: str = "text-embedding-3-small"
+    port: int = 50051
+    max_workers: int = 10
+    index_reload_interval: float = 30.0
+    embedding_cache_size: int = 10_000
+    embedding_cache_ttl: float = 86_400.0
+    embedding_cache_path: str | None = None
+    stats_interval: float = 60.0
+    max_batch_queries: int = 512
+    stream_chunk_size: int = 32
+    search_batch_max_wait_ms: float = 0.0
+    search_batch_max_size: int = 32
+    faiss_nprobe: int | None = None
+    faiss_ef_search: int | None = None
+    faiss_rerank_k: int | None = None
+    faiss_mmap: bool = False
+    bundle_verify_checksums: bool = True
+    server_mode: str = "threaded"
+    max_concurrent_requests: int = 256
+    search_workers: int | None = None
+    worker_processes: int = 1
+    faiss_shards: tuple = ()
+
+    @classmethod
+    def from_env(cls) -> "RetrievalConfig":
+        """
+        Build the service configuration from environment variables.
+        """
+        server_mode = os.getenv("GRPC_SERVER_MODE", cls.server_mode)
+        if server_mode not in ("threaded", "aio"):
+            raise RuntimeError("GRPC_SERVER_MODE must be 'threaded' or 'aio'")
+
+        search_batch_max_wait_ms = float(
+            os.getenv("SEARCH_BATCH_MAX_WAIT_MS", cls.search_batch_max_wait_ms)
+        )
+        if server_mode == "aio" and search_batch_max_wait_ms > 0:
+            raise RuntimeError(
+                "SEARCH_BATCH_MAX_WAIT_MS (micro-batching) requires "
+                "GRPC_SERVER_MODE=threaded"
+            )
+
+        # host:port of retrieval processes each serving one index shard;
+        # the index then lives there instead of at FAISS_INDEX_PATH.
+        faiss_shards = tuple(
+            address.strip()
+            for address in os.getenv("FAISS_SHARDS", "").split(",")
+            if address.strip()
+        )
+
+        return cls(
+            openai_api_key=require_env("OPENAI_API_KEY"),
+            index_path=os.getenv("FAISS_INDEX_PATH")
+            if faiss_shards
+            else require_env("FAISS_INDEX_PATH"),
+            embedding_model=os.getenv("EMBEDDING_MODEL", cls.embedding_model),
+            port=int(os.getenv("GRPC_PORT", cls.port)),
+            max_workers=int(os.getenv("GRPC_MAX_WORKERS", cls.max_workers)),
+            index_reload_interval=float(
+                os.getenv("INDEX_RELOAD_INTERVAL_S", cls.index_reload_interval)
+            ),
+            embedding_cache_size=int(
+                os.getenv("EMBEDDING_CACHE_SIZE", cls.embedding_cache_size)
+            ),
+            embedding_cache_ttl=float(
+                os.getenv("EMBEDDING_CACHE_TTL_S", cls.embedding_cache_ttl)
+            ),
+            embedding_cache_path=os.getenv("EMBEDDING_CACHE_PATH") or None,
+            stats_interval=float(os.getenv("STATS_INTERVAL_S", cls.stats_interval)),
+            max_batch_queries=int(
+                os.getenv("MAX_BATCH_QUERIES", cls.max_batch_queries)
+            ),
+            stream_chunk_size=int(
+                os.getenv("STREAM_CHUNK_SIZE", cls.stream_chunk_size)
+            ),
+            search_batch_max_wait_ms=search_batch_max_wait_ms,
+            search_batch_max_size=int(
+                os.getenv("SEARCH_BATCH_MAX_SIZE", cls.search_batch_max_size)
+            ),
+            faiss_nprobe=optional_int("FAISS_NPROBE"),
+            faiss_ef_search=optional_int("FAISS_EF_SEARCH"),
+            faiss_rerank_k=optional_int("FAISS_RERANK_K"),
+            faiss_mmap=os.getenv("FAISS_MMAP", "").lower() in ("1", "true", "yes"),
+            bundle_verify_checksums=os.getenv("BUNDLE_VERIFY_CHECKSUMS", "1").lower()
+            not in ("0", "false", "no"),
+            server_mode=server_mode,
+            max_concurrent_requests=int(
+                os.getenv("MAX_CONCURRENT_REQUESTS", cls.max_concurrent_requests)
+            ),
+            search_workers=optional_int("FAISS_SEARCH_WORKERS"),
+            worker_processes=int(
+                os.getenv("GRPC_WORKER_PROCESSES", cls.worker_processes)
+            ),
+            faiss_shards=faiss_shards,
+        )
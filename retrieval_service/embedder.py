@@ -0,0 +1,92 @@
+import asyncio
+from typing import List, Tuple
+
+from openai import AsyncOpenAI, OpenAI
+
+from ingestion.typing_defs import Vector
+from .embedding_cache import EmbeddingCache
+
+
+class QueryEmbedder:
+    """
+    Turns query text into embeddings, consulting an optional cache first
+    and sending only the misses to the embeddings API in one request.
+    """
+
+    def __init__(
+        self,
+        client: OpenAI,
+        model: str,
+        cache: EmbeddingCache | None = None,
+    ):
+        self.client = client
+        self.model = model
+        self.cache = cache
+
+    def embed(self, texts: List[str]) -> List[Vector]:
+        embeddings, missing = self._from_cache(texts)
+        if missing:
+            response = self.client.embeddings.create(
+                model=self.model,
+                input=[texts[i] for i in missing],
+                encoding_format="float",
+            )
+            self._fill(texts, embeddings, missing, response)
+
+        return embeddings
+
+    # ---------- Helpers ----------
+
+    def _from_cache(self, texts: List[str]) -> Tuple[List[Vector | None], List[int]]:
+        embeddings: List[Vector | None] = [None] * len(texts)
+
+        if self.cache is not None:
+            for i, text in enumerate(texts):
+                embeddings[i] = self.cache.get(self.model, text)
+
+        missing = [i for i, e in enumerate(embeddings) if e is None]
+        return embeddings, missing
+
+    def _fill(self, texts, embeddings, missing, response) -> None:
+        filled = []
+        for i, item in zip(missing, response.data):
+            embeddings[i] = item.embedding
+            filled.append((texts[i], item.embedding))
+
+        if self.cache is not None:
+            self.cache.put_many(self.model, filled)
+
+
+class AsyncQueryEmbedder(QueryEmbedder):
+    """
+    QueryEmbedder for the asyncio server: `embed` is a coroutine and the
+    embeddings request is awaited on an AsyncOpenAI client, so a slow API
+    call holds no thread. With a persistent cache, lookups and writes run
+    in a worker thread so SQLite I/O never blocks the event loop.
+    """
+
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        model: str,
+        cache: EmbeddingCache | None = None,
+    ):
+        super().__init__(client, model, cache)
+
+    async def embed(self, texts: List[str]) -> List[Vector]:
+        embeddings, missing = await self._off_loop(self._from_cache, texts)
+        if missing:
+            response = await self.client.embeddings.create(
+                model=self.model,
+                input=[texts[i] for i in missing],
+                encoding_format="float",
+            )
+            await self._off_loop(self._fill, texts, embeddings, missing, response)
+
+        return embeddings
+
+    async def _off_loop(self, func, *args):
+        # Memory-only lookups are cheap enough to run inline.
+        if self.cache is not None and self.cache.persistent:
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
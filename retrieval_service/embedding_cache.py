@@ -0,0 +1,191 @@
+import hashlib
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Iterable, Tuple
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """
+    Query-embedding cache keyed on (embedding model, normalized text).
+
+    The in-memory tier is a bounded LRU with a TTL. An optional SQLite
+    file acts as a persistent second tier that survives restarts; entries
+    found there are promoted back into memory.
+
+    Thread-safe, so one instance can be shared by all gRPC workers. The
+    SQLite file is opened in WAL mode so pre-fork workers sharing it can
+    read while another one writes.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        ttl: float = 86_400.0,
+        persist_path: str | None = None,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+
+        # key → (created_at, vector), least recently used first
+        self._entries: "OrderedDict[str, Tuple[float, np.ndarray]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Serializes use of the SQLite connection, so memory hits never
+        # wait behind disk I/O.
+        self._db_lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._db: sqlite3.Connection | None = None
+        if persist_path:
+            Path(persist_path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(persist_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            # A lost write only costs a re-embed, so skip the fsync per commit.
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    key TEXT PRIMARY KEY,
+                    created_at REAL NOT NULL,
+                    vector BLOB NOT NULL
+                )
+                """
+            )
+            self._db.commit()
+
+    # ---------- Keys ----------
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """
+        Canonical form used for cache keys: NFC, case-folded, with runs
+        of whitespace collapsed.
+        """
+        return " ".join(unicodedata.normalize("NFC", text).casefold().split())
+
+    @classmethod
+    def key(cls, model: str, text: str) -> str:
+        return hashlib.sha256(
+            f"{model}\0{cls.normalize(text)}".encode()
+        ).hexdigest()
+
+    @property
+    def persistent(self) -> bool:
+        """
+        Whether lookups and writes may touch the SQLite file, and so
+        block on disk I/O.
+        """
+        return self._db is not None
+
+    # ---------- Core operations ----------
+
+    def get(self, model: str, text: str) -> np.ndarray | None:
+        key = self.key(model, text)
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                created_at, vector = entry
+                if now - created_at <= self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return vector
+                del self._entries[key]
+
+        entry = self._get_persisted(key, now)
+
+        with self._lock:
+            if entry is not None:
+                created_at, vector = entry
+                self._insert(key, vector, created_at)
+                self.disk_hits += 1
+                return vector
+
+            self.misses += 1
+            return None
+
+    def put(self, model: str, text: str, vector) -> None:
+        self.put_many(model, [(text, vector)])
+
+    def put_many(self, model: str, items: Iterable[Tuple[str, Any]]) -> None:
+        """
+        Cache several (text, vector) pairs, persisting them in a single
+        transaction.
+        """
+        now = time.time()
+        rows = [
+            (self.key(model, text), np.asarray(vector, dtype="float32"))
+            for text, vector in items
+        ]
+
+        with self._lock:
+            for key, vector in rows:
+                self._insert(key, vector, now)
+
+        with self._db_lock:
+            if self._db is not None and rows:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?)",
+                    [(key, now, vector.tobytes()) for key, vector in rows],
+                )
+                self._db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            }
+
+    def close(self) -> None:
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # ---------- Helpers ----------
+
+    def _insert(self, key: str, vector: np.ndarray, created_at: float) -> None:
+        self._entries[key] = (created_at, vector)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _get_persisted(
+        self, key: str, now: float
+    ) -> Tuple[float, np.ndarray] | None:
+        with self._db_lock:
+            if self._db is None:
+                return None
+
+            row = self._db.execute(
+                "SELECT created_at, vector FROM embeddings WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            created_at, blob = row
+            if now - created_at > self.ttl:
+                self._db.execute("DELETE FROM embeddings WHERE key = ?", (key,))
+                self._db.commit()
+                return None
+
+        return created_at, np.frombuffer(blob, dtype="float32")
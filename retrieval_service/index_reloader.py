@@ -0,0 +1,102 @@
+import logging
+import threading
+from typing import Callable
+
+from ingestion.bundle import load_bundle
+from ingestion.VectorStores.faiss_vector_store import FaissVectorStore
+
+logger = logging.getLogger(__name__)
+
+
+class IndexReloader:
+    """
+    Watches an artifact directory written by `FaissVectorStore.save` and
+    hands newly published versions to `on_reload`.
+
+    Loading happens on a background thread, one version at a time, so at
+    most two copies of the index are resident during a swap: the one
+    still serving in-flight requests and the one being loaded. With mmap
+    both copies live in the page cache rather than the heap.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        on_reload: Callable[[FaissVectorStore], None],
+        poll_interval: float,
+        current_version: str | None = None,
+        mmap: bool = False,
+        embedding_model: str | None = None,
+        verify_checksums: bool = True,
+    ):
+        self.path = path
+        self.mmap = mmap
+        self.embedding_model = embedding_model
+        self.verify_checksums = verify_checksums
+        self.on_reload = on_reload
+        self.poll_interval = poll_interval
+        self.current_version = current_version
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    # ---------- Lifecycle ----------
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run,
+            name="index-reloader",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.check_now()
+            except Exception:
+                logger.exception("Index reload from %s failed", self.path)
+
+    # ---------- Reload ----------
+
+    def check_now(self, verified_version: str | None = None) -> bool:
+        """
+        Load and publish the artifacts at `path` if their version changed.
+        Returns True if a new index was swapped in.
+
+        Checksums are skipped for `verified_version`, a version someone
+        else (the worker supervisor) has already verified.
+        """
+        with self._lock:
+            version = FaissVectorStore.read_version(self.path)
+            if version is None or version == self.current_version:
+                return False
+
+            logger.info("Loading index version %s from %s", version, self.path)
+            store = load_bundle(
+                self.path,
+                mmap=self.mmap,
+                embedding_model=self.embedding_model,
+                checksums=self.verify_checksums and version != verified_version,
+            )
+
+            # A writer started while we were loading; the pair we read may
+            # be torn, so retry once the new version is published.
+            if FaissVectorStore.read_version(self.path) != version:
+                logger.info("Index changed during load, retrying later")
+                return False
+
+            self.on_reload(store)
+            self.current_version = version
+            logger.info(
+                "Swapped in index version %s (%d vectors)",
+                version,
+                store.count(),
+            )
+            return True
@@ -0,0 +1,87 @@
+import json
+from typing import List, Optional, Tuple
+
+import grpc
+import numpy as np
+
+from ingestion.typing_defs import Vector, Metadata
+from ingestion.VectorStores.vector_store import VectorStore
+from . import vector_search_pb2
+from . import vector_search_pb2_grpc
+
+
+class RemoteShard(VectorStore):
+    """
+    One shard of a ShardedVectorStore served by another retrieval process
+    (with FAISS_INDEX_PATH pointing at that shard's directory), searched
+    over gRPC with query vectors embedded once by the front end.
+
+    Read-only: a shard is rebuilt and hot-reloaded by its own process.
+    """
+
+    def __init__(self, address: str, timeout: float = 5.0):
+        self.address = address
+        self.timeout = timeout
+        self._channel = grpc.insecure_channel(address)
+        self._stub = vector_search_pb2_grpc.VectorSearchServiceStub(self._channel)
+
+    @property
+    def dim(self) -> int:
+        return self._info().dim
+
+    def upsert(
+        self,
+        ids: List[str],
+        vectors: List[Vector],
+        metadatas: Optional[List[Metadata]] = None,
+    ) -> None:
+        raise NotImplementedError("remote shards are updated by rebuilding the shard")
+
+    def query(
+        self,
+        vector: Vector,
+        k: int,
+        filters: Optional[Metadata] = None,
+    ) -> Tuple[List[str], List[float]]:
+        return self.query_batch([vector], k, filters)[0]
+
+    def query_batch(
+        self,
+        vectors: List[Vector],
+        k: int,
+        filters: Optional[Metadata] = None,
+    ) -> List[Tuple[List[str], List[float]]]:
+        vecs = np.array(vectors, dtype="float32", ndmin=2)
+
+        response = self._stub.SearchVectors(
+            vector_search_pb2.VectorSearchRequest(
+                vectors=vecs.ravel().tolist(),
+                dim=vecs.shape[1],
+                k=k,
+                filter_json=json.dumps(filters) if filters else "",
+            ),
+            timeout=self.timeout,
+        )
+
+        return [
+            (
+                [result.uid for result in results.results],
+                [result.score for result in results.results],
+            )
+            for results in response.responses
+        ]
+
+    def delete(self, ids: List[str]) -> None:
+        raise NotImplementedError("remote shards are updated by rebuilding the shard")
+
+    def count(self) -> int:
+        return self._info().count
+
+    def close(self) -> None:
+        self._channel.close()
+
+    def _info(self) -> vector_search_pb2.IndexInfoResponse:
+        return self._stub.IndexInfo(
+            vector_search_pb2.IndexInfoRequest(),
+            timeout=self.timeout,
+        )
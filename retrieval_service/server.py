@@ -1,77 +1,824 @@
+import asyncio
+import contextlib
 import grpc
+import json
+import numpy as np
 from concurrent import futures
+import logging
+import os
 import signal
-import sys
+import threading
+from multiprocessing.connection import Connection
+from typing import Any, Dict, List, Tuple
 from dotenv import load_dotenv
-from openai import OpenAI
-import os
+from grpc_health.v1 import health, health_pb2, health_pb2_grpc
+from openai import AsyncOpenAI, OpenAI
+from ingestion.bundle import load_bundle
+from ingestion.VectorStores.attribute_index import date_number
 from ingestion.VectorStores.faiss_vector_store import FaissVectorStore
-from ingestion.MetadataStores.in_memory_metadata_store import InMemoryMetadataStore
+from ingestion.VectorStores.sharded_vector_store import ShardedVectorStore
 from . import vector_search_pb2
 from . import vector_search_pb2_grpc
-from pathlib import Path
+from .batcher import MicroBatcher
+from .config import RetrievalConfig
+from .embedder import AsyncQueryEmbedder, QueryEmbedder
+from .embedding_cache import EmbeddingCache
+from .index_reloader import IndexReloader
+from .remote_shard import RemoteShard
+from .supervisor import Supervisor, follow_supervisor
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "vectorsearch.VectorSearchService"
+
+# Worker processes in pre-fork mode all bind the same port.
+SERVER_OPTIONS = [("grpc.so_reuseport", 1)]
+
+
+class RequestError(Exception):
+    """
+    A request that can't be served, and the status to abort it with.
+    """
+
+    def __init__(self, code: grpc.StatusCode, details: str):
+        super().__init__(details)
+        self.code = code
+        self.details = details
+
 
 class VectorSearchServicer(
     vector_search_pb2_grpc.VectorSearchServiceServicer
 ):
+    """
+    Long-lived servicer that owns one shared, read-only FAISS index and
+    one query embedder for the lifetime of the process.
+    """
+
+    def __init__(
+        self,
+        embedder: QueryEmbedder,
+        max_batch_queries: int = 512,
+        stream_chunk_size: int = 32,
+        nprobe: int | None = None,
+        ef_search: int | None = None,
+        rerank_k: int | None = None,
+    ):
+        self.embedder = embedder
+        self.nprobe = nprobe
+        self.ef_search = ef_search
+        self.rerank_k = rerank_k
+        self.max_batch_queries = max_batch_queries
+        self.stream_chunk_size = stream_chunk_size
+        self.vector_store: FaissVectorStore | None = None
+        self.batcher: MicroBatcher | None = None
+
+    def enable_batching(self, max_batch_size: int, max_wait: float) -> None:
+        """
+        Coalesce concurrent Search calls into one embedding request and
+        one matrix search, trading up to `max_wait` seconds of queueing
+        for throughput.
+        """
+        self.batcher = MicroBatcher(
+            self._search_coalesced,
+            max_batch_size=max_batch_size,
+            max_wait=max_wait,
+        )
+        self.batcher.start()
+
+    def load_index(
+        self,
+        path: str,
+        mmap: bool = False,
+        verify_checksums: bool = True,
+    ) -> None:
+        """
+        Load the FAISS index + ID map once. Search calls are rejected
+        with UNAVAILABLE until this has completed. Bundles are checked
+        against their manifest and the query embedding model first.
+        """
+        self.swap_index(
+            load_bundle(
+                path,
+                mmap=mmap,
+                embedding_model=self.embedder.model,
+                checksums=verify_checksums,
+            )
+        )
+        logger.info(
+            "Loaded FAISS index from %s (%d vectors)",
+            path,
+            self.vector_store.count(),
+        )
+
+    def use_remote_shards(self, addresses: List[str]) -> None:
+        """
+        Serve a ShardedVectorStore whose shards are other retrieval
+        processes. Queries are embedded here once and scattered to every
+        shard as vectors; each shard loads and reloads its own index.
+        """
+        self.swap_index(ShardedVectorStore([RemoteShard(address) for address in addresses]))
+        logger.info("Searching %d remote shards: %s", len(addresses), ", ".join(addresses))
+
+    def swap_index(self, vector_store: FaissVectorStore) -> None:
+        """
+        Atomically publish a new index snapshot.
+
+        Each Search reads `self.vector_store` exactly once, so in-flight
+        calls finish on the snapshot they started with and the old index
+        is released when the last of them returns.
+
+        Query-time overrides (nprobe / efSearch / rerank_k) are applied
+        before the snapshot becomes visible.
+        """
+        vector_store.set_search_params(
+            nprobe=self.nprobe,
+            ef_search=self.ef_search,
+            rerank_k=self.rerank_k,
+        )
+        self.vector_store = vector_store
+
+    # ---------- RPCs ----------
+
     def Search(self, request, context):
+        try:
+            vector_store = self._require_index()
+            filters = self._require_filters(request)
+            k = request.k or 3
+
+            # Only unfiltered calls are coalesced: a micro-batch shares one
+            # FAISS search, and with it one selector.
+            if self.batcher is not None and filters is None:
+                ids, scores = self.batcher.submit((request.query, k))
+                return self._to_response(ids, scores)
 
-        query = request.query
-        k = request.k or 3
+            ids, scores = self._search_many(
+                vector_store, [request.query], k, filters
+            )[0]
+        except RequestError as e:
+            context.abort(e.code, e.details)
 
-        OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+        return self._to_response(ids, scores)
 
-        if not OPENAI_API_KEY:
-            raise RuntimeError("OPENAI_API_KEY is not set")
-      
-        client = OpenAI(api_key=OPENAI_API_KEY)
-        
-        #TODO: Make this path dynamic
-        vector_store = FaissVectorStore.load("/Users/danielyakubu/Documents/Projects/project-aletheia/artifacts/faiss")
-        print("FAISS index size:", vector_store.index.ntotal)
+    def BatchSearch(self, request, context):
+        try:
+            vector_store = self._require_index()
+            queries = self._require_queries(request)
+            filters = self._require_filters(request)
+            k = request.k or 3
 
-        print("Query:", request.query, "k:", request.k)
-        print("FAISS ntotal:", vector_store.index.ntotal)
+            results = self._search_many(vector_store, queries, k, filters)
+        except RequestError as e:
+            context.abort(e.code, e.details)
 
-        response = client.embeddings.create(
-            model="text-embedding-3-small",
-            input=query,
-            encoding_format="float",
+        return vector_search_pb2.BatchSearchResponse(
+            responses=[self._to_response(ids, scores) for ids, scores in results]
         )
 
-        query_embedding = response.data[0].embedding
-        ids, scores = vector_store.query(query_embedding, k)
+    def BatchSearchStream(self, request, context):
+        try:
+            vector_store = self._require_index()
+            queries = self._require_queries(request)
+            filters = self._require_filters(request)
+            k = request.k or 3
 
-        return vector_search_pb2.SearchResponse(
-        results=[
-            vector_search_pb2.SearchResult(uid=str(uid), score=float(score))
-            for uid, score in zip(ids, scores)
+            # Embed and search chunk by chunk so the first results reach the
+            # caller before the whole batch is done.
+            for start in range(0, len(queries), self.stream_chunk_size):
+                chunk = queries[start:start + self.stream_chunk_size]
+
+                for offset, (ids, scores) in enumerate(
+                    self._search_many(vector_store, chunk, k, filters)
+                ):
+                    yield vector_search_pb2.BatchSearchResult(
+                        query_index=start + offset,
+                        results=self._to_response(ids, scores).results,
+                    )
+        except RequestError as e:
+            context.abort(e.code, e.details)
+
+    def SearchVectors(self, request, context):
+        try:
+            vector_store = self._require_index()
+            vectors, filters = self._require_vectors(request)
+            results = self._query(vector_store, vectors, request.k or 3, filters)
+        except RequestError as e:
+            context.abort(e.code, e.details)
+
+        return vector_search_pb2.BatchSearchResponse(
+            responses=[self._to_response(ids, scores) for ids, scores in results]
+        )
+
+    def IndexInfo(self, request, context):
+        try:
+            vector_store = self._require_index()
+        except RequestError as e:
+            context.abort(e.code, e.details)
+
+        return self._index_info(vector_store)
+
+    # ---------- Helpers ----------
+
+    def _require_index(self) -> FaissVectorStore:
+        vector_store = self.vector_store
+        if vector_store is None:
+            raise RequestError(grpc.StatusCode.UNAVAILABLE, "index is not loaded yet")
+        return vector_store
+
+    def _require_queries(self, request) -> List[str]:
+        queries = list(request.queries)
+        if len(queries) > self.max_batch_queries:
+            raise RequestError(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f"at most {self.max_batch_queries} queries per batch",
+            )
+        return queries
+
+    def _require_vectors(self, request) -> Tuple[np.ndarray, Dict[str, Any] | None]:
+        """
+        Query vectors and filter of a VectorSearchRequest.
+        """
+        if not request.dim or len(request.vectors) % request.dim:
+            raise RequestError(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                "vectors must hold a whole number of rows of `dim` floats",
+            )
+
+        vectors = np.array(request.vectors, dtype="float32").reshape(-1, request.dim)
+        if len(vectors) > self.max_batch_queries:
+            raise RequestError(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f"at most {self.max_batch_queries} queries per batch",
+            )
+
+        try:
+            filters = json.loads(request.filter_json) if request.filter_json else None
+        except json.JSONDecodeError:
+            raise RequestError(grpc.StatusCode.INVALID_ARGUMENT, "filter_json is not valid JSON")
+
+        return vectors, filters
+
+    def _require_filters(self, request) -> Dict[str, Any] | None:
+        """
+        Translate a SearchFilter into the vector store's filter format,
+        or None if the request has no (or an empty) filter.
+        """
+        if not request.HasField("filter"):
+            return None
+
+        search_filter = request.filter
+        filters: Dict[str, Any] = {}
+
+        for name, values in (
+            ("verdict", search_filter.verdicts),
+            ("factchecker", search_filter.factcheckers),
+            ("statement_source", search_filter.statement_sources),
+        ):
+            if values:
+                filters[name] = {"$in": list(values)}
+
+        date_range = {}
+        try:
+            if search_filter.statement_date_from:
+                date_range["$gte"] = date_number(search_filter.statement_date_from)
+            if search_filter.statement_date_to:
+                date_range["$lte"] = date_number(search_filter.statement_date_to)
+        except (ValueError, OverflowError):
+            raise RequestError(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                "statement dates must be YYYY-MM-DD",
+            )
+        if date_range:
+            filters["statement_date"] = date_range
+
+        return filters or None
+
+    def _search_many(
+        self,
+        vector_store: FaissVectorStore,
+        queries: List[str],
+        k: int,
+        filters: Dict[str, Any] | None = None,
+    ) -> List[Tuple[List[str], List[float]]]:
+        if not queries:
+            return []
+
+        return self._query(vector_store, self.embedder.embed(queries), k, filters)
+
+    @staticmethod
+    def _query(
+        vector_store: FaissVectorStore,
+        embeddings,
+        k: int,
+        filters: Dict[str, Any] | None,
+    ) -> List[Tuple[List[str], List[float]]]:
+        try:
+            return vector_store.query_batch(embeddings, k, filters)
+        except ValueError as e:
+            # e.g. an index built before filter attributes existed
+            raise RequestError(grpc.StatusCode.FAILED_PRECONDITION, str(e))
+        except grpc.RpcError as e:
+            # a remote shard failed; the merged result would be incomplete
+            raise RequestError(
+                grpc.StatusCode.UNAVAILABLE,
+                f"shard search failed: {e.details()}",
+            )
+
+    @staticmethod
+    def _index_info(vector_store: FaissVectorStore):
+        try:
+            return vector_search_pb2.IndexInfoResponse(
+                count=vector_store.count(),
+                dim=vector_store.dim,
+            )
+        except grpc.RpcError as e:
+            raise RequestError(
+                grpc.StatusCode.UNAVAILABLE,
+                f"shard info failed: {e.details()}",
+            )
+
+    def _search_coalesced(
+        self,
+        requests: List[Tuple[str, int]],
+    ) -> List[Tuple[List[str], List[float]]]:
+        """
+        Process a micro-batch of (query, k) pairs: search every query at
+        the largest requested k, then trim each result to its own k.
+        """
+        vector_store = self.vector_store
+        max_k = max(k for _, k in requests)
+
+        results = self._search_many(
+            vector_store,
+            [query for query, _ in requests],
+            max_k,
+        )
+
+        return [
+            (ids[:k], scores[:k])
+            for (_, k), (ids, scores) in zip(requests, results)
         ]
-)
 
+    @staticmethod
+    def _to_response(ids: List[str], scores: List[float]):
+        return vector_search_pb2.SearchResponse(
+            results=[
+                vector_search_pb2.SearchResult(uid=str(uid), score=float(score))
+                for uid, score in zip(ids, scores)
+            ]
+        )
+
+    def stats(self) -> dict:
+        stats = {}
+        vector_store = self.vector_store
+        if hasattr(vector_store, "compaction_stats"):
+            stats["index"] = vector_store.compaction_stats()
+        if self.embedder.cache is not None:
+            stats["embedding_cache"] = self.embedder.cache.stats()
+        if self.batcher is not None:
+            stats["search_batching"] = self.batcher.stats()
+        return stats
+
+
+class AsyncVectorSearchServicer(VectorSearchServicer):
+    """
+    Servicer for the grpc.aio server. Requests are coroutines on one
+    event loop: query embedding is awaited on an AsyncOpenAI client, and
+    FAISS searches run on a bounded thread pool (FAISS releases the GIL),
+    so waiting on the embeddings API ties up neither threads nor cores.
+
+    At most `max_concurrent_requests` RPCs are admitted at a time; the
+    rest fail fast with RESOURCE_EXHAUSTED instead of queueing without
+    bound. Health checks are a separate service and are never rejected.
+    """
+
+    def __init__(
+        self,
+        embedder: AsyncQueryEmbedder,
+        max_concurrent_requests: int = 256,
+        search_workers: int | None = None,
+        max_batch_queries: int = 512,
+        stream_chunk_size: int = 32,
+        nprobe: int | None = None,
+        ef_search: int | None = None,
+        rerank_k: int | None = None,
+    ):
+        super().__init__(
+            embedder,
+            max_batch_queries=max_batch_queries,
+            stream_chunk_size=stream_chunk_size,
+            nprobe=nprobe,
+            ef_search=ef_search,
+            rerank_k=rerank_k,
+        )
+        self.max_concurrent_requests = max_concurrent_requests
+        self._search_executor = futures.ThreadPoolExecutor(
+            max_workers=search_workers or os.cpu_count(),
+            thread_name_prefix="faiss-search",
+        )
+
+        # Only touched from the event loop thread, so no lock is needed.
+        self._in_flight = 0
+        self._admitted = 0
+        self._rejected = 0
+
+    def close(self) -> None:
+        self._search_executor.shutdown(wait=True)
+
+    # ---------- RPCs ----------
 
+    async def Search(self, request, context):
+        try:
+            with self._admit():
+                vector_store = self._require_index()
+                filters = self._require_filters(request)
+                ids, scores = (
+                    await self._search_many_async(
+                        vector_store, [request.query], request.k or 3, filters
+                    )
+                )[0]
+        except RequestError as e:
+            await context.abort(e.code, e.details)
+
+        return self._to_response(ids, scores)
+
+    async def BatchSearch(self, request, context):
+        try:
+            with self._admit():
+                vector_store = self._require_index()
+                queries = self._require_queries(request)
+                filters = self._require_filters(request)
+                results = await self._search_many_async(
+                    vector_store, queries, request.k or 3, filters
+                )
+        except RequestError as e:
+            await context.abort(e.code, e.details)
+
+        return vector_search_pb2.BatchSearchResponse(
+            responses=[self._to_response(ids, scores) for ids, scores in results]
+        )
+
+    async def BatchSearchStream(self, request, context):
+        try:
+            with self._admit():
+                vector_store = self._require_index()
+                queries = self._require_queries(request)
+                filters = self._require_filters(request)
+                k = request.k or 3
+
+                for start in range(0, len(queries), self.stream_chunk_size):
+                    chunk = queries[start:start + self.stream_chunk_size]
+
+                    for offset, (ids, scores) in enumerate(
+                        await self._search_many_async(vector_store, chunk, k, filters)
+                    ):
+                        yield vector_search_pb2.BatchSearchResult(
+                            query_index=start + offset,
+                            results=self._to_response(ids, scores).results,
+                        )
+        except RequestError as e:
+            await context.abort(e.code, e.details)
+
+    async def SearchVectors(self, request, context):
+        try:
+            with self._admit():
+                vector_store = self._require_index()
+                vectors, filters = self._require_vectors(request)
+                results = await asyncio.get_running_loop().run_in_executor(
+                    self._search_executor,
+                    self._query,
+                    vector_store,
+                    vectors,
+                    request.k or 3,
+                    filters,
+                )
+        except RequestError as e:
+            await context.abort(e.code, e.details)
+
+        return vector_search_pb2.BatchSearchResponse(
+            responses=[self._to_response(ids, scores) for ids, scores in results]
+        )
+
+    async def IndexInfo(self, request, context):
+        try:
+            vector_store = self._require_index()
+            return await asyncio.to_thread(self._index_info, vector_store)
+        except RequestError as e:
+            await context.abort(e.code, e.details)
+
+    # ---------- Helpers ----------
+
+    @contextlib.contextmanager
+    def _admit(self):
+        if self._in_flight >= self.max_concurrent_requests:
+            self._rejected += 1
+            raise RequestError(
+                grpc.StatusCode.RESOURCE_EXHAUSTED,
+                f"server is at its limit of {self.max_concurrent_requests} "
+                "concurrent requests; retry with backoff",
+            )
+
+        self._in_flight += 1
+        self._admitted += 1
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+
+    async def _search_many_async(
+        self,
+        vector_store: FaissVectorStore,
+        queries: List[str],
+        k: int,
+        filters: Dict[str, Any] | None = None,
+    ) -> List[Tuple[List[str], List[float]]]:
+        if not queries:
+            return []
+
+        embeddings = await self.embedder.embed(queries)
+        return await asyncio.get_running_loop().run_in_executor(
+            self._search_executor,
+            self._query,
+            vector_store,
+            embeddings,
+            k,
+            filters,
+        )
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        stats["requests"] = {
+            "in_flight": self._in_flight,
+            "admitted": self._admitted,
+            "rejected": self._rejected,
+            "max_concurrent": self.max_concurrent_requests,
+        }
+        return stats
+
+
+def report_stats(servicer, interval: float, stop: threading.Event) -> None:
+    while not stop.wait(interval):
+        logger.info("stats %s", servicer.stats())
+
+
+def build_embedding_cache(config: RetrievalConfig) -> EmbeddingCache | None:
+    if config.embedding_cache_size <= 0:
+        return None
+    return EmbeddingCache(
+        max_size=config.embedding_cache_size,
+        ttl=config.embedding_cache_ttl,
+        persist_path=config.embedding_cache_path,
+    )
+
+
+def start_background_tasks(
+    config: RetrievalConfig,
+    servicer: VectorSearchServicer,
+    index_version: str | None,
+    commands: Connection | None = None,
+) -> Tuple[IndexReloader | None, threading.Event]:
+    """
+    Start hot index reload and periodic stats logging, as configured.
+    Returns the reloader and the event that stops the stats reporter.
+
+    Workers (with `commands` from the supervisor) reload when told to
+    instead of polling, and shut down if the supervisor goes away. With
+    remote shards there is nothing to reload here; each shard process
+    reloads its own index.
+    """
+    reloader = None
+    if config.faiss_shards:
+        pass
+    elif config.index_reload_interval > 0 or commands is not None:
+        reloader = IndexReloader(
+            config.index_path,
+            on_reload=servicer.swap_index,
+            poll_interval=config.index_reload_interval,
+            current_version=index_version,
+            mmap=config.faiss_mmap,
+            embedding_model=config.embedding_model,
+            verify_checksums=config.bundle_verify_checksums,
+        )
+
+    if commands is not None:
+        threading.Thread(
+            target=follow_supervisor,
+            args=(
+                commands,
+                lambda version: reloader.check_now(verified_version=version),
+                lambda: os.kill(os.getpid(), signal.SIGTERM),
+            ),
+            name="supervisor-link",
+            daemon=True,
+        ).start()
+    elif reloader is not None:
+        reloader.start()
+
+    stop_stats = threading.Event()
+    if config.stats_interval > 0:
+        threading.Thread(
+            target=report_stats,
+            args=(servicer, config.stats_interval, stop_stats),
+            name="stats-reporter",
+            daemon=True,
+        ).start()
+
+    return reloader, stop_stats
 
 
 def serve():
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO)
+
+    config = RetrievalConfig.from_env()
+
+    if config.worker_processes > 1:
+        Supervisor(config, run_worker).run()
+    elif config.server_mode == "aio":
+        asyncio.run(serve_aio(config))
+    else:
+        serve_threaded(config)
+
+
+def run_worker(
+    config: RetrievalConfig,
+    commands: Connection,
+    verified_version: str | None,
+    worker_id: int,
+):
+    """
+    Entry point of a worker process started by the Supervisor.
+    """
+    load_dotenv()
+    logging.basicConfig(
+        level=logging.INFO,
+        format=f"[worker {worker_id}] %(levelname)s:%(name)s:%(message)s",
+    )
+
+    if config.server_mode == "aio":
+        asyncio.run(serve_aio(config, commands, verified_version))
+    else:
+        serve_threaded(config, commands, verified_version)
+
+
+def serve_threaded(
+    config: RetrievalConfig,
+    commands: Connection | None = None,
+    verified_version: str | None = None,
+):
     server = grpc.server(
-        futures.ThreadPoolExecutor(max_workers=10)
+        futures.ThreadPoolExecutor(max_workers=config.max_workers),
+        options=SERVER_OPTIONS,
     )
 
+    cache = build_embedding_cache(config)
+
+    servicer = VectorSearchServicer(
+        QueryEmbedder(
+            client=OpenAI(api_key=config.openai_api_key),
+            model=config.embedding_model,
+            cache=cache,
+        ),
+        max_batch_queries=config.max_batch_queries,
+        stream_chunk_size=config.stream_chunk_size,
+        nprobe=config.faiss_nprobe,
+        ef_search=config.faiss_ef_search,
+        rerank_k=config.faiss_rerank_k,
+    )
+    if config.search_batch_max_wait_ms > 0:
+        servicer.enable_batching(
+            max_batch_size=config.search_batch_max_size,
+            max_wait=config.search_batch_max_wait_ms / 1000,
+        )
     vector_search_pb2_grpc.add_VectorSearchServiceServicer_to_server(
-        VectorSearchServicer(),
+        servicer,
         server,
     )
 
-    server.add_insecure_port("[::]:50051")
+    # Readiness: report NOT_SERVING until the index is resident so that
+    # health-checking clients don't route traffic to a cold replica.
+    health_servicer = health.HealthServicer()
+    health_pb2_grpc.add_HealthServicer_to_server(health_servicer, server)
+    for name in ("", SERVICE_NAME):
+        health_servicer.set(name, health_pb2.HealthCheckResponse.NOT_SERVING)
+
+    server.add_insecure_port(f"[::]:{config.port}")
     server.start()
-    print("VectorSearch gRPC server running on :50051")
+
+    index_version = None
+    if config.faiss_shards:
+        servicer.use_remote_shards(config.faiss_shards)
+    else:
+        index_version = FaissVectorStore.read_version(config.index_path)
+        servicer.load_index(
+            config.index_path,
+            mmap=config.faiss_mmap,
+            verify_checksums=config.bundle_verify_checksums
+            and index_version != verified_version,
+        )
+    for name in ("", SERVICE_NAME):
+        health_servicer.set(name, health_pb2.HealthCheckResponse.SERVING)
+    logger.info("VectorSearch gRPC server ready on :%d", config.port)
+
+    reloader, stop_stats = start_background_tasks(
+        config, servicer, index_version, commands
+    )
 
     # Graceful shutdown
-    signal.signal(signal.SIGTERM, lambda *_: server.stop(0))
-    signal.signal(signal.SIGINT, lambda *_: server.stop(0))
+    def shutdown(*_):
+        health_servicer.enter_graceful_shutdown()
+        stop_stats.set()
+        if reloader is not None:
+            reloader.stop()
+        server.stop(0)
+        if servicer.batcher is not None:
+            servicer.batcher.stop()
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
 
     server.wait_for_termination()
 
+    if cache is not None:
+        cache.close()
+
+
+async def serve_aio(
+    config: RetrievalConfig,
+    commands: Connection | None = None,
+    verified_version: str | None = None,
+):
+    """
+    Asyncio variant of `serve_threaded` (GRPC_SERVER_MODE=aio).
+    """
+    server = grpc.aio.server(options=SERVER_OPTIONS)
+
+    cache = build_embedding_cache(config)
+
+    servicer = AsyncVectorSearchServicer(
+        AsyncQueryEmbedder(
+            client=AsyncOpenAI(api_key=config.openai_api_key),
+            model=config.embedding_model,
+            cache=cache,
+        ),
+        max_concurrent_requests=config.max_concurrent_requests,
+        search_workers=config.search_workers,
+        max_batch_queries=config.max_batch_queries,
+        stream_chunk_size=config.stream_chunk_size,
+        nprobe=config.faiss_nprobe,
+        ef_search=config.faiss_ef_search,
+        rerank_k=config.faiss_rerank_k,
+    )
+    vector_search_pb2_grpc.add_VectorSearchServiceServicer_to_server(
+        servicer,
+        server,
+    )
+
+    health_servicer = health.aio.HealthServicer()
+    health_pb2_grpc.add_HealthServicer_to_server(health_servicer, server)
+    for name in ("", SERVICE_NAME):
+        await health_servicer.set(name, health_pb2.HealthCheckResponse.NOT_SERVING)
+
+    server.add_insecure_port(f"[::]:{config.port}")
+    await server.start()
+
+    # Load off the event loop so health checks are answered meanwhile.
+    index_version = None
+    if config.faiss_shards:
+        servicer.use_remote_shards(config.faiss_shards)
+    else:
+        index_version = FaissVectorStore.read_version(config.index_path)
+        await asyncio.to_thread(
+            servicer.load_index,
+            config.index_path,
+            mmap=config.faiss_mmap,
+            verify_checksums=config.bundle_verify_checksums
+            and index_version != verified_version,
+        )
+    for name in ("", SERVICE_NAME):
+        await health_servicer.set(name, health_pb2.HealthCheckResponse.SERVING)
+    logger.info("VectorSearch gRPC aio server ready on :%d", config.port)
+
+    reloader, stop_stats = start_background_tasks(
+        config, servicer, index_version, commands
+    )
+
+    # Graceful shutdown
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stopping.set)
+    await stopping.wait()
+
+    await health_servicer.enter_graceful_shutdown()
+    stop_stats.set()
+    if reloader is not None:
+        reloader.stop()
+    await server.stop(0)
+    servicer.close()
+
+    if cache is not None:
+        cache.close()
+
 
 if __name__ == "__main__":
     serve()
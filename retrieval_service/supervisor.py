@@ -0,0 +1,248 @@
+import dataclasses
+import logging
+import multiprocessing
+import signal
+import threading
+import time
+from multiprocessing.connection import Connection
+from typing import Callable, List
+
+from ingestion.bundle import read_manifest, verify_bundle
+from ingestion.VectorStores.faiss_vector_store import FaissVectorStore
+from .config import RetrievalConfig
+
+logger = logging.getLogger(__name__)
+
+# Worker entry point: (config, commands, verified_version, worker_id).
+WorkerTarget = Callable[[RetrievalConfig, Connection, str | None, int], None]
+
+
+@dataclasses.dataclass
+class WorkerSlot:
+    id: int
+    process: multiprocessing.Process | None = None
+    commands: Connection | None = None
+    started_at: float = 0.0
+    failures: int = 0
+    restart_at: float = 0.0
+
+
+class Supervisor:
+    """
+    Pre-fork mode: runs `config.worker_processes` server processes that
+    all bind `config.port` (SO_REUSEPORT, so the kernel spreads incoming
+    connections across them) and memory-map the same index files, so the
+    index is resident once in the page cache instead of once per worker.
+
+    The supervisor itself never loads the index. It verifies each bundle
+    version once, tells every worker to load that version, restarts
+    workers that die (with backoff if they keep crashing), and stops them
+    all on SIGTERM/SIGINT. SIGHUP forces an immediate reload check.
+    """
+
+    # A worker that dies sooner than this after starting counts as a crash
+    # loop and is restarted with exponential backoff.
+    MIN_UPTIME = 10.0
+    MAX_BACKOFF = 60.0
+    STOP_TIMEOUT = 10.0
+
+    def __init__(self, config: RetrievalConfig, target: WorkerTarget):
+        if not config.faiss_mmap:
+            logger.info("Worker processes always memory-map the index")
+
+        # Workers share the mapping and reload only when told to.
+        self.worker_config = dataclasses.replace(
+            config,
+            faiss_mmap=True,
+            index_reload_interval=0,
+        )
+        self.config = config
+        self.target = target
+
+        # spawn, not fork: gRPC and the OpenAI client must not be inherited
+        # across fork, and the index is shared through mmap anyway.
+        self._context = multiprocessing.get_context("spawn")
+        self._slots: List[WorkerSlot] = [
+            WorkerSlot(id=i) for i in range(config.worker_processes)
+        ]
+        self._version: str | None = None
+
+        self._stop = threading.Event()
+        self._reload_requested = threading.Event()
+
+    # ---------- Lifecycle ----------
+
+    def run(self) -> None:
+        # Workers fronting remote shards hold no index of their own.
+        if not self.config.faiss_shards:
+            self._version = self._verify_version()
+            if self._version is None:
+                raise RuntimeError(f"no published index at {self.config.index_path}")
+
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, lambda *_: self._stop.set())
+        signal.signal(signal.SIGHUP, lambda *_: self._reload_requested.set())
+
+        for slot in self._slots:
+            self._start(slot)
+        logger.info(
+            "Supervising %d retrieval workers on :%d (index version %s)",
+            len(self._slots),
+            self.config.port,
+            self._version,
+        )
+
+        next_reload_check = self._next_reload_check()
+        while not self._stop.wait(1.0):
+            self._restart_dead_workers()
+
+            if self._reload_requested.is_set() or time.monotonic() >= next_reload_check:
+                self._reload_requested.clear()
+                next_reload_check = self._next_reload_check()
+                try:
+                    self.check_reload()
+                except Exception:
+                    logger.exception("Index reload from %s failed", self.config.index_path)
+
+        self._stop_workers()
+
+    # ---------- Reload ----------
+
+    def check_reload(self) -> bool:
+        """
+        Verify a newly published index version once and tell every worker
+        to load it. Returns True if workers were told to reload.
+        """
+        if self.config.faiss_shards:
+            return False
+
+        version = FaissVectorStore.read_version(self.config.index_path)
+        if version is None or version == self._version:
+            return False
+
+        logger.info("Verifying index version %s", version)
+        if self._verify_version() != version:
+            logger.info("Index changed during verification, retrying later")
+            return False
+
+        self._version = version
+        for slot in self._slots:
+            self._send(slot, version)
+        logger.info("Workers told to load index version %s", version)
+        return True
+
+    # ---------- Helpers ----------
+
+    def _verify_version(self) -> str | None:
+        """
+        Check the bundle at index_path against its manifest and return
+        the version that was checked, or None if it changed meanwhile.
+        """
+        path = self.config.index_path
+        version = FaissVectorStore.read_version(path)
+
+        manifest = read_manifest(path)
+        if manifest is not None:
+            verify_bundle(
+                path,
+                manifest,
+                embedding_model=self.config.embedding_model,
+                checksums=self.config.bundle_verify_checksums,
+            )
+
+        if FaissVectorStore.read_version(path) != version:
+            return None
+        return version
+
+    def _next_reload_check(self) -> float:
+        if self.config.index_reload_interval <= 0:
+            return float("inf")
+        return time.monotonic() + self.config.index_reload_interval
+
+    def _start(self, slot: WorkerSlot) -> None:
+        receiver, sender = self._context.Pipe(duplex=False)
+        slot.process = self._context.Process(
+            target=self.target,
+            args=(self.worker_config, receiver, self._version, slot.id),
+            name=f"retrieval-worker-{slot.id}",
+        )
+        slot.process.start()
+        receiver.close()
+
+        slot.commands = sender
+        slot.started_at = time.monotonic()
+        logger.info("Started worker %d (pid %d)", slot.id, slot.process.pid)
+
+    def _restart_dead_workers(self) -> None:
+        now = time.monotonic()
+
+        for slot in self._slots:
+            if slot.process is not None and slot.process.is_alive():
+                continue
+
+            if slot.process is not None:
+                exitcode = slot.process.exitcode
+                slot.process = None
+                slot.commands.close()
+
+                if now - slot.started_at < self.MIN_UPTIME:
+                    slot.failures += 1
+                else:
+                    slot.failures = 0
+                delay = min(self.MAX_BACKOFF, 2 ** slot.failures - 1)
+                slot.restart_at = now + delay
+                logger.warning(
+                    "Worker %d exited with code %s; restarting in %.0fs",
+                    slot.id,
+                    exitcode,
+                    delay,
+                )
+
+            if now >= slot.restart_at:
+                self._start(slot)
+
+    def _send(self, slot: WorkerSlot, version: str) -> None:
+        # A worker that died since the last check gets the current version
+        # when it is restarted.
+        try:
+            slot.commands.send(version)
+        except OSError:
+            pass
+
+    def _stop_workers(self) -> None:
+        logger.info("Stopping %d retrieval workers", len(self._slots))
+        running = [slot.process for slot in self._slots if slot.process is not None]
+
+        for process in running:
+            process.terminate()
+
+        deadline = time.monotonic() + self.STOP_TIMEOUT
+        for process in running:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                logger.warning("Worker %s did not stop in time; killing it", process.name)
+                process.kill()
+                process.join()
+
+
+def follow_supervisor(
+    commands: Connection,
+    on_version: Callable[[str], None],
+    on_orphaned: Callable[[], None],
+) -> None:
+    """
+    Worker side of the supervisor link: call `on_version` for each index
+    version the supervisor has verified, and `on_orphaned` if the
+    supervisor goes away.
+    """
+    while True:
+        try:
+            version = commands.recv()
+        except (EOFError, OSError):
+            on_orphaned()
+            return
+
+        try:
+            on_version(version)
+        except Exception:
+            logger.exception("Loading index version %s failed", version)
@@ -0,0 +1,99 @@
+import threading
+
+import pytest
+
+from ingestion.embedders import FakeEmbedder
+from ingestion.VectorStores.faiss_vector_store import FaissVectorStore
+from retrieval_service.batcher import MicroBatcher
+from retrieval_service.server import VectorSearchServicer
+
+DIM = 8
+
+
+def submit_concurrently(submit, items):
+    """
+    Call `submit` for every item from its own thread, all at once, and
+    return the results (or exceptions) by item index.
+    """
+    results = [None] * len(items)
+    start = threading.Barrier(len(items))
+
+    def call(i):
+        start.wait()
+        try:
+            results[i] = submit(items[i])
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(len(items))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_results_are_routed_to_their_callers():
+    batcher = MicroBatcher(
+        lambda items: [item * 10 for item in items],
+        max_batch_size=8,
+        max_wait=0.2,
+    )
+    batcher.start()
+    try:
+        results = submit_concurrently(batcher.submit, list(range(16)))
+    finally:
+        batcher.stop()
+
+    assert results == [i * 10 for i in range(16)]
+    stats = batcher.stats()
+    assert stats["items"] == 16
+    assert stats["batches"] < 16
+    assert stats["max_batch_size"] <= 8
+
+
+def test_a_failing_batch_fails_its_callers():
+    def process(items):
+        raise RuntimeError("embeddings API down")
+
+    batcher = MicroBatcher(process, max_batch_size=4, max_wait=0.05)
+    batcher.start()
+    try:
+        results = submit_concurrently(batcher.submit, [1, 2, 3])
+    finally:
+        batcher.stop()
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_stopped_batcher_rejects_submissions():
+    batcher = MicroBatcher(lambda items: items, max_batch_size=4, max_wait=0.05)
+    batcher.start()
+    batcher.stop()
+
+    with pytest.raises(RuntimeError, match="stopped"):
+        batcher.submit(1)
+
+
+def test_coalesced_searches_keep_their_own_k():
+    embedder = FakeEmbedder(DIM)
+    embedder.model = "fake"
+    texts = [f"claim {i}" for i in range(20)]
+
+    store = FaissVectorStore(DIM)
+    store.upsert([f"{i:064x}" for i in range(20)], embedder.embed(texts))
+
+    servicer = VectorSearchServicer(embedder)
+    servicer.swap_index(store)
+    servicer.enable_batching(max_batch_size=8, max_wait=0.2)
+
+    requests = [(texts[i], 1 + i % 5) for i in range(8)]
+    try:
+        results = submit_concurrently(servicer.batcher.submit, requests)
+    finally:
+        servicer.batcher.stop()
+
+    for (query, k), (ids, scores) in zip(requests, results):
+        expected_ids, _ = store.query(embedder.embed([query])[0], k)
+        assert ids == expected_ids
+        assert len(scores) == k
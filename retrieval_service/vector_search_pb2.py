@@ -23,19 +23,35 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x13vector_search.proto\x12\x0cvectorsearch")\n\rSearchRequest\x12\r\n\x05query\x18\x01 \x01(\t\x12\t\n\x01k\x18\x02 \x01(\r"*\n\x0cSearchResult\x12\x0b\n\x03uid\x18\x01 \x01(\t\x12\r\n\x05score\x18\x02 \x01(\x02"=\n\x0eSearchResponse\x12+\n\x07results\x18\x01 \x03(\x0b\x32\x1a.vectorsearch.SearchResult2Z\n\x13VectorSearchService\x12\x43\n\x06Search\x12\x1b.vectorsearch.SearchRequest\x1a\x1c.vectorsearch.SearchResponseb\x06proto3')
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x13vector_search.proto\x12\x0cvectorsearch\"U\n\rSearchRequest\x12\r\n\x05query\x18\x01 \x01(\t\x12\t\n\x01k\x18\x02 \x01(\r\x12*\n\x06\x66ilter\x18\x03 \x01(\x0b\x32\x1a.vectorsearch.SearchFilter\"\x89\x01\n\x0cSearchFilter\x12\x10\n\x08verdicts\x18\x01 \x03(\t\x12\x14\n\x0c\x66\x61\x63tcheckers\x18\x02 \x03(\t\x12\x19\n\x11statement_sources\x18\x03 \x03(\t\x12\x1b\n\x13statement_date_from\x18\x04 \x01(\t\x12\x19\n\x11statement_date_to\x18\x05 \x01(\t\"*\n\x0cSearchResult\x12\x0b\n\x03uid\x18\x01 \x01(\t\x12\r\n\x05score\x18\x02 \x01(\x02\"=\n\x0eSearchResponse\x12+\n\x07results\x18\x01 \x03(\x0b\x32\x1a.vectorsearch.SearchResult\"\\\n\x12\x42\x61tchSearchRequest\x12\x0f\n\x07queries\x18\x01 \x03(\t\x12\t\n\x01k\x18\x02 \x01(\r\x12*\n\x06\x66ilter\x18\x03 \x01(\x0b\x32\x1a.vectorsearch.SearchFilter\"F\n\x13\x42\x61tchSearchResponse\x12/\n\tresponses\x18\x01 \x03(\x0b\x32\x1c.vectorsearch.SearchResponse\"U\n\x11\x42\x61tchSearchResult\x12\x13\n\x0bquery_index\x18\x01 \x01(\r\x12+\n\x07results\x18\x02 \x03(\x0b\x32\x1a.vectorsearch.SearchResult\"S\n\x13VectorSearchRequest\x12\x0f\n\x07vectors\x18\x01 \x03(\x02\x12\x0b\n\x03\x64im\x18\x02 \x01(\r\x12\t\n\x01k\x18\x03 \x01(\r\x12\x13\n\x0b\x66ilter_json\x18\x04 \x01(\t\"\x12\n\x10IndexInfoRequest\"/\n\x11IndexInfoResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x04\x12\x0b\n\x03\x64im\x18\x02 \x01(\r2\xad\x03\n\x13VectorSearchService\x12\x43\n\x06Search\x12\x1b.vectorsearch.SearchRequest\x1a\x1c.vectorsearch.SearchResponse\x12R\n\x0b\x42\x61tchSearch\x12 .vectorsearch.BatchSearchRequest\x1a!.vectorsearch.BatchSearchResponse\x12X\n\x11\x42\x61tchSearchStream\x12 .vectorsearch.BatchSearchRequest\x1a\x1f.vectorsearch.BatchSearchResult0\x01\x12U\n\rSearchVectors\x12!.vectorsearch.VectorSearchRequest\x1a!.vectorsearch.BatchSearchResponse\x12L\n\tIndexInfo\x12\x1e.vectorsearch.IndexInfoRequest\x1a\x1f.vectorsearch.IndexInfoResponseBEZCgithub.com/daniel13112001/api-gateway/gen/vectorsearch;vectorsearchb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'vector_search_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
-  DESCRIPTOR._loaded_options = None
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'ZCgithub.com/daniel13112001/api-gateway/gen/vectorsearch;vectorsearch'
   _globals['_SEARCHREQUEST']._serialized_start=37
-  _globals['_SEARCHREQUEST']._serialized_end=78
-  _globals['_SEARCHRESULT']._serialized_start=80
-  _globals['_SEARCHRESULT']._serialized_end=122
-  _globals['_SEARCHRESPONSE']._serialized_start=124
-  _globals['_SEARCHRESPONSE']._serialized_end=185
-  _globals['_VECTORSEARCHSERVICE']._serialized_start=187
-  _globals['_VECTORSEARCHSERVICE']._serialized_end=277
+  _globals['_SEARCHREQUEST']._serialized_end=122
+  _globals['_SEARCHFILTER']._serialized_start=125
+  _globals['_SEARCHFILTER']._serialized_end=262
+  _globals['_SEARCHRESULT']._serialized_start=264
+  _globals['_SEARCHRESULT']._serialized_end=306
+  _globals['_SEARCHRESPONSE']._serialized_start=308
+  _globals['_SEARCHRESPONSE']._serialized_end=369
+  _globals['_BATCHSEARCHREQUEST']._serialized_start=371
+  _globals['_BATCHSEARCHREQUEST']._serialized_end=463
+  _globals['_BATCHSEARCHRESPONSE']._serialized_start=465
+  _globals['_BATCHSEARCHRESPONSE']._serialized_end=535
+  _globals['_BATCHSEARCHRESULT']._serialized_start=537
+  _globals['_BATCHSEARCHRESULT']._serialized_end=622
+  _globals['_VECTORSEARCHREQUEST']._serialized_start=624
+  _globals['_VECTORSEARCHREQUEST']._serialized_end=707
+  _globals['_INDEXINFOREQUEST']._serialized_start=709
+  _globals['_INDEXINFOREQUEST']._serialized_end=727
+  _globals['_INDEXINFORESPONSE']._serialized_start=729
+  _globals['_INDEXINFORESPONSE']._serialized_end=776
+  _globals['_VECTORSEARCHSERVICE']._serialized_start=779
+  _globals['_VECTORSEARCHSERVICE']._serialized_end=1208
 # @@protoc_insertion_point(module_scope)
@@ -39,6 +39,26 @@ class VectorSearchServiceStub(object):
                 request_serializer=vector__search__pb2.SearchRequest.SerializeToString,
                 response_deserializer=vector__search__pb2.SearchResponse.FromString,
                 _registered_method=True)
+        self.BatchSearch = channel.unary_unary(
+                '/vectorsearch.VectorSearchService/BatchSearch',
+                request_serializer=vector__search__pb2.BatchSearchRequest.SerializeToString,
+                response_deserializer=vector__search__pb2.BatchSearchResponse.FromString,
+                _registered_method=True)
+        self.BatchSearchStream = channel.unary_stream(
+                '/vectorsearch.VectorSearchService/BatchSearchStream',
+                request_serializer=vector__search__pb2.BatchSearchRequest.SerializeToString,
+                response_deserializer=vector__search__pb2.BatchSearchResult.FromString,
+                _registered_method=True)
+        self.SearchVectors = channel.unary_unary(
+                '/vectorsearch.VectorSearchService/SearchVectors',
+                request_serializer=vector__search__pb2.VectorSearchRequest.SerializeToString,
+                response_deserializer=vector__search__pb2.BatchSearchResponse.FromString,
+                _registered_method=True)
+        self.IndexInfo = channel.unary_unary(
+                '/vectorsearch.VectorSearchService/IndexInfo',
+                request_serializer=vector__search__pb2.IndexInfoRequest.SerializeToString,
+                response_deserializer=vector__search__pb2.IndexInfoResponse.FromString,
+                _registered_method=True)
 
 
 class VectorSearchServiceServicer(object):
@@ -50,6 +70,35 @@ class VectorSearchServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def BatchSearch(self, request, context):
+        """Embeds all queries in one request and searches them as one matrix.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BatchSearchStream(self, request, context):
+        """Same as BatchSearch, but streams results back chunk by chunk.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SearchVectors(self, request, context):
+        """Searches pre-computed query vectors. Used between a sharded front
+        end and the retrieval processes serving its shards.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def IndexInfo(self, request, context):
+        """Size and dimension of the index being served.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_VectorSearchServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -58,6 +107,26 @@ def add_VectorSearchServiceServicer_to_server(servicer, server):
                     request_deserializer=vector__search__pb2.SearchRequest.FromString,
                     response_serializer=vector__search__pb2.SearchResponse.SerializeToString,
             ),
+            'BatchSearch': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchSearch,
+                    request_deserializer=vector__search__pb2.BatchSearchRequest.FromString,
+                    response_serializer=vector__search__pb2.BatchSearchResponse.SerializeToString,
+            ),
+            'BatchSearchStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.BatchSearchStream,
+                    request_deserializer=vector__search__pb2.BatchSearchRequest.FromString,
+                    response_serializer=vector__search__pb2.BatchSearchResult.SerializeToString,
+            ),
+            'SearchVectors': grpc.unary_unary_rpc_method_handler(
+                    servicer.SearchVectors,
+                    request_deserializer=vector__search__pb2.VectorSearchRequest.FromString,
+                    response_serializer=vector__search__pb2.BatchSearchResponse.SerializeToString,
+            ),
+            'IndexInfo': grpc.unary_unary_rpc_method_handler(
+                    servicer.IndexInfo,
+                    request_deserializer=vector__search__pb2.IndexInfoRequest.FromString,
+                    response_serializer=vector__search__pb2.IndexInfoResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'vectorsearch.VectorSearchService', rpc_method_handlers)
@@ -95,3 +164,111 @@ class VectorSearchService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def BatchSearch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/vectorsearch.VectorSearchService/BatchSearch',
+            vector__search__pb2.BatchSearchRequest.SerializeToString,
+            vector__search__pb2.BatchSearchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def BatchSearchStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/vectorsearch.VectorSearchService/BatchSearchStream',
+            vector__search__pb2.BatchSearchRequest.SerializeToString,
+            vector__search__pb2.BatchSearchResult.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SearchVectors(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/vectorsearch.VectorSearchService/SearchVectors',
+            vector__search__pb2.VectorSearchRequest.SerializeToString,
+            vector__search__pb2.BatchSearchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def IndexInfo(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/vectorsearch.VectorSearchService/IndexInfo',
+            vector__search__pb2.IndexInfoRequest.SerializeToString,
+            vector__search__pb2.IndexInfoResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)